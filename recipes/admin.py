@@ -4,7 +4,8 @@ from django.urls import reverse
 from recipes.models.user import User
 from recipes.models.recipe_post import RecipePost
 from recipes.models.comment import Comment
-from recipes.models.report import Report 
+from recipes.models.report import Report
+from recipes.services.comments import CommentService
 
 
 class ActiveReportCountMixin:
@@ -71,12 +72,16 @@ class CommentAdmin(ActiveReportCountMixin, admin.ModelAdmin):
     @admin.action(description='Hide selected comments')
     def hide_content(self, request, queryset):
         """Mark selected comments as hidden."""
+        post_ids = set(queryset.values_list("recipe_post_id", flat=True))
         queryset.update(is_hidden=True)
+        CommentService().refresh_counts(post_ids)
 
     @admin.action(description='Approve/Unhide comments')
     def approve_content(self, request, queryset):
         """Unhide selected comments."""
+        post_ids = set(queryset.values_list("recipe_post_id", flat=True))
         queryset.update(is_hidden=False)
+        CommentService().refresh_counts(post_ids)
 
 
 @admin.register(Report)
@@ -1,6 +1,6 @@
 """Utility helpers to wrap common queryset CRUD patterns."""
 
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Type
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Type
 from django.db.models import Model, QuerySet
 
 
@@ -19,8 +19,8 @@ class DB_Accessor:
         limit: Optional[int] = None,
         offset: int = 0,
         as_dict: bool = False,
-    ) -> QuerySet | List[Dict[str, Any]]:
-        """Return a filtered/sliced queryset (or list of dicts)."""
+    ) -> "QuerySet | LazyPage | List[Dict[str, Any]]":
+        """Return a filtered queryset, a LazyPage when sliced, or a list of dicts."""
         qs: QuerySet = self.model.objects.filter(**(filters or {}))
         qs = self._apply_ordering(qs, order_by)
         qs = self._apply_slice(qs, offset=offset, limit=limit)
@@ -32,20 +32,50 @@ class DB_Accessor:
 
     def _apply_slice(
         self, qs: QuerySet, *, offset: int = 0, limit: Optional[int] = None
-    ) -> QuerySet:
-        """Return a sliced queryset that preserves the original ordering."""
+    ) -> "QuerySet | LazyPage":
+        """Return qs unchanged when unsliced, otherwise a LazyPage over it."""
         if not (offset or limit is not None):
             return qs
-        start = max(0, int(offset))
-        end = None if limit is None else start + max(0, int(limit))
-        objects = list(qs[start:end])
-        model_cls = getattr(self, "model", None) or self.model
-        if not objects:
-            return model_cls.objects.none()
-        ids = [obj.pk for obj in objects]
-        qs = model_cls.objects.filter(pk__in=ids).order_by()
-        qs._result_cache = objects  # preserve original slice ordering
-        return qs
+        return LazyPage(qs, offset=offset, limit=limit)
+
+    def page(self, qs: QuerySet, *, offset: int = 0, limit: Optional[int] = None) -> "LazyPage":
+        """Wrap qs in a LazyPage; has_more comes from fetching one extra row, not a COUNT."""
+        return LazyPage(qs, offset=offset, limit=limit)
+
+    def iter_batches(
+        self,
+        size: int = 1000,
+        *,
+        fields: Sequence[str] = ("pk",),
+        filters: Optional[Mapping[str, Any]] = None,
+        queryset: Optional[QuerySet] = None,
+    ) -> Iterator[List[Any]]:
+        """Yield lists of up to size rows in primary-key order, for jobs that walk a whole table.
+
+        Each batch is one values_list query bounded by the last primary key
+        seen (a keyset range, not OFFSET), so memory stays flat and later
+        batches cost the same as the first. One field yields bare values,
+        several yield tuples. Pass queryset to stream an annotated query.
+        """
+        qs = queryset if queryset is not None else self.model.objects.filter(**(filters or {}))
+        qs = qs.order_by("pk")
+        fields = tuple(fields)
+        pk_index = next((i for i, name in enumerate(fields) if name in ("pk", self.model._meta.pk.name)), None)
+        columns = fields if pk_index is not None else ("pk", *fields)
+        pk_index = 0 if pk_index is None else pk_index
+        size = max(1, int(size))
+        last_pk = None
+        while True:
+            window = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            rows = list(window.values_list(*columns)[:size])
+            if not rows:
+                return
+            last_pk = rows[-1][pk_index]
+            if columns is not fields:
+                rows = [row[1:] for row in rows]
+            yield [row[0] for row in rows] if len(fields) == 1 else rows
+            if len(rows) < size:
+                return
 
     def get(self, **lookup: Any) -> Model:
         """Fetch a single object matching the lookup."""
@@ -63,3 +93,111 @@ class DB_Accessor:
         """Delete objects matching lookup; return count deleted."""
         count, _ = self.model.objects.filter(**lookup).delete()
         return count
+
+
+class LazyPage:
+    """One window of a queryset, fetched with a single query on first use.
+
+    Until it is read the page stays composable: filter(), exclude() and the
+    other queryset methods below return a new page over the refined queryset,
+    so repos and services can layer filters and privacy rules on a sliced
+    result without re-querying. One row beyond limit is fetched so has_more
+    needs no COUNT.
+    """
+
+    def __init__(self, queryset: QuerySet, *, offset: int = 0, limit: Optional[int] = None) -> None:
+        """Remember the unsliced queryset and the window to read from it."""
+        self.queryset = queryset
+        self.offset = max(0, int(offset))
+        self.limit = None if limit is None else max(0, int(limit))
+        self._items: Optional[List[Model]] = None
+        self._has_more = False
+
+    def _derive(self, queryset: QuerySet) -> "LazyPage":
+        return LazyPage(queryset, offset=self.offset, limit=self.limit)
+
+    def _window(self, queryset: QuerySet, extra: int = 0) -> QuerySet:
+        end = None if self.limit is None else self.offset + self.limit + extra
+        return queryset[self.offset:end]
+
+    def _fetch(self) -> List[Model]:
+        if self._items is None:
+            rows = list(self._window(self.queryset, extra=1))
+            self._has_more = self.limit is not None and len(rows) > self.limit
+            self._items = rows[: self.limit] if self.limit is not None else rows
+        return self._items
+
+    @property
+    def items(self) -> List[Model]:
+        """Objects in this page, fetched on first access."""
+        return self._fetch()
+
+    @property
+    def has_more(self) -> bool:
+        """True when at least one row follows this page."""
+        self._fetch()
+        return self._has_more
+
+    def filter(self, *args: Any, **kwargs: Any) -> "LazyPage":
+        """Return a page over the queryset narrowed by filter()."""
+        return self._derive(self.queryset.filter(*args, **kwargs))
+
+    def exclude(self, *args: Any, **kwargs: Any) -> "LazyPage":
+        """Return a page over the queryset narrowed by exclude()."""
+        return self._derive(self.queryset.exclude(*args, **kwargs))
+
+    def distinct(self, *fields: str) -> "LazyPage":
+        """Return a page over the distinct queryset."""
+        return self._derive(self.queryset.distinct(*fields))
+
+    def order_by(self, *fields: str) -> "LazyPage":
+        """Return a page over the reordered queryset."""
+        return self._derive(self.queryset.order_by(*fields))
+
+    def select_related(self, *fields: str) -> "LazyPage":
+        """Return a page that joins the given relations."""
+        return self._derive(self.queryset.select_related(*fields))
+
+    def prefetch_related(self, *lookups: Any) -> "LazyPage":
+        """Return a page that prefetches the given relations."""
+        return self._derive(self.queryset.prefetch_related(*lookups))
+
+    def only(self, *fields: str) -> "LazyPage":
+        """Return a page that loads only the given fields."""
+        return self._derive(self.queryset.only(*fields))
+
+    def none(self) -> "LazyPage":
+        """Return an empty page."""
+        return self._derive(self.queryset.none())
+
+    def values(self, *fields: str) -> List[Dict[str, Any]]:
+        """Return this window as dicts with one query."""
+        return list(self._window(self.queryset.values(*fields)))
+
+    def count(self) -> int:
+        """Number of objects in this page (no COUNT query)."""
+        return len(self._fetch())
+
+    def exists(self) -> bool:
+        """True when the page has at least one object."""
+        return bool(self._fetch())
+
+    def first(self) -> Optional[Model]:
+        """First object in the page, or None."""
+        items = self._fetch()
+        return items[0] if items else None
+
+    def __iter__(self):
+        return iter(self._fetch())
+
+    def __len__(self) -> int:
+        return len(self._fetch())
+
+    def __bool__(self) -> bool:
+        return bool(self._fetch())
+
+    def __getitem__(self, index):
+        return self._fetch()[index]
+
+    def __repr__(self) -> str:
+        return f"<LazyPage offset={self.offset} limit={self.limit} queryset={self.queryset.query}>"
@@ -1,6 +1,11 @@
 from django import forms
+from django.db import transaction
+from django.db.models import F
 
-from recipes.models import Ingredient
+from recipes.models import Ingredient, RecipePost
+from recipes.services.ingredient_terms import IngredientTermService
+from recipes.services.shop_catalogue import ShopCatalogueService
+from recipes.services.shop_products import ShopProductService
 
 MAX_SHOPPING_LINKS = 10
 
@@ -88,6 +93,14 @@ class ShoppingFieldHelpers:
                 ),
             )
 
+    def _resolve_ingredient_terms(self, names):
+        """Resolve canonical dictionary terms for all ingredient names in one batch."""
+        self._ingredient_terms = IngredientTermService().resolve(names)
+
+    def _term_for(self, name: str):
+        """Return the pre-resolved term for a name (Ingredient.save resolves any misses)."""
+        return getattr(self, "_ingredient_terms", {}).get(name.strip().lower())
+
     def _existing_shop_images_for(self, recipe):
         """Get list of existing shopping ingredients with images for the recipe."""
         return list(
@@ -107,8 +120,39 @@ class ShoppingFieldHelpers:
             return existing_shop_images.pop(0).shop_image_upload
         return None
 
-    def _add_standard_ingredients(self, recipe, lines, seen_names, start_position: int):
-        """Create standard (non-shopping) ingredients from lines.
+    def _new_ingredient(self, recipe, name, position, shop_url=None, shop_image_upload=None):
+        """Build an unsaved ingredient the way Ingredient.save would store it."""
+        return Ingredient(
+            recipe_post=recipe,
+            name=name.strip().lower(),
+            term=self._term_for(name),
+            shop_url=shop_url,
+            shop_image_upload=shop_image_upload,
+            position=position,
+        )
+
+    def _save_ingredients(self, recipe, rows):
+        """Insert a post's ingredients in one statement and queue their shop upkeep as one batch.
+
+        bulk_create skips the per-row Ingredient signals (those stay for one-off
+        edits), so the count is bumped here and products and shop rows are
+        rebuilt once the save commits, keeping image hashing out of the transaction.
+        """
+        created = Ingredient.objects.bulk_create(rows)
+        if not created:
+            return created
+        RecipePost.objects.filter(pk=recipe.pk).update(ingredient_count=F("ingredient_count") + len(created))
+        ingredient_ids = [row.pk for row in created]
+
+        def sync_shop():
+            ShopProductService().attach_many(ingredient_ids)
+            ShopCatalogueService().sync_ingredients(ingredient_ids)
+
+        transaction.on_commit(sync_shop)
+        return created
+
+    def _add_standard_ingredients(self, recipe, lines, seen_names, start_position: int, rows):
+        """Queue standard (non-shopping) ingredients from lines onto rows.
         
         Returns the last position used.
         """
@@ -122,13 +166,7 @@ class ShoppingFieldHelpers:
                 continue
             seen_names.add(key)
             position += 1
-            Ingredient.objects.create(
-                recipe_post=recipe,
-                name=name,
-                shop_url=None,
-                shop_image_upload=None,
-                position=position,
-            )
+            rows.append(self._new_ingredient(recipe, name, position))
         return position
 
     def _iter_unique_shopping_items(self, shopping_links, seen_names):
@@ -151,19 +189,15 @@ class ShoppingFieldHelpers:
         existing_shop_images,
         seen_names,
         start_position: int,
+        rows,
     ):
-        """Create shopping ingredients with images from parsed links.
+        """Queue shopping ingredients with images from parsed links onto rows.
         
         Returns the last position used.
         """
         position = start_position
         for name, url in self._iter_unique_shopping_items(shopping_links, seen_names):
             position += 1
-            Ingredient.objects.create(
-                recipe_post=recipe,
-                name=name,
-                shop_url=url,
-                shop_image_upload=self._next_shop_image(shop_images, existing_shop_images),
-                position=position,
-            )
+            image = self._next_shop_image(shop_images, existing_shop_images)
+            rows.append(self._new_ingredient(recipe, name, position, shop_url=url, shop_image_upload=image))
         return position
@@ -1,9 +1,8 @@
-import mimetypes
-
 from django import forms
 
 from .fields import MultiFileField, MultiFileInput
 from .recipe_form_mixins import MAX_SHOPPING_LINKS, ShoppingFieldHelpers
+from recipes.services.recipe_images import RecipeImageService, is_valid_image
 
 try:
     from recipes.models import RecipePost, Ingredient, RecipeStep, RecipeImage
@@ -115,8 +114,8 @@ class RecipePostForm(ShoppingFieldHelpers, forms.ModelForm):
         files = self.files.getlist("images")
         if len(files) > 10:
             raise forms.ValidationError("You can upload up to 10 images.")
-        self._validate_image_types(files, "images")
         self._validate_file_sizes(files, "image")
+        self._validate_image_types(files, "images")
 
         has_existing_image = False
         if getattr(self.instance, "pk", None) and not getattr(getattr(self.instance, "_state", None), "adding", True):
@@ -135,8 +134,8 @@ class RecipePostForm(ShoppingFieldHelpers, forms.ModelForm):
         files = self.files.getlist("shop_images")
         if len(files) > 10:
             raise forms.ValidationError("You can upload up to 10 shopping images.")
-        self._validate_image_types(files, "shopping images")
         self._validate_file_sizes(files, "shopping image")
+        self._validate_image_types(files, "shopping images")
         return files
 
     def clean(self):
@@ -167,21 +166,28 @@ class RecipePostForm(ShoppingFieldHelpers, forms.ModelForm):
         """Create Ingredient rows from ingredient/shopping link inputs."""
         existing_shop_images = self._existing_shop_images_for(recipe)
         Ingredient.objects.filter(recipe_post=recipe).delete()
+        ingredient_lines = self._split_lines("ingredients_text")
+        shopping_links = self._parse_shopping_links()
+        self._resolve_ingredient_terms(ingredient_lines + [item["name"] for item in shopping_links])
         seen_names = set()
+        rows = []
         position = self._add_standard_ingredients(
             recipe,
-            self._split_lines("ingredients_text"),
+            ingredient_lines,
             seen_names,
             start_position=0,
+            rows=rows,
         )
         self._add_shopping_ingredients(
             recipe,
-            self._parse_shopping_links(),
+            shopping_links,
             list(self.cleaned_data.get("shop_images") or []),
             existing_shop_images,
             seen_names,
             start_position=position,
+            rows=rows,
         )
+        self._save_ingredients(recipe, rows)
 
     def __init__(self, *args, **kwargs):
         """Populate initial fields when editing an existing recipe."""
@@ -249,7 +255,7 @@ class RecipePostForm(ShoppingFieldHelpers, forms.ModelForm):
             )
 
     def create_images(self, recipe):
-        """Create RecipeImage rows and set legacy cover image when needed."""
+        """Stream uploads to storage as RecipeImage rows and queue derivative processing."""
         files = self.files.getlist("images")
         if not files:
             return
@@ -262,6 +268,7 @@ class RecipePostForm(ShoppingFieldHelpers, forms.ModelForm):
                 image=f,
                 position=idx,
             )
+        RecipeImageService().mark_pending(recipe)
 
     def _validate_file_sizes(self, files, label):
         """Raise validation error when any file exceeds the configured limit."""
@@ -274,15 +281,8 @@ class RecipePostForm(ShoppingFieldHelpers, forms.ModelForm):
         )
 
     def _validate_image_types(self, files, label):
-        """Ensure uploads are image types based on content type or file extension."""
-        def is_image(file_obj):
-            content_type = (getattr(file_obj, "content_type", "") or "").lower()
-            if content_type.startswith("image/"):
-                return True
-            guessed, _ = mimetypes.guess_type(getattr(file_obj, "name", ""))
-            return bool(guessed and guessed.startswith("image/"))
-
-        invalid = [f.name for f in files if not is_image(f)]
+        """Ensure uploads are real images by magic bytes and Pillow's header verify()."""
+        invalid = [f.name for f in files if not is_valid_image(f)]
         if invalid:
             joined = ", ".join(invalid)
             raise forms.ValidationError(
@@ -0,0 +1,24 @@
+"""Management command to attach canonical IngredientTerm rows to existing ingredients."""
+
+from django.core.management.base import BaseCommand
+
+from recipes.services.ingredient_terms import IngredientTermService
+
+
+class Command(BaseCommand):
+    """Normalise ingredient names in bulk and link them to dictionary terms."""
+
+    help = "Backfill Ingredient.term from normalised ingredient names."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-resolve every ingredient, not only rows without a term (e.g. after alias changes)",
+        )
+
+    def handle(self, *args, **options):
+        """Run the backfill and report how many rows were linked."""
+        updated = IngredientTermService().backfill(only_missing=not options["all"])
+        self.stdout.write(self.style.SUCCESS(f"Linked {updated} ingredients to dictionary terms."))
@@ -0,0 +1,59 @@
+"""Management command to compare JSON and msgpack payloads for recipe API pages."""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from recipes.models import RecipePost, User
+from recipes.renderers import MsgPackRenderer
+from recipes.serializers import RecipeSerializer
+
+
+class Command(BaseCommand):
+    """Seed throwaway posts, render one page both ways and report size and encode time."""
+
+    help = "Compare JSON and msgpack size and encode time for a recipe page; seeded rows are rolled back."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the benchmark."""
+        parser.add_argument("--items", type=int, default=1000, help="Recipes per page (defaults to 1000).")
+        parser.add_argument("--repeat", type=int, default=20, help="Encodes timed per format (defaults to 20).")
+
+    def handle(self, *args, **options):
+        """Seed inside a transaction, time both renderers, then roll everything back."""
+        with transaction.atomic():
+            posts = self._seed(options["items"])
+            page = {"next": None, "previous": None, "results": RecipeSerializer(posts, many=True).data}
+            native = {
+                **page,
+                "results": RecipeSerializer(posts, many=True, context={"native_datetimes": True}).data,
+            }
+            self._time("json", JSONRenderer(), page, options["repeat"])
+            self._time("msgpack", MsgPackRenderer(), native, options["repeat"])
+            transaction.set_rollback(True)
+
+    def _seed(self, items):
+        author = User.objects.create_user(username="@format_bench", email="format-bench@example.org", password="x")
+        RecipePost.objects.bulk_create(
+            [
+                RecipePost(
+                    author=author,
+                    title=f"Benchmark recipe {i}",
+                    description="Benchmark description " * 5,
+                    category="benchmark",
+                    tags=["quick", "vegan"],
+                )
+                for i in range(items)
+            ],
+            batch_size=1000,
+        )
+        return list(RecipePost.objects.filter(author=author).prefetch_related("images"))
+
+    def _time(self, label, renderer, data, repeat):
+        started = perf_counter()
+        for _ in range(repeat):
+            body = renderer.render(data)
+        elapsed = (perf_counter() - started) * 1000 / repeat
+        self.stdout.write(f"{label}: {len(body)} bytes, {elapsed:.2f} ms per encode")
@@ -0,0 +1,82 @@
+"""Management command to time cursor pages of the recipe list API against a large table."""
+
+from time import perf_counter
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from recipes.models import Follower, RecipePost, User
+from recipes.views.api_views import RecipeListApi
+
+BENCH_USERNAME = "@api_bench_viewer"
+BENCH_AUTHOR = "@api_bench_author"
+
+
+class Command(BaseCommand):
+    """Seed throwaway posts, walk the API a page at a time and report time and queries per page."""
+
+    help = "Benchmark /api/recipes/ pages over a seeded table; all seeded rows are rolled back."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the benchmark."""
+        parser.add_argument("--rows", type=int, default=10000, help="Posts to seed (defaults to 10000).")
+        parser.add_argument("--page-size", type=int, default=100, help="Rows per API page (defaults to 100).")
+        parser.add_argument("--pages", type=int, default=5, help="Pages to walk per run (defaults to 5).")
+        parser.add_argument(
+            "--fields",
+            default="id,title,created_at",
+            help="Field list for the lean run (defaults to id,title,created_at).",
+        )
+
+    def handle(self, *args, **options):
+        """Seed inside a transaction, time the full and lean payloads, then roll everything back."""
+        with transaction.atomic():
+            viewer = self._seed(options["rows"])
+            self._run("full", viewer, options["page_size"], options["pages"], None)
+            self._run("lean", viewer, options["page_size"], options["pages"], options["fields"])
+            transaction.set_rollback(True)
+
+    def _seed(self, rows):
+        viewer = User.objects.create_user(username=BENCH_USERNAME, email="bench-viewer@example.org", password="x")
+        author = User.objects.create_user(username=BENCH_AUTHOR, email="bench-author@example.org", password="x")
+        Follower.objects.create(follower=viewer, author=author)
+        visibilities = [RecipePost.VISIBILITY_PUBLIC, RecipePost.VISIBILITY_FOLLOWERS, RecipePost.VISIBILITY_CLOSE_FRIENDS]
+        RecipePost.objects.bulk_create(
+            [
+                RecipePost(
+                    author=author,
+                    title=f"Benchmark recipe {i}",
+                    description="Benchmark description " * 20,
+                    category="benchmark",
+                    visibility=visibilities[i % len(visibilities)],
+                )
+                for i in range(rows)
+            ],
+            batch_size=1000,
+        )
+        self.stdout.write(f"Seeded {rows} posts.")
+        return viewer
+
+    def _run(self, label, viewer, page_size, pages, fields):
+        factory = APIRequestFactory()
+        view = RecipeListApi.as_view()
+        params = {"page_size": page_size, **({"fields": fields} if fields else {})}
+        for number in range(1, pages + 1):
+            request = factory.get("/api/recipes/", params, HTTP_HOST="localhost")
+            force_authenticate(request, user=viewer)
+            with CaptureQueriesContext(connection) as queries:
+                started = perf_counter()
+                response = view(request)
+                response.render()
+                elapsed = (perf_counter() - started) * 1000
+            self.stdout.write(
+                f"{label} page {number}: {len(response.data['results'])} rows, "
+                f"{len(queries)} queries, {elapsed:.1f} ms, {len(response.content)} bytes"
+            )
+            next_url = response.data.get("next")
+            if not next_url:
+                break
+            params = {key: values[0] for key, values in parse_qs(urlparse(next_url).query).items()}
@@ -0,0 +1,33 @@
+"""Management command that builds display derivatives for posts with pending uploads."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from recipes.services.recipe_images import PROCESS_BATCH_SIZE, RecipeImageService
+
+
+class Command(BaseCommand):
+    """Background worker for recipe image processing."""
+
+    help = "Generate display images for recipe posts whose uploads are still pending."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument("--limit", type=int, default=PROCESS_BATCH_SIZE, help="Posts to process per batch")
+        parser.add_argument("--loop", action="store_true", help="Keep polling for new uploads")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when idle in --loop mode")
+
+    def handle(self, *args, **options):
+        """Process pending posts once, or continuously with --loop."""
+        service = RecipeImageService()
+        limit = max(1, options["limit"])
+        while True:
+            processed = service.process_pending(limit)
+            if processed:
+                self.stdout.write(f"Processed images for {processed} post(s).")
+            if not options["loop"]:
+                break
+            if processed < limit:
+                time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS("Image processing complete."))
@@ -0,0 +1,29 @@
+"""Management command to trim the delta sync change log."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recipes.services.recipe_sync import RecipeSyncService
+
+
+class Command(BaseCommand):
+    """Delete old recipe_change rows; clients holding older tokens are told to refetch."""
+
+    help = "Delete recipe_change rows older than --days (defaults to 30)."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Keep changes from the last N days (defaults to 30).",
+        )
+
+    def handle(self, *args, **options):
+        """Prune the change log and report how many rows were removed."""
+        before = timezone.now() - timedelta(days=options["days"])
+        deleted = RecipeSyncService().prune(before)
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} recipe change(s)."))
@@ -0,0 +1,24 @@
+"""Management command to rebuild the shop_item read model."""
+
+from django.core.management.base import BaseCommand
+
+from recipes.services.shop_catalogue import ShopCatalogueService
+from recipes.services.shop_products import ShopProductService
+
+
+class Command(BaseCommand):
+    """Re-link shop products, recompute every shop_item row and remove orphaned shop uploads."""
+
+    help = "Rebuild the shop_product and shop_item tables used by the shop page and shopping search."
+
+    def handle(self, *args, **options):
+        """Rebuild products and the catalogue, delete unreferenced uploads and report the counts."""
+        product_service = ShopProductService()
+        products = product_service.rebuild()
+        written = ShopCatalogueService().sync_ingredients()
+        removed = product_service.delete_orphaned_uploads()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {products} shop products and {written} shop items; removed {removed} orphaned uploads."
+            )
+        )
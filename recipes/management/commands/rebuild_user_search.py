@@ -0,0 +1,25 @@
+"""Management command to rebuild the user search index."""
+
+from django.core.management.base import BaseCommand
+
+from recipes.management.commands.seed_helpers import get_user_or_error
+from recipes.services.user_search import UserSearchService
+
+
+class Command(BaseCommand):
+    """Recompute the word and trigram terms used by user search."""
+
+    help = "Rebuild the user_search_term table used by user search and navbar autocomplete."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument(
+            "--user",
+            help="Only re-index this username",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild search terms and report how many rows were written."""
+        user_ids = [get_user_or_error(options["user"]).id] if options.get("user") else None
+        written = UserSearchService().refresh(user_ids)
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} user search terms."))
@@ -0,0 +1,26 @@
+"""Management command to rebuild the precomputed "view similar" neighbour table."""
+
+from django.core.management.base import BaseCommand
+
+from recipes.services.similarity import DEFAULT_TOP_K, SimilarityService
+
+
+class Command(BaseCommand):
+    """Recompute top-K similar recipes from tag, ingredient, category and co-like overlap."""
+
+    help = "Rebuild the similar_recipe neighbour table used by the recipe detail page."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=DEFAULT_TOP_K,
+            help="How many neighbours to keep per recipe",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild the index and report how many rows were written."""
+        top_k = max(1, options["top_k"])
+        written = SimilarityService(top_k=top_k).rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} similar-recipe rows (top {top_k} per recipe)."))
@@ -0,0 +1,35 @@
+"""Management command to rebuild the "people you may know" suggestion table."""
+
+from django.core.management.base import BaseCommand
+
+from recipes.management.commands.seed_helpers import get_user_or_error
+from recipes.services.suggestions import DEFAULT_TOP_N, SuggestionService
+
+
+class Command(BaseCommand):
+    """Recompute friends-of-friends suggestions scored by mutual follows and shared liked tags."""
+
+    help = "Rebuild the user_suggestion table used by the dashboard's people-you-may-know list."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument(
+            "--top-n",
+            type=int,
+            default=DEFAULT_TOP_N,
+            help="How many suggestions to keep per user",
+        )
+        parser.add_argument(
+            "--user",
+            help="Only refresh suggestions for this username",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild suggestions and report how many rows were written."""
+        top_n = max(1, options["top_n"])
+        service = SuggestionService(top_n=top_n)
+        if options.get("user"):
+            written = service.refresh_for([get_user_or_error(options["user"]).id])
+        else:
+            written = service.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} user-suggestion rows (top {top_n} per user)."))
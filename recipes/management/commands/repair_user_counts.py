@@ -0,0 +1,29 @@
+"""Management command to repair denormalised follower/following/post counts."""
+
+from django.core.management.base import BaseCommand
+
+from recipes.services.user_counts import UserCountsService
+
+
+class Command(BaseCommand):
+    """Recount follow and post totals for users whose stored counters drifted."""
+
+    help = "Repair User.followers_count, following_count and posts_count."
+
+    def add_arguments(self, parser):
+        """Define CLI arguments for the command."""
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recount every user instead of only those that drifted",
+        )
+
+    def handle(self, *args, **options):
+        """Recount drifted users (or everyone with --all) and report how many rows changed."""
+        service = UserCountsService()
+        user_ids = None if options["all"] else service.drifted_ids()
+        if user_ids == []:
+            self.stdout.write(self.style.SUCCESS("User counts are already consistent."))
+            return
+        updated = service.refresh(user_ids)
+        self.stdout.write(self.style.SUCCESS(f"Repaired counts for {updated} user(s)."))
@@ -28,6 +28,13 @@ from recipes.models.recipe_step import RecipeStep
 from recipes.models.favourite import Favourite
 from recipes.models.favourite_item import FavouriteItem
 from recipes.models.ingredient import Ingredient
+from recipes.services.comments import CommentService
+from recipes.services.ingredient_index import IngredientIndexService
+from recipes.services.ingredient_terms import IngredientTermService
+from recipes.services.shop_catalogue import ShopCatalogueService
+from recipes.services.shop_products import ShopProductService
+from recipes.services.suggestions import SuggestionService
+from recipes.services.user_counts import UserCountsService
 
 class Command(SeedHelpers, BaseCommand):
     """Management command to seed the database with sample users/posts/data."""
@@ -60,6 +67,8 @@ class Command(SeedHelpers, BaseCommand):
         self.seed_ingredients()
         self.seed_likes(max_likes_per_post=20)
         self.seed_comments(max_comments_per_post=5)
+        UserCountsService().refresh()
+        SuggestionService().rebuild()
         self.stdout.write(self.style.SUCCESS("Seeding complete"))
 
     def create_users(self):
@@ -202,6 +211,7 @@ class Command(SeedHelpers, BaseCommand):
                 )
 
         Comment.objects.bulk_create(rows, ignore_conflicts=True, batch_size=500)
+        CommentService().refresh_counts()
         self.stdout.write(f"Comments created: {len(rows)}")
 
     def seed_ingredients(self) -> None:
@@ -222,6 +232,10 @@ class Command(SeedHelpers, BaseCommand):
 
         with transaction.atomic():
             Ingredient.objects.bulk_create(rows, ignore_conflicts=True, batch_size=1000)
+            IngredientTermService().backfill()
+            IngredientIndexService().refresh_counts()
+            ShopProductService().rebuild()
+            ShopCatalogueService().sync_ingredients()
 
         self.stdout.write(f"ingredients created (attempted): {len(rows)}")
 
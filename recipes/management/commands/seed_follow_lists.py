@@ -5,6 +5,7 @@ from django.db import transaction
 
 from recipes.management.commands.seed_helpers import get_user_or_error
 from recipes.models import User, Follower
+from recipes.services.user_counts import UserCountsService
 
 
 class Command(BaseCommand):
@@ -51,6 +52,8 @@ class Command(BaseCommand):
         with transaction.atomic():
             Follower.objects.bulk_create(follower_edges, ignore_conflicts=True, batch_size=1000)
             Follower.objects.bulk_create(following_edges, ignore_conflicts=True, batch_size=1000)
+            touched = {target.id, *(edge.follower_id for edge in follower_edges), *(edge.author_id for edge in following_edges)}
+            UserCountsService().refresh(touched)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -12,6 +12,7 @@ from recipes.management.commands.seed_helpers import get_user_or_error
 from recipes.management.commands.seed_utils import SeedHelpers
 from recipes.models import RecipePost
 from recipes.models.recipe_post import RecipeImage
+from recipes.services.user_counts import UserCountsService
 
 
 class Command(SeedHelpers, BaseCommand):
@@ -50,6 +51,7 @@ class Command(SeedHelpers, BaseCommand):
         RecipePost.objects.bulk_create(posts, batch_size=500)
         if images:
             RecipeImage.objects.bulk_create(images, batch_size=500)
+        UserCountsService().refresh([author.id])
 
         self.stdout.write(
             self.style.SUCCESS(
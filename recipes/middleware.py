@@ -0,0 +1,14 @@
+"""Request middleware for the recipes app."""
+
+from recipes.services.social_graph import request_scope
+
+
+class SocialGraphMiddleware:
+    """Share one social-graph memo across every service used while handling a request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_scope():
+            return self.get_response(request)
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0001_squashed_0037_recipepost_serves'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarRecipe',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(default=0)),
+                ('rank', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('recipe_post', models.ForeignKey(db_column='recipe_post_id', on_delete=django.db.models.deletion.CASCADE, related_name='similar_recipes', to='recipes.recipepost')),
+                ('similar_post', models.ForeignKey(db_column='similar_post_id', on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='recipes.recipepost')),
+            ],
+            options={
+                'db_table': 'similar_recipe',
+                'indexes': [models.Index(fields=['recipe_post', 'rank'], name='similar_rec_recipe__95f839_idx')],
+                'constraints': [models.UniqueConstraint(fields=('recipe_post', 'similar_post'), name='uniq_similar_recipe_pair')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:31
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_ingredient_counts(apps, schema_editor):
+    RecipePost = apps.get_model('recipes', 'RecipePost')
+    Ingredient = apps.get_model('recipes', 'Ingredient')
+    counts = (
+        Ingredient.objects.filter(recipe_post_id=OuterRef('pk'))
+        .values('recipe_post_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    RecipePost.objects.update(ingredient_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0038_similarrecipe'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipepost',
+            name='ingredient_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='ingredient',
+            index=models.Index(fields=['name', 'recipe_post'], name='ingredient_name_post_idx'),
+        ),
+        migrations.RunPython(backfill_ingredient_counts, migrations.RunPython.noop),
+    ]
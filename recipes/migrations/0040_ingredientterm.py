@@ -0,0 +1,151 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:34
+
+import re
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copy of recipes.utils.ingredient_names as of this migration, so later
+# changes to the live normaliser do not alter what this backfill produces.
+UNITS = {
+    "bag", "bags", "bottle", "bottles", "bunch", "bunches", "can", "cans", "clove", "cloves",
+    "cup", "cups", "dash", "dashes", "g", "gram", "grams", "handful", "handfuls", "jar", "jars",
+    "kg", "kilogram", "kilograms", "l", "lb", "lbs", "litre", "litres", "liter", "liters", "ml",
+    "oz", "ounce", "ounces", "pack", "packs", "pinch", "pinches", "pound", "pounds", "slice",
+    "slices", "sprig", "sprigs", "stick", "sticks", "tbsp", "tbs", "tablespoon", "tablespoons",
+    "tin", "tins", "tsp", "teaspoon", "teaspoons",
+}
+
+# Regional and spelling variants mapped to one canonical term.
+ALIASES = {
+    "all purpose flour": "plain flour",
+    "all-purpose flour": "plain flour",
+    "arugula": "rocket",
+    "cilantro": "coriander",
+    "confectioners sugar": "icing sugar",
+    "eggplant": "aubergine",
+    "garbanzo bean": "chickpea",
+    "green onion": "spring onion",
+    "powdered sugar": "icing sugar",
+    "scallion": "spring onion",
+    "shrimp": "prawn",
+    "zucchini": "courgette",
+}
+
+# Plurals the suffix rules below would get wrong.
+IRREGULAR = {
+    "brownies": "brownie",
+    "calves": "calf",
+    "cookies": "cookie",
+    "halves": "half",
+    "leaves": "leaf",
+    "loaves": "loaf",
+    "pies": "pie",
+}
+
+# Words that look plural but are not, so singularisation must leave them alone.
+INVARIANT = {"asparagus", "couscous", "hummus", "molasses", "swiss", "watercress", "grass", "glass"}
+
+_QUANTITY = r"(?:\d+(?:[.,]\d+)?(?:\s*/\s*\d+)?|[½⅓⅔¼¾⅛])"
+_LEADING_AMOUNT = re.compile(rf"^(?:{_QUANTITY}\s*(?:-|to\b)?\s*)+")
+_ATTACHED_UNIT = re.compile(r"^(?P<unit>[a-z]+)\b")
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_NON_WORD = re.compile(r"[^a-z\s-]")
+_SPACES = re.compile(r"\s+")
+
+
+def singularise(word: str) -> str:
+    """Return a best-effort singular form of an English ingredient word."""
+    if word in IRREGULAR:
+        return IRREGULAR[word]
+    if word in INVARIANT or len(word) <= 3:
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("oes") or word.endswith(("ches", "shes", "xes", "sses")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us")):
+        return word[:-1]
+    return word
+
+
+def _strip_amount(text: str) -> str:
+    """Remove a leading quantity and unit such as '2 cups of' or '200g'."""
+    text = _LEADING_AMOUNT.sub("", text).strip()
+    match = _ATTACHED_UNIT.match(text)
+    if match and match.group("unit") in UNITS:
+        text = text[match.end():].strip()
+        if text.startswith("of "):
+            text = text[3:]
+    return text
+
+
+def normalise_ingredient_name(raw):
+    fallback = _SPACES.sub(" ", (raw or "").strip().lower())
+    text = _PARENTHESES.sub(" ", fallback).split(",", 1)[0]
+    text = _strip_amount(text)
+    text = _SPACES.sub(" ", _NON_WORD.sub(" ", text)).strip(" -")
+    if not text:
+        return fallback
+    words = text.split(" ")
+    words[-1] = singularise(words[-1])
+    name = " ".join(words)
+    return ALIASES.get(name, name)
+
+
+def backfill_ingredient_terms(apps, schema_editor):
+    IngredientTerm = apps.get_model('recipes', 'IngredientTerm')
+    Ingredient = apps.get_model('recipes', 'Ingredient')
+    canonical = {
+        raw: normalise_ingredient_name(raw)
+        for raw in Ingredient.objects.values_list('name', flat=True).distinct()
+        if str(raw).strip()
+    }
+    if not canonical:
+        return
+    IngredientTerm.objects.bulk_create(
+        [IngredientTerm(name=name) for name in set(canonical.values())],
+        ignore_conflicts=True,
+    )
+    term_ids = dict(IngredientTerm.objects.filter(name__in=set(canonical.values())).values_list('name', 'id'))
+    names_by_term = defaultdict(list)
+    for raw, name in canonical.items():
+        names_by_term[term_ids[name]].append(raw)
+    for term_id, raw_names in names_by_term.items():
+        Ingredient.objects.filter(term__isnull=True, name__in=raw_names).update(term_id=term_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0039_ingredient_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngredientTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'db_table': 'ingredient_term',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='ingredient',
+            name='ingredient_name_post_idx',
+        ),
+        migrations.AddField(
+            model_name='ingredient',
+            name='term',
+            field=models.ForeignKey(blank=True, db_column='term_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ingredients', to='recipes.ingredientterm'),
+        ),
+        migrations.AddIndex(
+            model_name='ingredient',
+            index=models.Index(fields=['term', 'recipe_post'], name='ingredient_term_post_idx'),
+        ),
+        migrations.RunPython(backfill_ingredient_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:39
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_comments_count(apps, schema_editor):
+    RecipePost = apps.get_model('recipes', 'RecipePost')
+    Comment = apps.get_model('recipes', 'Comment')
+    counts = (
+        Comment.objects.filter(recipe_post_id=OuterRef('pk'), is_hidden=False)
+        .values('recipe_post_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    RecipePost.objects.update(comments_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0040_ingredientterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipepost',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['recipe_post', 'is_hidden', '-created_at'], name='comment_thread_idx'),
+        ),
+        migrations.RunPython(backfill_comments_count, migrations.RunPython.noop),
+    ]
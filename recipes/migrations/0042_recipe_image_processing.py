@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0041_comment_thread'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipeimage',
+            name='display',
+            field=models.ImageField(blank=True, null=True, upload_to='recipes/display/'),
+        ),
+        migrations.AddField(
+            model_name='recipepost',
+            name='image_status',
+            field=models.CharField(choices=[('pending', 'Processing images'), ('ready', 'Ready'), ('failed', 'Image processing failed')], db_index=True, default='ready', max_length=10),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:49
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(model, field):
+    rows = (
+        model.objects.filter(**{field: OuterRef('pk')})
+        .values(field)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(rows), Value(0))
+
+
+def backfill_user_counts(apps, schema_editor):
+    User = apps.get_model('recipes', 'User')
+    Follower = apps.get_model('recipes', 'Follower')
+    RecipePost = apps.get_model('recipes', 'RecipePost')
+    User.objects.update(
+        followers_count=_count(Follower, 'author'),
+        following_count=_count(Follower, 'follower'),
+        posts_count=_count(RecipePost, 'author'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0042_recipe_image_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='following_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='posts_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_user_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-19 03:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0043_user_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='follower',
+            index=models.Index(fields=['author', '-id'], name='followers_author_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='follower',
+            index=models.Index(fields=['follower', '-id'], name='followers_follower_page_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0044_follow_list_keyset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSuggestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mutual_count', models.IntegerField(default=0)),
+                ('shared_tags', models.PositiveIntegerField(default=0)),
+                ('score', models.FloatField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('suggested', models.ForeignKey(db_column='suggested_id', on_delete=django.db.models.deletion.CASCADE, related_name='suggested_to', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='user_suggestions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_suggestion',
+                'indexes': [models.Index(fields=['user', '-score'], name='user_suggestion_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'suggested'), name='uniq_user_suggestion_pair')],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.8 on 2026-10-19 04:10
+
+import re
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copy of recipes.utils.search_terms as of this migration.
+_SPLIT_RE = re.compile(r"[^\w]+")
+
+
+def _words(text):
+    return [word for word in _SPLIT_RE.split((text or "").lower()) if word]
+
+
+def user_search_terms(username, first_name, last_name):
+    name_words = _words(first_name) + _words(last_name)
+    words = set(_words(username)) | set(name_words)
+    if len(name_words) > 1:
+        words.add("".join(name_words))
+    grams = {word[i:i + 3] for word in words for i in range(len(word) - 2)}
+    return words, grams
+
+
+def backfill_user_search_terms(apps, schema_editor):
+    User = apps.get_model('recipes', 'User')
+    UserSearchTerm = apps.get_model('recipes', 'UserSearchTerm')
+    rows = []
+    for user_id, username, first_name, last_name in User.objects.values_list(
+        'id', 'username', 'first_name', 'last_name'
+    ).iterator():
+        words, grams = user_search_terms(username, first_name, last_name)
+        rows.extend(UserSearchTerm(user_id=user_id, kind='w', term=word) for word in words)
+        rows.extend(UserSearchTerm(user_id=user_id, kind='t', term=gram) for gram in grams)
+    UserSearchTerm.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0045_usersuggestion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('w', 'Word'), ('t', 'Trigram')], max_length=1)),
+                ('term', models.CharField(max_length=150)),
+                ('user', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_search_term',
+                'indexes': [models.Index(fields=['kind', 'term', 'user'], name='user_search_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'kind', 'term'), name='uniq_user_search_term')],
+            },
+        ),
+        migrations.RunPython(backfill_user_search_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-19 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0046_user_search_term'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecipeChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted'), ('engagement', 'Engagement counters changed'), ('audience', "Viewer's audience changed")], max_length=10)),
+                ('recipe_post_id', models.UUIDField(blank=True, null=True)),
+                ('user_id', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'recipe_change',
+                'indexes': [models.Index(fields=['user_id', 'id'], name='recipe_change_user_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_shop_items(apps, schema_editor):
+    Ingredient = apps.get_model('recipes', 'Ingredient')
+    ShopItem = apps.get_model('recipes', 'ShopItem')
+    rows = [
+        ShopItem(
+            ingredient_id=ingredient_id,
+            recipe_post_id=post_id,
+            author_id=author_id,
+            name=name,
+            term_id=term_id,
+            has_shop_url=bool((shop_url or '').strip()),
+            visibility=visibility,
+            author_is_private=author_is_private,
+        )
+        for ingredient_id, post_id, author_id, name, term_id, shop_url, visibility, author_is_private in (
+            Ingredient.objects.values_list(
+                'id',
+                'recipe_post_id',
+                'recipe_post__author_id',
+                'name',
+                'term_id',
+                'shop_url',
+                'recipe_post__visibility',
+                'recipe_post__author__is_private',
+            ).iterator()
+        )
+    ]
+    ShopItem.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0047_recipe_change'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopItem',
+            fields=[
+                ('ingredient', models.OneToOneField(db_column='ingredient_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='shop_item', serialize=False, to='recipes.ingredient')),
+                ('name', models.CharField(max_length=255)),
+                ('has_shop_url', models.BooleanField(default=False)),
+                ('visibility', models.CharField(choices=[('public', 'Public'), ('followers', 'Followers only'), ('close_friends', 'Close friends only')], default='public', max_length=20)),
+                ('author_is_private', models.BooleanField(default=False)),
+                ('author', models.ForeignKey(db_column='author_id', on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('recipe_post', models.ForeignKey(db_column='recipe_post_id', on_delete=django.db.models.deletion.CASCADE, related_name='shop_items', to='recipes.recipepost')),
+                ('term', models.ForeignKey(blank=True, db_column='term_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='recipes.ingredientterm')),
+            ],
+            options={
+                'db_table': 'shop_item',
+                'indexes': [models.Index(fields=['has_shop_url', 'visibility', 'author_is_private'], name='shop_item_visible_idx'), models.Index(fields=['name'], name='shop_item_name_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_shop_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+from recipes.utils.shop_urls import normalise_shop_url
+
+
+def backfill_shop_products(apps, schema_editor):
+    Ingredient = apps.get_model('recipes', 'Ingredient')
+    ShopItem = apps.get_model('recipes', 'ShopItem')
+    ShopProduct = apps.get_model('recipes', 'ShopProduct')
+    ids_by_key = {}
+    firsts = {}
+    for pk, name, url in Ingredient.objects.order_by('pk').values_list('id', 'name', 'shop_url').iterator():
+        key = normalise_shop_url(url)
+        if key:
+            ids_by_key.setdefault(key, []).append(pk)
+            firsts.setdefault(key, (url.strip(), name))
+    ShopProduct.objects.bulk_create(
+        [
+            ShopProduct(url_key=key, url=url, name=name, ingredient_count=len(ids_by_key[key]))
+            for key, (url, name) in firsts.items()
+        ],
+        batch_size=1000,
+    )
+    for key, product_id in ShopProduct.objects.values_list('url_key', 'id').iterator():
+        Ingredient.objects.filter(pk__in=ids_by_key[key]).update(product_id=product_id)
+    ShopItem.objects.update(
+        product_id=Subquery(Ingredient.objects.filter(pk=OuterRef('ingredient_id')).values('product_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0048_shop_item'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopProduct',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url_key', models.CharField(max_length=500, unique=True)),
+                ('url', models.URLField(max_length=500)),
+                ('name', models.CharField(max_length=255)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='shop_products/')),
+                ('image_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('ingredient_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'shop_product',
+            },
+        ),
+        migrations.AddField(
+            model_name='ingredient',
+            name='product',
+            field=models.ForeignKey(blank=True, db_column='product_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ingredients', to='recipes.shopproduct'),
+        ),
+        migrations.AddField(
+            model_name='shopitem',
+            name='product',
+            field=models.ForeignKey(blank=True, db_column='product_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='recipes.shopproduct'),
+        ),
+        migrations.RunPython(backfill_shop_products, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-19 07:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0049_shop_product'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='follower',
+            name='followers_author_page_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='follower',
+            name='followers_follower_page_idx',
+        ),
+        migrations.AddField(
+            model_name='follower',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='follower',
+            index=models.Index(fields=['author', '-created_at', '-id'], name='followers_author_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='follower',
+            index=models.Index(fields=['follower', '-created_at', '-id'], name='followers_follower_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0050_follower_created_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='recipepost',
+            name='image_status',
+            field=models.CharField(choices=[('pending', 'Processing images'), ('processing', 'Claimed by an image worker'), ('ready', 'Ready'), ('failed', 'Image processing failed')], db_index=True, default='ready', max_length=10),
+        ),
+    ]
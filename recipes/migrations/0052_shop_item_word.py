@@ -0,0 +1,55 @@
+# Generated by Django 5.2.8 on 2026-10-19 07:31
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_shop_item_words(apps, schema_editor):
+    ShopItem = apps.get_model('recipes', 'ShopItem')
+    ShopItemWord = apps.get_model('recipes', 'ShopItemWord')
+    rows = [
+        ShopItemWord(item_id=ingredient_id, word=word)
+        for ingredient_id, name in ShopItem.objects.values_list('ingredient_id', 'name').iterator()
+        for word in {word for word in re.split(r'[^\w]+', (name or '').lower()) if word}
+    ]
+    ShopItemWord.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0051_recipe_image_claims'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopItemWord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=255)),
+            ],
+            options={
+                'db_table': 'shop_item_word',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='shopitem',
+            name='shop_item_name_idx',
+        ),
+        migrations.AddField(
+            model_name='shopitemword',
+            name='item',
+            field=models.ForeignKey(db_column='ingredient_id', on_delete=django.db.models.deletion.CASCADE, related_name='words', to='recipes.shopitem'),
+        ),
+        migrations.AddIndex(
+            model_name='shopitemword',
+            index=models.Index(fields=['word', 'item'], name='shop_item_word_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='shopitemword',
+            constraint=models.UniqueConstraint(fields=('item', 'word'), name='uniq_shop_item_word'),
+        ),
+        migrations.RunPython(backfill_shop_item_words, migrations.RunPython.noop),
+    ]
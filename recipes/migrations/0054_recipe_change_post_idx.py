@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0053_user_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='recipechange',
+            index=models.Index(fields=['recipe_post_id', 'kind'], name='recipe_change_post_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def recount_public_posts(apps, schema_editor):
+    User = apps.get_model('recipes', 'User')
+    RecipePost = apps.get_model('recipes', 'RecipePost')
+    rows = (
+        RecipePost.objects.filter(author=OuterRef('pk'), visibility='public', is_hidden=False)
+        .values('author')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    User.objects.update(posts_count=Coalesce(Subquery(rows), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0054_recipe_change_post_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(recount_public_posts, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from .user import User
+from .ingredient_term import IngredientTerm
+from .shop_product import ShopProduct
 from .ingredient import Ingredient
 from .recipe_post import RecipePost
 from .recipe_step import RecipeStep
@@ -11,9 +13,16 @@ from .report import Report
 from .notification import Notification
 from .follow_request import FollowRequest
 from .close_friend import CloseFriend
+from .similar_recipe import SimilarRecipe
+from .user_suggestion import UserSuggestion
+from .user_search_term import UserSearchTerm
+from .recipe_change import RecipeChange
+from .shop_item import ShopItem, ShopItemWord
 
 __all__ = [
     "User",
+    "IngredientTerm",
+    "ShopProduct",
     "Ingredient",
     "RecipePost",
     "RecipeStep",
@@ -26,4 +35,10 @@ __all__ = [
     "Notification",
     "FollowRequest",
     "CloseFriend",
+    "SimilarRecipe",
+    "UserSuggestion",
+    "UserSearchTerm",
+    "RecipeChange",
+    "ShopItem",
+    "ShopItemWord",
 ]
@@ -30,8 +30,11 @@ class Comment(models.Model):
     is_hidden = models.BooleanField(default = False, help_text = "Hidden by admin due to reports")
 
     class Meta:
-        """DB table name for comments."""
+        """DB table name and thread index for comments."""
         db_table = "comment"
+        indexes = [
+            models.Index(fields=["recipe_post", "is_hidden", "-created_at"], name="comment_thread_idx"),
+        ]
 
     def __str__(self):
         """Readable identifier for admin/debugging."""
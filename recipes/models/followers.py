@@ -5,6 +5,7 @@ from __future__ import annotations
 from django.conf import settings
 from django.db import models
 from django.db.models import Q, F
+from django.utils import timezone
 from recipes.utils.uuid import uuid7_or_4
 
 
@@ -27,6 +28,7 @@ class Follower(models.Model):
         related_name="followers",      # user.followers -> Follower rows pointing to this user (inbound)
         db_column="author_id",
     )
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         """DB metadata and constraints for follower relationships."""
@@ -38,6 +40,8 @@ class Follower(models.Model):
         indexes = [
             models.Index(fields=["follower"]),
             models.Index(fields=["author"]),
+            models.Index(fields=["author", "-created_at", "-id"], name="followers_author_recent_idx"),
+            models.Index(fields=["follower", "-created_at", "-id"], name="followers_follower_recent_idx"),
         ]
 
     def __str__(self) -> str:
@@ -3,6 +3,8 @@
 import uuid
 from django.db import models
 from .recipe_post import RecipePost
+from .ingredient_term import IngredientTerm
+from .shop_product import ShopProduct
 
 
 class Ingredient(models.Model):
@@ -17,6 +19,15 @@ class Ingredient(models.Model):
 
     name = models.CharField(max_length=255)
 
+    term = models.ForeignKey(
+        IngredientTerm,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ingredients',
+        db_column='term_id',
+    )
+
     position = models.PositiveIntegerField(default=1)
     
     quantity = models.DecimalField(
@@ -37,6 +48,15 @@ class Ingredient(models.Model):
         help_text="Custom image for this product in the Shop section",
     )
 
+    product = models.ForeignKey(
+        ShopProduct,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ingredients',
+        db_column='product_id',
+    )
+
     class Meta:
         """Uniqueness and position constraints for ingredients."""
         unique_together = (
@@ -49,12 +69,35 @@ class Ingredient(models.Model):
                 name='ingredient_position_gt_0'
             ),
         ]
+        indexes = [
+            # Inverted index: canonical term -> posts using it.
+            models.Index(fields=['term', 'recipe_post'], name='ingredient_term_post_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored name so save() can tell when the term needs resolving again."""
+        instance = super().from_db(db, field_names, values)
+        instance._stored_name = instance.__dict__.get("name")
+        return instance
 
     def save(self, *args, **kwargs):
-        """Normalise name to lowercase before saving."""
-        if self.name:
+        """Normalise name to lowercase and resolve its dictionary term before saving.
+
+        The term is resolved for new names and again whenever the name changes.
+        """
+        update_fields = kwargs.get("update_fields")
+        writes_name = update_fields is None or "name" in update_fields
+        if self.name and writes_name:
             self.name = self.name.strip().lower()
+            renamed = self.name != getattr(self, "_stored_name", self.name)
+            if self.term_id is None or renamed:
+                self.term = IngredientTerm.for_name(self.name)
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "term"}
         super().save(*args, **kwargs)
+        if writes_name:
+            self._stored_name = self.name
 
     def __str__(self):
         """Readable ingredient string with quantity when available."""
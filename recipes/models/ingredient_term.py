@@ -0,0 +1,24 @@
+"""Canonical ingredient dictionary shared by all recipe ingredients."""
+
+from django.db import models
+
+from recipes.utils.ingredient_names import normalise_ingredient_name
+
+
+class IngredientTerm(models.Model):
+    """A canonical ingredient name (e.g. 'tomato' for 'Tomatoes' or '2 tomatoes')."""
+    name = models.CharField(max_length=255, unique=True)
+
+    class Meta:
+        """DB table name for ingredient terms."""
+        db_table = "ingredient_term"
+
+    def __str__(self):
+        """Readable canonical name."""
+        return self.name
+
+    @classmethod
+    def for_name(cls, raw_name):
+        """Return (creating if needed) the term for a free-text ingredient name."""
+        term, _ = cls.objects.get_or_create(name=normalise_ingredient_name(raw_name))
+        return term
@@ -0,0 +1,42 @@
+"""Append-only change log backing the delta sync API."""
+
+from django.db import models
+
+
+class RecipeChange(models.Model):
+    """One change to a recipe (or to who may see an author's recipes); ids double as sync tokens.
+
+    recipe_post_id and user_id are plain columns rather than foreign keys so that
+    tombstones outlive the rows they describe.
+    """
+    KIND_CREATED = "created"
+    KIND_UPDATED = "updated"
+    KIND_DELETED = "deleted"
+    KIND_ENGAGEMENT = "engagement"
+    KIND_AUDIENCE = "audience"
+    KIND_CHOICES = [
+        (KIND_CREATED, "Created"),
+        (KIND_UPDATED, "Updated"),
+        (KIND_DELETED, "Deleted"),
+        (KIND_ENGAGEMENT, "Engagement counters changed"),
+        (KIND_AUDIENCE, "Viewer's audience changed"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    recipe_post_id = models.UUIDField(null=True, blank=True)
+    # Audience rows: the viewer whose visible set changed.
+    user_id = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Lookup indexes for audience changes per viewer and engagement rows per recipe."""
+        db_table = "recipe_change"
+        indexes = [
+            models.Index(fields=["user_id", "id"], name="recipe_change_user_idx"),
+            models.Index(fields=["recipe_post_id", "kind"], name="recipe_change_post_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"RecipeChange({self.id}, {self.kind}, {self.recipe_post_id or self.user_id})"
@@ -17,6 +17,18 @@ class RecipePost(models.Model):
         (VISIBILITY_FOLLOWERS, "Followers only"),
         (VISIBILITY_CLOSE_FRIENDS, "Close friends only"),
     ]
+
+    IMAGES_PENDING = "pending"
+    IMAGES_PROCESSING = "processing"
+    IMAGES_READY = "ready"
+    IMAGES_FAILED = "failed"
+
+    IMAGE_STATUS_CHOICES = [
+        (IMAGES_PENDING, "Processing images"),
+        (IMAGES_PROCESSING, "Claimed by an image worker"),
+        (IMAGES_READY, "Ready"),
+        (IMAGES_FAILED, "Image processing failed"),
+    ]
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     author = models.ForeignKey(
@@ -29,6 +41,12 @@ class RecipePost(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(max_length=4000)
     image = models.CharField(max_length=500, blank=True, null=True)
+    image_status = models.CharField(
+        max_length=10,
+        choices=IMAGE_STATUS_CHOICES,
+        default=IMAGES_READY,
+        db_index=True,
+    )
 
     prep_time_min = models.PositiveIntegerField(default=0)
     cook_time_min = models.PositiveIntegerField(default=0)
@@ -47,6 +65,8 @@ class RecipePost(models.Model):
     )
 
     saved_count = models.PositiveIntegerField(default=0)
+    ingredient_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
 
     published_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -75,12 +95,7 @@ class RecipePost(models.Model):
         if not images_qs:
             return None
         first = images_qs.first()
-        if not first or not getattr(first, "image", None):
-            return None
-        try:
-            return first.image.url
-        except ValueError:
-            return None
+        return display_url(first) if first else None
     
     @property
     def likes_count(self):
@@ -98,6 +113,7 @@ class RecipeImage(models.Model):
         on_delete=models.CASCADE,
     )
     image = models.ImageField(upload_to="recipes/")
+    display = models.ImageField(upload_to="recipes/display/", blank=True, null=True)
     position = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -108,3 +124,20 @@ class RecipeImage(models.Model):
     def __str__(self):
         """Human-readable representation of the image row."""
         return f"Image for {self.recipe_post_id}"
+
+    @property
+    def url(self):
+        """Return the processed display derivative when it exists, else the original upload."""
+        return display_url(self)
+
+
+def display_url(image_obj):
+    """Return the first servable URL of an image row's display derivative and original upload."""
+    for field in (getattr(image_obj, "display", None), getattr(image_obj, "image", None)):
+        if not field:
+            continue
+        try:
+            return field.url
+        except ValueError:
+            continue
+    return None
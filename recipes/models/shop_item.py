@@ -0,0 +1,97 @@
+"""Denormalised read model backing shop browsing and shopping search."""
+
+from django.conf import settings
+from django.db import models
+
+from .ingredient import Ingredient
+from .ingredient_term import IngredientTerm
+from .recipe_post import RecipePost
+from .shop_product import ShopProduct
+
+
+class ShopItem(models.Model):
+    """One ingredient as the shop sees it, with the post and author fields privacy needs.
+
+    Rows are maintained by ShopCatalogueService on ingredient, post and author
+    writes, so shop queries filter a single narrow table instead of joining
+    ingredients to posts and users.
+    """
+    ingredient = models.OneToOneField(
+        Ingredient,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="shop_item",
+        db_column="ingredient_id",
+    )
+    recipe_post = models.ForeignKey(
+        RecipePost,
+        on_delete=models.CASCADE,
+        related_name="shop_items",
+        db_column="recipe_post_id",
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_column="author_id",
+    )
+    name = models.CharField(max_length=255)
+    term = models.ForeignKey(
+        IngredientTerm,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_column="term_id",
+    )
+    product = models.ForeignKey(
+        ShopProduct,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_column="product_id",
+    )
+    has_shop_url = models.BooleanField(default=False)
+    visibility = models.CharField(
+        max_length=20,
+        choices=RecipePost.VISIBILITY_CHOICES,
+        default=RecipePost.VISIBILITY_PUBLIC,
+    )
+    author_is_private = models.BooleanField(default=False)
+
+    class Meta:
+        """Lookup index for shop listing."""
+        db_table = "shop_item"
+        indexes = [
+            models.Index(fields=["has_shop_url", "visibility", "author_is_private"], name="shop_item_visible_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"ShopItem({self.ingredient_id}, {self.name})"
+
+
+class ShopItemWord(models.Model):
+    """A lowercased word of a shop item's name, so shopping search can prefix-match words through an index."""
+    item = models.ForeignKey(
+        ShopItem,
+        on_delete=models.CASCADE,
+        related_name="words",
+        db_column="ingredient_id",
+    )
+    word = models.CharField(max_length=255)
+
+    class Meta:
+        """Uniqueness and lookup index for shop item words."""
+        db_table = "shop_item_word"
+        constraints = [
+            models.UniqueConstraint(fields=["item", "word"], name="uniq_shop_item_word"),
+        ]
+        indexes = [
+            models.Index(fields=["word", "item"], name="shop_item_word_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"ShopItemWord({self.item_id}, {self.word})"
@@ -0,0 +1,29 @@
+"""Deduplicated shop products shared by every ingredient that links to them."""
+
+from django.db import models
+
+
+class ShopProduct(models.Model):
+    """One product page, keyed by its normalised URL.
+
+    ingredient_count is a reference count of Ingredient rows pointing here,
+    maintained by ShopProductService; image is stored once per distinct file
+    content, named by its SHA-256. url, name and image come from whichever
+    ingredient linked first, which may be private, so they are catalogue
+    bookkeeping and never rendered to viewers.
+    """
+    url_key = models.CharField(max_length=500, unique=True)
+    url = models.URLField(max_length=500)
+    name = models.CharField(max_length=255)
+    image = models.ImageField(upload_to="shop_products/", blank=True, null=True)
+    image_hash = models.CharField(max_length=64, blank=True, default="")
+    ingredient_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """DB table name for shop products."""
+        db_table = "shop_product"
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"ShopProduct({self.url_key})"
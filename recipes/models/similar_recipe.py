@@ -0,0 +1,39 @@
+"""Precomputed item-to-item neighbours for the "view similar" section."""
+
+from django.db import models
+
+
+class SimilarRecipe(models.Model):
+    """Top-K neighbour row linking a recipe post to a similar post."""
+    recipe_post = models.ForeignKey(
+        "recipes.RecipePost",
+        on_delete=models.CASCADE,
+        related_name="similar_recipes",
+        db_column="recipe_post_id",
+    )
+    similar_post = models.ForeignKey(
+        "recipes.RecipePost",
+        on_delete=models.CASCADE,
+        related_name="similar_to",
+        db_column="similar_post_id",
+    )
+    score = models.FloatField(default=0)
+    rank = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Uniqueness and lookup index for neighbour rows."""
+        db_table = "similar_recipe"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recipe_post", "similar_post"],
+                name="uniq_similar_recipe_pair",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["recipe_post", "rank"]),
+        ]
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"SimilarRecipe({self.recipe_post_id} -> {self.similar_post_id}, rank={self.rank})"
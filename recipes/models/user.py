@@ -28,6 +28,11 @@ class User(AbstractUser):
     )
     avatar = models.ImageField(upload_to="avatars/", blank=True, null=True)
     is_private = models.BooleanField(default=False)
+    followers_count = models.PositiveIntegerField(default=0)
+    following_count = models.PositiveIntegerField(default=0)
+    posts_count = models.PositiveIntegerField(default=0)
+    # Moves on every full save, so pages showing this user's name or avatar can revalidate.
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """Default ordering for users."""
@@ -0,0 +1,37 @@
+"""Maintained search terms backing indexed user search."""
+
+from django.conf import settings
+from django.db import models
+
+
+class UserSearchTerm(models.Model):
+    """A lowercased word (for prefix lookups) or trigram (for typo matching) of a user's names."""
+    KIND_WORD = "w"
+    KIND_TRIGRAM = "t"
+    KIND_CHOICES = [
+        (KIND_WORD, "Word"),
+        (KIND_TRIGRAM, "Trigram"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="search_terms",
+        db_column="user_id",
+    )
+    kind = models.CharField(max_length=1, choices=KIND_CHOICES)
+    term = models.CharField(max_length=150)
+
+    class Meta:
+        """Uniqueness and lookup index for search terms."""
+        db_table = "user_search_term"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "kind", "term"], name="uniq_user_search_term"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "term", "user"], name="user_search_term_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"UserSearchTerm({self.user_id}, {self.kind}:{self.term})"
@@ -0,0 +1,38 @@
+"""Precomputed "people you may know" suggestions for the dashboard."""
+
+from django.conf import settings
+from django.db import models
+
+
+class UserSuggestion(models.Model):
+    """Friends-of-friends candidate for a user, scored by mutual follows and shared liked tags."""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="user_suggestions",
+        db_column="user_id",
+    )
+    suggested = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="suggested_to",
+        db_column="suggested_id",
+    )
+    mutual_count = models.IntegerField(default=0)
+    shared_tags = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Uniqueness and lookup index for suggestion rows."""
+        db_table = "user_suggestion"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "suggested"], name="uniq_user_suggestion_pair"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-score"], name="user_suggestion_rank_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Readable label for admin/debugging."""
+        return f"UserSuggestion({self.user_id} -> {self.suggested_id}, score={self.score})"
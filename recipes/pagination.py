@@ -0,0 +1,84 @@
+"""Pagination for the recipe API and the server-rendered search pages."""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.pagination import CursorPagination
+
+from recipes.db_accessor import LazyPage
+
+
+class RecipeCursorPagination(CursorPagination):
+    """Keyset pages of recipes, newest first, with an optional ?page_size= override."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+
+
+class PeekPaginator:
+    """Paginator for infinite-scroll pages that only need has_next.
+
+    get_page() reads per_page + 1 rows and never runs COUNT(*). count is
+    computed only when something asks for it, and is then kept in the cache
+    for PAGINATION_COUNT_CACHE_TIMEOUT seconds (when set), so it may lag
+    behind recent writes.
+    """
+
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+
+    def get_page(self, number):
+        """Return the requested page; invalid numbers fall back to page 1, past the end is empty."""
+        try:
+            number = max(1, int(number))
+        except (TypeError, ValueError):
+            number = 1
+        window = LazyPage(self.object_list, offset=(number - 1) * self.per_page, limit=self.per_page)
+        return PeekPage(window.items, number, window.has_more, self)
+
+    @property
+    def count(self):
+        """Approximate total number of objects (cached when PAGINATION_COUNT_CACHE_TIMEOUT is set)."""
+        if not hasattr(self.object_list, "query"):
+            return len(self.object_list)
+        timeout = getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", None)
+        if not timeout:
+            return self.object_list.count()
+        digest = hashlib.md5(str(self.object_list.query).encode("utf-8"), usedforsecurity=False).hexdigest()
+        return cache.get_or_set(f"peek_count:{digest}", self.object_list.count, timeout)
+
+
+class PeekPage:
+    """The slice of Django's Page API used by the search templates and AJAX responses."""
+
+    def __init__(self, object_list, number, has_more, paginator):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_more = has_more
+
+    def has_next(self):
+        """True when at least one object follows this page."""
+        return self._has_more
+
+    def has_previous(self):
+        """True for every page after the first."""
+        return self.number > 1
+
+    def next_page_number(self):
+        """Number of the following page."""
+        return self.number + 1
+
+    def previous_page_number(self):
+        """Number of the preceding page."""
+        return self.number - 1
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
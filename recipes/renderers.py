@@ -0,0 +1,55 @@
+"""DRF renderers for compact API payloads."""
+
+import datetime
+import decimal
+import uuid
+
+import msgpack
+from rest_framework.renderers import BaseRenderer
+
+
+def _encode_default(value):
+    """Encode the types DRF leaves in .data that msgpack has no native form for."""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return msgpack.Timestamp.from_datetime(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} as msgpack")
+
+
+def columnar(rows):
+    """Turn a list of same-shaped dicts into {"columns": [...], "rows": [[...], ...]}."""
+    columns = list(rows[0]) if rows else []
+    return {"columns": columns, "rows": [[row.get(column) for column in columns] for row in rows]}
+
+
+class MsgPackRenderer(BaseRenderer):
+    """Opt-in msgpack output (Accept: application/msgpack or ?format=msgpack).
+
+    Lists of records, bare or under "results", are sent column-wise so keys are
+    written once per page; timestamps use msgpack's Timestamp extension type.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Serialise data to msgpack bytes."""
+        if data is None:
+            return b""
+        return msgpack.packb(self._shape(data), default=_encode_default, use_bin_type=True)
+
+    def _shape(self, data):
+        if isinstance(data, list) and all(isinstance(row, dict) for row in data):
+            return columnar(data)
+        if isinstance(data, dict) and isinstance(data.get("results"), list):
+            results = data["results"]
+            if all(isinstance(row, dict) for row in results):
+                return {**data, "results": columnar(results)}
+        return data
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List, Optional, Sequence
 from django.db.models import QuerySet
-from recipes.db_accessor import DB_Accessor
+from recipes.db_accessor import DB_Accessor, LazyPage
 from recipes.models.recipe_post import RecipePost
 from recipes.models import Follower
 
@@ -14,7 +14,7 @@ class PostRepo(DB_Accessor):
         super().__init__(RecipePost)
 
     def list_ids(self) -> List[str]:
-        """Return all recipe post IDs."""
+        """Return all recipe post IDs; batch jobs should stream them with iter_batches()."""
         return list(self.model.objects.values_list("id", flat=True))
 
     def list_for_feed(
@@ -25,8 +25,8 @@ class PostRepo(DB_Accessor):
         order_by: Sequence[str] = ("created_at",),
         limit: Optional[int] = None,
         offset: int = 0,
-    ) -> QuerySet:
-        """Return posts for feed with optional filters and paging."""
+    ) -> QuerySet | LazyPage:
+        """Return posts for feed with optional filters; a LazyPage when limit/offset are given."""
         filters: Dict[str, Any] = {}
         if category and category.lower() != "all":
             filters["category__iexact"] = category
@@ -48,7 +48,7 @@ class PostRepo(DB_Accessor):
         order_by: Sequence[str] = ("created_at",),
         limit: Optional[int] = None,
         offset: int = 0,
-    ) -> QuerySet:
+    ) -> QuerySet | LazyPage:
         """Return posts authored by a given user."""
         return self.list_for_feed(
             author_id=user_id,
@@ -80,5 +80,5 @@ class PostRepo(DB_Accessor):
         return qs.filter(author_id__in=followee_ids).order_by("-created_at")[:limit]
 
     def slice_queryset(self, qs, *, offset=0, limit=None):
-        """Public wrapper to slice a queryset while preserving ordering."""
+        """Public wrapper returning qs unchanged when unsliced, else a LazyPage."""
         return self._apply_slice(qs, offset=offset, limit=limit)
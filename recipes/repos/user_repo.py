@@ -13,7 +13,7 @@ class UserRepo(DB_Accessor):
         super().__init__(User)
 
     def list_ids(self) -> List[int]:
-        """Return all user IDs."""
+        """Return all user IDs; batch jobs should stream them with iter_batches()."""
         return list(self.model.objects.values_list("id", flat=True))
 
     def get_by_id(self, user_id: int) -> User:
@@ -4,7 +4,25 @@ from rest_framework import serializers
 from recipes.models import RecipePost
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that a `fields` kwarg can narrow to a subset of its declared fields.
+
+    A truthy `native_datetimes` context entry leaves datetimes as objects for
+    renderers with a native timestamp type.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        if self.context.get("native_datetimes"):
+            for field in self.fields.values():
+                if isinstance(field, serializers.DateTimeField):
+                    field.format = None
+
+
+class RecipeSerializer(DynamicFieldsModelSerializer):
     """Serializer for RecipePost with common fields."""
     primary_image_url = serializers.CharField(read_only=True)
 
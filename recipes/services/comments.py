@@ -1,7 +1,35 @@
-"""Service helpers for creating and deleting comments."""
+"""Service helpers for creating, deleting and reading comments."""
 
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
-from recipes.models import Comment
+from django.templatetags.static import static
+
+from recipes.models import Comment, RecipePost, User
+
+THREAD_FIELDS = ("id", "text", "created_at", "user_id", "user__username", "user__avatar")
+
+
+@dataclass(frozen=True)
+class CommentAuthor:
+    """Commenter fields needed to render a thread row."""
+
+    username: str
+    mini_avatar_url: str
+
+
+@dataclass(frozen=True)
+class CommentRow:
+    """Lightweight comment row rendered by partials/post/comment_items.html."""
+
+    id: int
+    text: str
+    created_at: datetime
+    user_id: int
+    user: CommentAuthor
 
 
 class CommentService:
@@ -30,3 +58,43 @@ class CommentService:
         post_id = comment.recipe_post.id
         comment.delete()
         return post_id
+
+    def thread_rows(self, recipe, offset, limit):
+        """Return up to limit visible comments, newest first, with commenter avatars in one query."""
+        rows = (
+            Comment.objects.filter(recipe_post=recipe, is_hidden=False)
+            .order_by("-created_at", "-id")
+            .values(*THREAD_FIELDS)[offset:offset + limit]
+        )
+        return [self._row(values) for values in rows]
+
+    def refresh_counts(self, post_ids=None):
+        """Recompute RecipePost.comments_count from visible comments; return rows updated."""
+        counts = (
+            Comment.objects.filter(recipe_post_id=OuterRef("pk"), is_hidden=False)
+            .values("recipe_post_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        posts = RecipePost.objects.all()
+        if post_ids is not None:
+            posts = posts.filter(id__in=post_ids)
+        return posts.update(comments_count=Coalesce(Subquery(counts), Value(0)))
+
+    def _row(self, values):
+        author = CommentAuthor(
+            username=values["user__username"],
+            mini_avatar_url=self._avatar_url(values["user__avatar"]),
+        )
+        return CommentRow(
+            id=values["id"],
+            text=values["text"],
+            created_at=values["created_at"],
+            user_id=values["user_id"],
+            user=author,
+        )
+
+    def _avatar_url(self, name):
+        if not name:
+            return static("img/default-avatar.svg")
+        return User._meta.get_field("avatar").storage.url(name)
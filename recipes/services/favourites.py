@@ -16,6 +16,10 @@ class FavouriteService:
         """Return all favourites for a user with prefetched items/posts."""
         return self.favourite_model.objects.filter(user=user).prefetch_related("items__recipe_post")
 
+    def has_any(self, user):
+        """Return True if the user has at least one favourite collection."""
+        return self.favourite_model.objects.filter(user=user).exists()
+
     def fetch_for_user(self, slug, user):
         """Fetch a favourite by id and user or raise 404."""
         return get_object_or_404(self.favourite_model, id=slug, user=user)
@@ -2,26 +2,36 @@
 import random
 from typing import Iterable, List, Sequence, Tuple
 
-from django.contrib.auth import get_user_model
 from django.db.models import (
     Count,
     Exists,
     ExpressionWrapper,
     F,
     IntegerField,
+    Max,
     OuterRef,
     Q,
     QuerySet,
 )
 from django.utils import timezone
 
+from .ingredient_index import HAVE_MATCH_ALL, HAVE_MATCH_COVERAGE, IngredientIndexService
 from .privacy import PrivacyService
-from recipes.models import RecipePost, Like, Follower, Ingredient
+from .user_search import UserSearchService
+from recipes.models import RecipePost, Like, Ingredient
 class FeedService:
     """Encapsulate feed ranking, filtering, and user search helpers."""
 
-    def __init__(self, *, privacy_service: PrivacyService | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        privacy_service: PrivacyService | None = None,
+        ingredient_index: IngredientIndexService | None = None,
+        user_search: UserSearchService | None = None,
+    ) -> None:
         self.privacy_service = privacy_service or PrivacyService()
+        self.ingredient_index = ingredient_index or IngredientIndexService()
+        self.user_search = user_search or UserSearchService()
 
     def normalise_tags(self, tags) -> List[str]:
         """Return a lowercased list of tag strings from comma- or list-based input."""
@@ -85,6 +95,7 @@ class FeedService:
         max_prep,
         sort: str | None,
         privacy: PrivacyService | None = None,
+        have_match: str = HAVE_MATCH_ALL,
     ) -> QuerySet:
         """Build the discovery queryset with all filters applied."""
         privacy_service = privacy or self.privacy_service
@@ -93,9 +104,12 @@ class FeedService:
         discover_qs = self._apply_category_filter(discover_qs, category)
         discover_qs = self._apply_ingredient_filter(discover_qs, ingredient_q)
         discover_qs = self._apply_time_filters(discover_qs, min_prep, max_prep)
-        discover_qs = self._apply_have_ingredients_filter(discover_qs, have_ingredients_list)
+        discover_qs = self._apply_have_ingredients_filter(discover_qs, have_ingredients_list, have_match)
         discover_qs = privacy_service.filter_visible_posts(discover_qs, user)
-        return self._sort_discover(discover_qs, sort)
+        discover_qs = self._sort_discover(discover_qs, sort)
+        if "have_coverage" in discover_qs.query.annotations:
+            return discover_qs.order_by("-have_coverage", "-have_matched", *discover_qs.query.order_by)
+        return discover_qs
 
     def tag_filtered_qs(
         self, qs: QuerySet, preferred_tags: Sequence[str], liked_post_ids: Sequence[int]
@@ -161,9 +175,7 @@ class FeedService:
         offset: int = 0,
     ) -> List:
         """Return a list of posts from authors the user follows (optionally limited)."""
-        followed_ids = list(
-            Follower.objects.filter(follower=user).values_list("author_id", flat=True)
-        )
+        followed_ids = list(self.privacy_service.social_graph.following_ids(user))
         if not followed_ids:
             return []
         qs = self.base_posts_queryset().filter(author_id__in=followed_ids)
@@ -173,24 +185,20 @@ class FeedService:
             return list(qs[offset:])
         return list(qs[offset : offset + limit])
 
-    def search_users(self, query: str | None, limit: int = 18) -> List:
-        """Search users by username or name substrings, tolerating spaces."""
-        from django.db.models.functions import Concat
-        from django.db.models import Value
-
-        User = get_user_model()
-        query = (query or "").strip()
-        if not query:
-            return []
-        base_filter = self._user_base_filter(query)
-        token_filter = self._token_filter(query)
-        if token_filter is not None:
-            base_filter |= token_filter
-        return list(
-            User.objects.annotate(full_name=Concat("first_name", Value(" "), "last_name"))
-            .filter(base_filter)
-            .order_by("username", "last_name", "first_name")[:limit]
+    def following_version(self, user) -> Tuple:
+        """Return a cheap summary of the visible following feed (followed ids, post count, latest edit) for ETags."""
+        followed_ids = self.privacy_service.social_graph.following_ids(user)
+        if not followed_ids:
+            return ()
+        qs = RecipePost.objects.filter(published_at__isnull=False, author_id__in=followed_ids)
+        summary = self.privacy_service.filter_visible_posts(qs, user).aggregate(
+            count=Count("id"), latest=Max("updated_at")
         )
+        return (*sorted(map(str, followed_ids)), summary["count"], summary["latest"])
+
+    def search_users(self, query: str | None, limit: int = 18) -> List:
+        """Search users by username or name prefixes, tolerating spaces and small typos."""
+        return self.user_search.search((query or "").strip(), limit=limit)
 
     def filter_posts_by_prep_time(self, posts, min_prep=None, max_prep=None):
         """Filter in-memory posts by prep time bounds; ignores missing/invalid values."""
@@ -233,9 +241,13 @@ class FeedService:
         return qs
 
     def _apply_ingredient_filter(self, qs, ingredient_q):
-        if ingredient_q:
-            return qs.filter(ingredients__name__icontains=str(ingredient_q).lower()).distinct()
-        return qs
+        if not ingredient_q:
+            return qs
+        term_ids = self.ingredient_index.term_service.term_ids([ingredient_q])
+        matching = Ingredient.objects.filter(recipe_post_id=OuterRef("pk")).filter(
+            Q(name__icontains=str(ingredient_q).lower()) | Q(term_id__in=term_ids)
+        )
+        return qs.filter(Exists(matching))
 
     def _apply_time_filters(self, qs, min_prep, max_prep):
         min_bound = self._safe_int(min_prep)
@@ -257,25 +269,17 @@ class FeedService:
 
         return qs
 
-    def _apply_have_ingredients_filter(self, qs, have_ingredients_list):
+    def _apply_have_ingredients_filter(self, qs, have_ingredients_list, have_match=HAVE_MATCH_ALL):
+        """Match posts against the viewer's ingredients via the inverted ingredient index.
+
+        "all" keeps posts the viewer can fully cook; "coverage" keeps any post using at
+        least one ingredient and annotates have_matched/have_coverage for ranking.
+        """
         if not have_ingredients_list:
             return qs
-
-        allowed_names = [str(name).lower() for name in have_ingredients_list]
-
-        disallowed_subquery = Ingredient.objects.filter(
-            recipe_post_id=OuterRef("pk")
-        ).exclude(name__in=allowed_names)
-
-        allowed_subquery = Ingredient.objects.filter(
-            recipe_post_id=OuterRef("pk"),
-            name__in=allowed_names,
-        )
-
-        return qs.annotate(
-            has_disallowed=Exists(disallowed_subquery),
-            has_allowed=Exists(allowed_subquery),
-        ).filter(has_disallowed=False, has_allowed=True)
+        if have_match == HAVE_MATCH_COVERAGE:
+            return self.ingredient_index.annotate_coverage(qs, have_ingredients_list)
+        return self.ingredient_index.filter_covered(qs, have_ingredients_list)
 
     def _sort_discover(self, discover_qs, sort):
         if sort == "popular":
@@ -343,35 +347,6 @@ class FeedService:
         except Exception:
             return 0
 
-    def _user_base_filter(self, query: str):
-        """Build a Q filter for user search by username/first name/last name/full name."""
-        username_query = query.replace(" ", "")
-        return (
-            Q(username__icontains=query)
-            | Q(username__icontains=username_query)
-            | Q(first_name__icontains=query)
-            | Q(last_name__icontains=query)
-            | Q(full_name__icontains=query)
-        )
-
-    def _token_filter(self, query: str):
-        """Build a Q filter matching all tokens in the query against user fields."""
-        tokens = [part for part in query.replace("@", " ").split() if part]
-        if not tokens:
-            return None
-        combined = (
-            Q(username__icontains=tokens[0])
-            | Q(first_name__icontains=tokens[0])
-            | Q(last_name__icontains=tokens[0])
-        )
-        for token in tokens[1:]:
-            combined &= (
-                Q(username__icontains=token)
-                | Q(first_name__icontains=token)
-                | Q(last_name__icontains=token)
-            )
-        return combined
-
     def _safe_int(self, value):
         """Safely convert a value to int, returning None on failure."""
         try:
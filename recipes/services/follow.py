@@ -1,14 +1,23 @@
 """Service helpers for managing follow relationships and requests."""
 
+from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from recipes.models import CloseFriend, Follower, Notification, FollowRequest
+from recipes.services.notifications import NotificationService
+from recipes.services.profile_cache import ProfileCache
+from recipes.services.recipe_sync import RecipeSyncService
+from recipes.services.social_graph import SocialGraph
+from recipes.services.suggestions import SuggestionService
 
 class FollowService:
     """Domain service to manage follow relationships and requests."""
-    def __init__(self, actor):
+    def __init__(self, actor, social_graph=None, profile_cache=None):
         """Create a FollowService bound to the acting user."""
         self.actor = actor
+        self.social_graph = social_graph or SocialGraph()
+        self.profile_cache = profile_cache or ProfileCache()
 
     def _can_act(self, target):
         """Return True when the actor is authenticated and different to the target."""
@@ -40,7 +49,7 @@ class FollowService:
         """Return True if the actor follows the target."""
         if not self._can_act(target):
             return False
-        return Follower.objects.filter(follower=self.actor, author=target).exists()
+        return self.social_graph.is_following(self.actor, target)
 
     def pending_request(self, target):
         """Return the pending follow request to the target if it exists."""
@@ -209,3 +218,129 @@ class FollowService:
         fr.save(update_fields=["status"])
         Notification.objects.filter(follow_request=fr, recipient=self.actor).delete()
         return True
+
+    @transaction.atomic
+    def follow_many(self, targets):
+        """Follow (or request to follow) many users at once; return {target id: status}.
+
+        Public targets are followed with one bulk insert and private ones get a
+        pending FollowRequest, mirroring follow_user, with notifications written
+        in a single batch.
+        """
+        statuses, targets = self._bulk_targets(targets)
+        already = set(
+            Follower.objects.filter(follower=self.actor, author__in=targets).values_list("author_id", flat=True)
+        )
+        statuses.update({target.pk: "following" for target in targets if target.pk in already})
+        pending = [target for target in targets if target.pk not in already]
+        public = [target for target in pending if not getattr(target, "is_private", False)]
+        private = [target for target in pending if getattr(target, "is_private", False)]
+        self._bulk_follow_public(public)
+        self._bulk_request_private(private)
+        statuses.update({target.pk: "following" for target in public})
+        statuses.update({target.pk: "requested" for target in private})
+        return statuses
+
+    @transaction.atomic
+    def add_close_friends(self, targets):
+        """Add many followers to the actor's close friends; return {target id: status}."""
+        statuses, targets = self._bulk_targets(targets)
+        followers = set(
+            Follower.objects.filter(author=self.actor, follower__in=targets).values_list("follower_id", flat=True)
+        )
+        eligible = [target for target in targets if target.pk in followers]
+        CloseFriend.objects.bulk_create(
+            [CloseFriend(owner=self.actor, friend=target) for target in eligible],
+            ignore_conflicts=True,
+        )
+        self.social_graph.invalidate(self.actor, *eligible)
+        self.profile_cache.bump(self.actor)
+        RecipeSyncService().record_audience(*[target.pk for target in eligible])
+        statuses.update({target.pk: "added" if target.pk in followers else "requires_follow" for target in targets})
+        return statuses
+
+    @transaction.atomic
+    def remove_followers(self, targets):
+        """Remove many followers (and their close-friend links) at once; return {target id: status}."""
+        statuses, targets = self._bulk_targets(targets)
+        Follower.objects.filter(author=self.actor, follower__in=targets).delete()
+        CloseFriend.objects.filter(owner=self.actor, friend__in=targets).delete()
+        statuses.update({target.pk: "removed" for target in targets})
+        return statuses
+
+    def _bulk_targets(self, targets):
+        """Split targets into noop statuses and the distinct users the actor may act on."""
+        statuses = {}
+        actionable = {}
+        for target in targets:
+            if self._can_act(target):
+                actionable[target.pk] = target
+            elif target is not None:
+                statuses[target.pk] = "noop"
+        return statuses, list(actionable.values())
+
+    def _bulk_follow_public(self, targets):
+        """Insert follow rows for public targets and apply what the Follower signals would."""
+        if not targets:
+            return
+        following = Follower.objects.filter(follower=self.actor, author__in=targets).values_list("author_id", flat=True)
+        before = set(following)
+        Follower.objects.bulk_create(
+            [Follower(follower=self.actor, author=target) for target in targets],
+            ignore_conflicts=True,
+        )
+        # ignore_conflicts hides which rows landed, so diff the actor's follows around the insert.
+        followed = [target_id for target_id in following.all() if target_id not in before]
+        FollowRequest.objects.filter(requester=self.actor, target__in=targets).delete()
+        Notification.objects.bulk_create(
+            [Notification(recipient_id=target_id, sender=self.actor, notification_type="follow") for target_id in followed]
+        )
+        # bulk_create skips post_save, so keep counters, history caps, the graph and suggestions in step here.
+        NotificationService().trim_history(*followed)
+        User = get_user_model()
+        User.objects.filter(pk__in=followed).update(followers_count=F("followers_count") + 1)
+        User.objects.filter(pk=self.actor.pk).update(following_count=F("following_count") + len(followed))
+        self.social_graph.invalidate(self.actor, *targets)
+        self.profile_cache.bump(self.actor, *targets)
+        RecipeSyncService().record_audience(self.actor.pk)
+        suggestions = SuggestionService(social_graph=self.social_graph)
+        for target_id in followed:
+            suggestions.record_follow(self.actor.pk, target_id)
+
+    def _bulk_request_private(self, targets):
+        """Open (or reopen) pending follow requests to private targets and notify each once."""
+        if not targets:
+            return
+        now = timezone.now()
+        already_pending = set(
+            FollowRequest.objects.filter(
+                requester=self.actor, target__in=targets, status=FollowRequest.STATUS_PENDING
+            ).values_list("target_id", flat=True)
+        )
+        FollowRequest.objects.filter(requester=self.actor, target__in=targets).exclude(
+            status=FollowRequest.STATUS_PENDING
+        ).update(status=FollowRequest.STATUS_PENDING, created_at=now)
+        FollowRequest.objects.bulk_create(
+            [
+                FollowRequest(requester=self.actor, target=target, status=FollowRequest.STATUS_PENDING, created_at=now)
+                for target in targets
+            ],
+            ignore_conflicts=True,
+        )
+        requests = list(
+            FollowRequest.objects.filter(requester=self.actor, target__in=targets).exclude(
+                target_id__in=already_pending
+            )
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient_id=fr.target_id,
+                    sender=self.actor,
+                    notification_type="follow_request",
+                    follow_request=fr,
+                )
+                for fr in requests
+            ]
+        )
+        NotificationService().trim_history(*[fr.target_id for fr in requests])
@@ -1,14 +1,62 @@
 """Read-only helpers for follower/following/close-friend queries."""
 
-from recipes.models import Follower, CloseFriend
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import Q
+from django.templatetags.static import static
+
+from recipes.models import Follower, CloseFriend, User
+from recipes.services.social_graph import SocialGraph
+
+# Which side of the Follower row is listed for each follow list.
+FOLLOW_LIST_USER_FIELDS = {"followers": "follower", "following": "author", "close_friends": "follower"}
+
+
+@dataclass(frozen=True)
+class FollowUserRow:
+    """Lightweight follow-list entry rendered by the follow list partials."""
+
+    id: int
+    username: str
+    first_name: str
+    last_name: str
+    mini_avatar_url: str
+    cursor: str
+
+    @property
+    def get_full_name(self):
+        """Match User.get_full_name so the partials can render either."""
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def follow_cursor(created_at, follow_id):
+    """Encode a follow-list keyset position as a URL-safe string (epoch microseconds and follow id)."""
+    return f"{(created_at - EPOCH) // timedelta(microseconds=1)}_{follow_id}"
+
+
+def parse_follow_cursor(cursor):
+    """Decode follow_cursor output into (created_at, follow_id), or None when missing or malformed."""
+    if not cursor:
+        return None
+    micros, _, follow_id = str(cursor).partition("_")
+    try:
+        return EPOCH + timedelta(microseconds=int(micros)), uuid.UUID(follow_id)
+    except (ValueError, OverflowError):
+        return None
 
 
 class FollowReadService:
     """Provide query helpers for follow relationships."""
 
-    def __init__(self, follower_model=Follower, close_friend_model=CloseFriend):
+    def __init__(self, follower_model=Follower, close_friend_model=CloseFriend, social_graph=None):
         self.follower_model = follower_model
         self.close_friend_model = close_friend_model
+        self.social_graph = social_graph or SocialGraph(follower_model, close_friend_model)
 
     def followers_qs(self, user):
         """Return queryset of followers for the given user."""
@@ -20,6 +68,85 @@ class FollowReadService:
 
     def close_friend_ids(self, user):
         """Return close friend user IDs for the given user."""
+        return self.social_graph.close_friend_ids(user)
+
+    def close_friend_ids_among(self, user, user_ids):
+        """Return which of user_ids are close friends of user, in a single IN query."""
+        if not user_ids:
+            return set()
         return set(
-            self.close_friend_model.objects.filter(owner=user).values_list("friend_id", flat=True)
+            self.close_friend_model.objects.filter(owner=user, friend_id__in=user_ids).values_list(
+                "friend_id", flat=True
+            )
+        )
+
+    def follow_rows(self, user, list_type, after=None, limit=13):
+        """Return up to limit follow-list rows, newest follow first, keyset-paginated on (created_at, id).
+
+        after is the cursor of the last row already shown (malformed cursors
+        restart from the top); rows carry only the id, names and avatar of the
+        listed user.
+        """
+        qs, user_attr = self._follow_qs(user, list_type, after)
+        rows = qs.values(
+            "id",
+            "created_at",
+            f"{user_attr}_id",
+            f"{user_attr}__username",
+            f"{user_attr}__first_name",
+            f"{user_attr}__last_name",
+            f"{user_attr}__avatar",
+        )
+        return [self._row(values, user_attr) for values in rows[:limit]]
+
+    def follow_entries(self, user, list_type, after=None, limit=13):
+        """Return (user_id, cursor) pairs in follow_rows order, for callers that cache ids only."""
+        qs, user_attr = self._follow_qs(user, list_type, after)
+        rows = qs.values_list(f"{user_attr}_id", "created_at", "id")[:limit]
+        return [(user_id, follow_cursor(created_at, follow_id)) for user_id, created_at, follow_id in rows]
+
+    def rows_for_entries(self, entries):
+        """Hydrate (user_id, cursor) pairs into follow-list rows, reading current names and avatars in one query."""
+        if not entries:
+            return []
+        users = User.objects.filter(id__in={user_id for user_id, _ in entries}).values(
+            "id", "username", "first_name", "last_name", "avatar"
+        )
+        by_id = {values["id"]: values for values in users}
+        return [
+            FollowUserRow(
+                id=user_id,
+                username=by_id[user_id]["username"],
+                first_name=by_id[user_id]["first_name"] or "",
+                last_name=by_id[user_id]["last_name"] or "",
+                mini_avatar_url=self._avatar_url(by_id[user_id]["avatar"]),
+                cursor=cursor,
+            )
+            for user_id, cursor in entries
+            if user_id in by_id
+        ]
+
+    def _follow_qs(self, user, list_type, after):
+        user_attr = FOLLOW_LIST_USER_FIELDS[list_type]
+        owner_attr = "author" if user_attr == "follower" else "follower"
+        qs = self.follower_model.objects.filter(**{owner_attr: user})
+        position = parse_follow_cursor(after)
+        if position is not None:
+            created_at, follow_id = position
+            qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=follow_id))
+        return qs.order_by("-created_at", "-id"), user_attr
+
+    def _row(self, values, user_attr):
+        return FollowUserRow(
+            id=values[f"{user_attr}_id"],
+            username=values[f"{user_attr}__username"],
+            first_name=values[f"{user_attr}__first_name"] or "",
+            last_name=values[f"{user_attr}__last_name"] or "",
+            mini_avatar_url=self._avatar_url(values[f"{user_attr}__avatar"]),
+            cursor=follow_cursor(values["created_at"], values["id"]),
         )
+
+    def _avatar_url(self, name):
+        if not name:
+            return static("img/default-avatar.svg")
+        return User._meta.get_field("avatar").storage.url(name)
@@ -0,0 +1,81 @@
+"""Inverted ingredient index helpers for "cook with what I have" matching."""
+
+from django.db.models import (
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    OuterRef,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce, NullIf
+
+from recipes.models import Ingredient, RecipePost
+from recipes.services.ingredient_terms import IngredientTermService
+
+HAVE_MATCH_ALL = "all"
+HAVE_MATCH_COVERAGE = "coverage"
+HAVE_MATCH_MODES = (HAVE_MATCH_ALL, HAVE_MATCH_COVERAGE)
+
+
+class IngredientIndexService:
+    """Answer ingredient-set queries from the (term, recipe_post) index and per-post counts."""
+
+    def __init__(self, term_service=None):
+        self.term_service = term_service or IngredientTermService()
+
+    def postings(self, term_ids):
+        """Return (recipe_post_id, matched) rows for posts using any of the terms."""
+        return (
+            Ingredient.objects.filter(term_id__in=term_ids)
+            .values("recipe_post_id")
+            .annotate(matched=Count("id"))
+            .order_by()
+        )
+
+    def matched_count(self, term_ids):
+        """Correlated count of the post's ingredients found in term_ids (0 when none)."""
+        per_post = (
+            Ingredient.objects.filter(recipe_post_id=OuterRef("pk"), term_id__in=term_ids)
+            .values("recipe_post_id")
+            .annotate(matched=Count("id"))
+            .values("matched")
+        )
+        return Coalesce(Subquery(per_post), Value(0))
+
+    def filter_covered(self, qs, names):
+        """Keep posts whose every ingredient is in names (strict containment)."""
+        term_ids = self.term_service.term_ids(names or [])
+        if not term_ids:
+            return qs.none() if names else qs
+        covered_ids = self.postings(term_ids).filter(matched=F("recipe_post__ingredient_count")).values(
+            "recipe_post_id"
+        )
+        return qs.filter(id__in=covered_ids)
+
+    def annotate_coverage(self, qs, names):
+        """Annotate have_matched and have_coverage, keeping posts that use at least one name."""
+        term_ids = self.term_service.term_ids(names or [])
+        if not term_ids:
+            return qs.none() if names else qs
+        coverage = ExpressionWrapper(
+            F("have_matched") * 1.0 / NullIf(F("ingredient_count"), 0),
+            output_field=FloatField(),
+        )
+        return qs.annotate(have_matched=self.matched_count(term_ids)).filter(have_matched__gt=0).annotate(
+            have_coverage=coverage
+        )
+
+    def refresh_counts(self, post_ids=None):
+        """Recompute RecipePost.ingredient_count (e.g. after bulk_create); return rows updated."""
+        counts = (
+            Ingredient.objects.filter(recipe_post_id=OuterRef("pk"))
+            .values("recipe_post_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        posts = RecipePost.objects.all()
+        if post_ids is not None:
+            posts = posts.filter(id__in=post_ids)
+        return posts.update(ingredient_count=Coalesce(Subquery(counts), Value(0)))
@@ -0,0 +1,58 @@
+"""Service helpers for resolving ingredient names to canonical dictionary terms."""
+
+from collections import defaultdict
+
+from recipes.models import Ingredient, IngredientTerm
+from recipes.services.shop_catalogue import ShopCatalogueService
+from recipes.utils.ingredient_names import normalise_ingredient_name
+
+
+class IngredientTermService:
+    """Resolve, look up and backfill IngredientTerm rows in bulk."""
+
+    def __init__(self, term_model=IngredientTerm, ingredient_model=Ingredient):
+        self.term_model = term_model
+        self.ingredient_model = ingredient_model
+
+    def resolve(self, names):
+        """Return {raw_name_lower: term}, creating missing terms with one bulk insert."""
+        canonical = {
+            str(name).strip().lower(): normalise_ingredient_name(str(name))
+            for name in names
+            if str(name).strip()
+        }
+        if not canonical:
+            return {}
+        wanted = set(canonical.values())
+        self.term_model.objects.bulk_create(
+            [self.term_model(name=name) for name in wanted],
+            ignore_conflicts=True,
+        )
+        terms = {term.name: term for term in self.term_model.objects.filter(name__in=wanted)}
+        return {raw: terms[name] for raw, name in canonical.items()}
+
+    def term_ids(self, names):
+        """Return ids of existing terms matching the given free-text names (read-only)."""
+        canonical = {normalise_ingredient_name(str(name)) for name in names if str(name).strip()}
+        if not canonical:
+            return []
+        return list(self.term_model.objects.filter(name__in=canonical).values_list("id", flat=True))
+
+    def backfill(self, only_missing=True):
+        """Attach terms to ingredient rows in bulk; return the number of rows updated."""
+        rows = self.ingredient_model.objects.all()
+        if only_missing:
+            rows = rows.filter(term__isnull=True)
+        raw_names = set(rows.values_list("name", flat=True).distinct())
+        resolved = self.resolve(raw_names)
+        names_by_term = defaultdict(list)
+        for raw in raw_names:
+            term = resolved.get(str(raw).strip().lower())
+            if term:
+                names_by_term[term.id].append(raw)
+        updated = 0
+        for term_id, raw_list in names_by_term.items():
+            updated += rows.filter(name__in=raw_list).update(term_id=term_id)
+        if updated:
+            ShopCatalogueService().sync_terms()
+        return updated
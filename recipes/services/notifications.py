@@ -1,14 +1,27 @@
 """Service helpers for fetching and filtering notifications."""
 
 from recipes.models import Notification, Follower
+from recipes.services.social_graph import SocialGraph
+
+# Notifications kept per recipient; older ones are trimmed as new ones arrive.
+HISTORY_LIMIT = 100
 
 
 class NotificationService:
     """Encapsulate notification querying and filtering logic."""
 
-    def __init__(self, notification_model=Notification, follower_model=Follower):
+    def __init__(self, notification_model=Notification, follower_model=Follower, social_graph=None):
         self.notification_model = notification_model
         self.follower_model = follower_model
+        self.social_graph = social_graph or SocialGraph(follower_model=follower_model)
+
+    def trim_history(self, *recipients):
+        """Keep only the newest HISTORY_LIMIT notifications of each recipient."""
+        for recipient in recipients:
+            rows = self.notification_model.objects.filter(recipient=recipient)
+            keep_ids = list(rows.order_by("-created_at", "-id").values_list("id", flat=True)[:HISTORY_LIMIT])
+            if keep_ids:
+                rows.exclude(id__in=keep_ids).delete()
 
     def pending_request_sender_ids(self, user):
         """Return sender IDs with pending follow requests to the user."""
@@ -56,9 +69,7 @@ class NotificationService:
 
     def following_ids(self, user):
         """Return author IDs the user follows."""
-        return set(
-            self.follower_model.objects.filter(follower=user).values_list("author_id", flat=True)
-        )
+        return self.social_graph.following_ids(user)
 
     def mark_all_read(self, user):
         """Mark all unread notifications for the user as read."""
@@ -4,13 +4,15 @@ from django.db.models import Q
 from recipes.models.followers import Follower
 from recipes.models.close_friend import CloseFriend
 from recipes.models.recipe_post import RecipePost
+from recipes.services.social_graph import SocialGraph
 
 class PrivacyService:
     """Privacy helper to evaluate who can view profiles and posts."""
-    def __init__(self, follower_model=Follower, close_friend_model=CloseFriend):
+    def __init__(self, follower_model=Follower, close_friend_model=CloseFriend, social_graph=None):
         """Inject follower/close friend models for testing flexibility."""
         self.follower_model = follower_model
         self.close_friend_model = close_friend_model
+        self.social_graph = social_graph or SocialGraph(follower_model, close_friend_model)
 
     def is_private(self, user):
         """Return True if the user has a private profile flag set."""
@@ -22,9 +24,7 @@ class PrivacyService:
             return False
         if viewer == author:
             return True
-        return self.follower_model.objects.filter(
-            follower=viewer, author=author
-        ).exists()
+        return self.social_graph.is_following(viewer, author)
 
     def is_close_friend(self, viewer, author):
         """Return True if viewer is in author's close friends list."""
@@ -32,9 +32,7 @@ class PrivacyService:
             return False
         if viewer == author:
             return True
-        return self.close_friend_model.objects.filter(
-            owner=author, friend=viewer
-        ).exists()
+        return self.social_graph.is_close_friend(viewer, author)
 
     def can_view_profile(self, viewer, author):
         """Check if viewer can see author's profile."""
@@ -85,3 +83,19 @@ class PrivacyService:
         return queryset.filter(
             author__is_private=False, visibility=RecipePost.VISIBILITY_PUBLIC
         )
+
+    def filter_visible_shop_items(self, queryset, viewer):
+        """Filter a ShopItem queryset with the same rules, read from its copied columns."""
+        if viewer and getattr(viewer, "is_authenticated", False):
+            followed = self.follower_model.objects.filter(follower=viewer).values("author_id")
+            befriended_by = self.close_friend_model.objects.filter(friend=viewer).values("owner_id")
+            allowed = (
+                Q(visibility=RecipePost.VISIBILITY_PUBLIC)
+                | Q(visibility=RecipePost.VISIBILITY_FOLLOWERS, author_id__in=followed)
+                | Q(visibility=RecipePost.VISIBILITY_CLOSE_FRIENDS, author_id__in=befriended_by)
+                | Q(author=viewer)
+            )
+            profile_gate = Q(author_is_private=False) | Q(author=viewer) | Q(author_id__in=followed)
+            return queryset.filter(profile_gate & allowed)
+
+        return queryset.filter(author_is_private=False, visibility=RecipePost.VISIBILITY_PUBLIC)
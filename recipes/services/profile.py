@@ -6,7 +6,13 @@ from recipes.models import Favourite, FavouriteItem, Follower, CloseFriend, Foll
 from recipes.services.privacy import PrivacyService
 from recipes.services.follow import FollowService
 from recipes.services.follow_read import FollowReadService
-from recipes.services.profile_data import profile_data_for_user, collections_for_user
+from recipes.services.profile_cache import ProfileCache
+from recipes.services.profile_data import (
+    collection_cards,
+    collection_covers,
+    collections_for_user,
+    profile_data_for_user,
+)
 
 
 class ProfileDisplayService:
@@ -39,6 +45,8 @@ class ProfileDepsFactory:
         self.follow_service_factory = FollowService
         self.profile_data_for_user = profile_data_for_user
         self.collections_for_user = collections_for_user
+        self.collection_cards = collection_cards
+        self.collection_covers = collection_covers
         self.follower_model = Follower
         self.close_friend_model = CloseFriend
         self.follow_request_model = FollowRequest
@@ -46,3 +54,4 @@ class ProfileDepsFactory:
         self.favourite_item_model = FavouriteItem
         self.recipe_post_model = RecipePost
         self.follow_read_service = FollowReadService(self.follower_model, self.close_friend_model)
+        self.profile_cache = ProfileCache()
@@ -0,0 +1,64 @@
+"""Viewer-independent profile blocks kept in Django's cache under a per-profile version."""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _user_id(user):
+    return getattr(user, "pk", user)
+
+
+def _version_key(user_id):
+    return f"profile_cache:version:{user_id}"
+
+
+def _seed_version():
+    # Seeding from the clock keeps a re-created version key ahead of stamps used before eviction.
+    return time.time_ns()
+
+
+class ProfileCache:
+    """Cache profile blocks that look the same to every viewer.
+
+    Each profile has a version stamp; bump() moves it on once profile edits,
+    follow and close-friend changes, new posts and collection changes commit, so
+    stale blocks are simply never read again. Disabled unless PROFILE_CACHE_TIMEOUT is set.
+    """
+
+    def enabled(self):
+        """Return True when profile blocks are cached."""
+        return bool(self._timeout())
+
+    def bump(self, *users):
+        """Invalidate every cached block for the given profiles when the transaction commits."""
+        if not self.enabled():
+            return
+        user_ids = [_user_id(user) for user in users]
+        transaction.on_commit(lambda: self._bump_versions(user_ids))
+
+    def _bump_versions(self, user_ids):
+        for user_id in user_ids:
+            try:
+                cache.incr(_version_key(user_id))
+            except ValueError:
+                cache.add(_version_key(user_id), _seed_version(), None)
+
+    def get_or_build(self, user, block, builder):
+        """Return the cached block for user, calling builder() to fill it on a miss."""
+        timeout = self._timeout()
+        if not timeout:
+            return builder()
+        user_id = _user_id(user)
+        version = cache.get_or_set(_version_key(user_id), _seed_version, None)
+        cache_key = f"profile_cache:{user_id}:{version}:{block}"
+        value = cache.get(cache_key)
+        if value is None:
+            value = builder()
+            cache.set(cache_key, value, timeout)
+        return value
+
+    def _timeout(self):
+        return getattr(settings, "PROFILE_CACHE_TIMEOUT", None)
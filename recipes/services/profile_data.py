@@ -1,7 +1,11 @@
 """Profile and collection data helpers used across services/views."""
 
-from recipes.models import Favourite
+from django.db.models import Count, Exists, F, Max, OuterRef, Q, Subquery, UUIDField
+from django.db.models.functions import Coalesce, Greatest
+
+from recipes.models import Favourite, RecipePost
 from recipes.models.favourite_item import FavouriteItem
+from recipes.models.recipe_post import RecipeImage
 
 
 def _post_image_url(post):
@@ -19,76 +23,97 @@ def profile_data_for_user(user):
         "display_name": display_name,
         "handle": handle,
         "tagline": bio,
-        "following": 2,
-        "followers": 0,
+        "following": getattr(user, "following_count", 0),
+        "followers": getattr(user, "followers_count", 0),
+        "posts": getattr(user, "posts_count", 0),
         "avatar_url": user.avatar_url,
         "is_private": getattr(user, "is_private", False),
     }
 
 
-def _collection_meta(items, favourite):
-    """Compute last_saved_at, cover image url, and item count for a favourite."""
-
-    last_saved_at = favourite.created_at
-    cover_post = _cover_candidate(favourite)
-    first_image_post = None
-    visible_posts = []
-
-    for post, added_at in _visible_posts(items):
-        visible_posts.append(post)
-        last_saved_at = _update_last_saved(last_saved_at, added_at)
-        first_image_post = first_image_post or _first_image_post(post)
-
-    cover_post = cover_post or first_image_post
-    cover_url = _post_image_url(cover_post) if cover_post else None
-    return last_saved_at, cover_url, len(visible_posts)
-
-
-def _cover_candidate(favourite):
-    cover = getattr(favourite, "cover_post", None)
-    return cover if _post_image_url(cover) else None
-
-
-def _visible_posts(items):
-    for item in items:
-        post = getattr(item, "recipe_post", None)
-        if post:
-            yield post, getattr(item, "added_at", None)
-
-
-def _update_last_saved(current, added_at):
-    if not added_at:
-        return current
-    if current is None or added_at > current:
-        return added_at
-    return current
-
-
-def _first_image_post(post):
-    return post if _post_image_url(post) else None
-
-
-def collections_for_user(user):
+def collections_for_user(user, offset=0, limit=None):
     """
     Build collection cards for the given user from Favourite/FavouriteItem.
-    Each Favourite becomes a collection backed by the user's saved posts.
+
+    Item count, last save time and cover candidates are aggregated in the
+    collection query itself, which is ordered and sliced in the database; the
+    cover posts for the page are then loaded together in one more query.
     """
-    favourites = Favourite.objects.filter(user=user).prefetch_related("items__recipe_post")
-    collections = [_collection_card(fav) for fav in favourites]
-    collections.sort(key=lambda c: c.get("last_saved_at"), reverse=True)
-    return collections
+    return collection_covers(collection_cards(user, offset=offset, limit=limit))
+
+
+def collection_cards(user, offset=0, limit=None):
+    """Return collection cards carrying cover candidate ids but no cover URL yet."""
+    favourites = collections_queryset(user)
+    favourites = favourites[offset:offset + limit] if limit is not None else favourites[offset:]
+    return [_collection_card(fav) for fav in favourites]
+
+
+def collection_covers(cards):
+    """Return copies of the cards with cover URLs read from the current cover posts."""
+    covers = _cover_posts(cards)
+    resolved = []
+    for card in cards:
+        cover_url = _cover_url(card, covers)
+        resolved.append({**card, "cover": cover_url, "has_image": bool(cover_url)})
+    return resolved
+
+
+def collections_queryset(user):
+    """Return the user's favourites annotated for collection cards, most recently saved first."""
+    return (
+        Favourite.objects.filter(user=user)
+        .annotate(
+            item_count=Count("items"),
+            last_saved_at=Greatest(Coalesce(Max("items__added_at"), F("created_at")), F("created_at")),
+            first_image_post_id=Subquery(_first_image_item(OuterRef("pk")), output_field=UUIDField()),
+        )
+        .order_by("-last_saved_at", "-created_at")
+    )
+
+
+def _first_image_item(favourite_ref):
+    """Recipe id of the most recently saved item in a favourite whose post has an image."""
+    has_uploaded_image = Exists(
+        RecipeImage.objects.filter(recipe_post=OuterRef("recipe_post")).exclude(image="")
+    )
+    has_legacy_image = Q(recipe_post__image__isnull=False) & ~Q(recipe_post__image="")
+    return (
+        FavouriteItem.objects.filter(favourite=favourite_ref)
+        .filter(has_uploaded_image | has_legacy_image)
+        .order_by("-added_at", "-id")
+        .values("recipe_post_id")[:1]
+    )
+
+
+def _cover_posts(cards):
+    """Load every cover candidate for a page of cards in one query."""
+    post_ids = {post_id for card in cards for post_id in card["cover_post_ids"]}
+    post_ids.discard(None)
+    if not post_ids:
+        return {}
+    return {post.id: post for post in RecipePost.objects.filter(id__in=post_ids).prefetch_related("images")}
+
+
+def _cover_url(card, covers):
+    """Prefer the chosen cover post when it has an image, else the latest saved post with one."""
+    for post_id in card["cover_post_ids"]:
+        post = covers.get(post_id)
+        url = _post_image_url(post) if post else None
+        if url:
+            return url
+    return None
 
 
 def _collection_card(fav):
-    items = list(fav.items.select_related("recipe_post").order_by("-added_at", "-id"))
-    last_saved_at, cover_url, count = _collection_meta(items, fav)
     return {
         "id": str(fav.id),
         "slug": str(fav.id),
         "title": fav.name,
-        "count": count,
+        "count": fav.item_count,
         "privacy": None,
-        "cover": cover_url,
-        "has_image": bool(cover_url),
-        "last_saved_at": last_saved_at,
+        "cover": None,
+        "has_image": False,
+        "last_saved_at": fav.last_saved_at,
+        "cover_post_ids": (fav.cover_post_id, fav.first_image_post_id),
     }
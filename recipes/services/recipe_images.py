@@ -0,0 +1,144 @@
+"""Upload validation and background derivative processing for recipe images."""
+
+import io
+import logging
+import os
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from recipes.models import RecipePost
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes of the formats we accept, checked before Pillow parses anything.
+SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+)
+DISPLAY_MAX_SIDE = 1600
+DISPLAY_QUALITY = 85
+PROCESS_BATCH_SIZE = 20
+# A claim older than this is assumed to belong to a worker that died mid-batch.
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def sniff_image_format(file_obj):
+    """Return the Pillow format name implied by the file's magic bytes, or None."""
+    file_obj.seek(0)
+    header = file_obj.read(12)
+    file_obj.seek(0)
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "WEBP"
+    for signature, image_format in SIGNATURES:
+        if header.startswith(signature):
+            return image_format
+    return None
+
+
+def is_valid_image(file_obj):
+    """Return True when the upload's magic bytes and Pillow's header verify() agree."""
+    image_format = sniff_image_format(file_obj)
+    if not image_format:
+        return False
+    try:
+        with Image.open(file_obj, formats=[image_format]) as image:
+            image.verify()
+        return True
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError, ValueError):
+        return False
+    finally:
+        file_obj.seek(0)
+
+
+class RecipeImageService:
+    """Track per-post image processing state and build display derivatives off the request path."""
+
+    def __init__(self, max_side=DISPLAY_MAX_SIDE, quality=DISPLAY_QUALITY):
+        self.max_side = max_side
+        self.quality = quality
+
+    def mark_pending(self, recipe):
+        """Flag a post whose uploads still need derivatives."""
+        RecipePost.objects.filter(id=recipe.id).update(image_status=RecipePost.IMAGES_PENDING)
+        recipe.image_status = RecipePost.IMAGES_PENDING
+
+    def pending_posts(self, limit=PROCESS_BATCH_SIZE):
+        """Claim and return the oldest posts waiting for image processing.
+
+        Stale claims are picked up again; rows another worker claimed first are skipped.
+        """
+        stale = timezone.now() - CLAIM_TIMEOUT
+        candidates = RecipePost.objects.filter(
+            Q(image_status=RecipePost.IMAGES_PENDING)
+            | Q(image_status=RecipePost.IMAGES_PROCESSING, updated_at__lt=stale)
+        ).order_by("updated_at")[:limit]
+        return [post for post in candidates if self.claim(post)]
+
+    def claim(self, post):
+        """Move a post to processing; return False when its row changed since it was read."""
+        claimed_at = timezone.now()
+        claimed = RecipePost.objects.filter(
+            id=post.id, image_status=post.image_status, updated_at=post.updated_at
+        ).update(image_status=RecipePost.IMAGES_PROCESSING, updated_at=claimed_at)
+        if claimed:
+            post.image_status, post.updated_at = RecipePost.IMAGES_PROCESSING, claimed_at
+        return bool(claimed)
+
+    def process_pending(self, limit=PROCESS_BATCH_SIZE):
+        """Process one batch of pending posts; return how many were handled."""
+        posts = self.pending_posts(limit)
+        for post in posts:
+            self._process(post)
+        return len(posts)
+
+    def process_post(self, post):
+        """Claim one post and write its derivatives; return False if another worker holds it."""
+        if post.image_status != RecipePost.IMAGES_PROCESSING and not self.claim(post):
+            return False
+        self._process(post)
+        return True
+
+    def _process(self, post):
+        """Write display derivatives for every image and point the cover at the first one."""
+        try:
+            images = list(post.images.all())
+            for recipe_image in images:
+                self._write_display(recipe_image)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+            logger.exception("Image processing failed for recipe post %s", post.id)
+            self._set_status(post, RecipePost.IMAGES_FAILED)
+            return
+        with transaction.atomic():
+            # New uploads re-mark the post pending mid-run; leave it for the next batch then.
+            if not self._still_claimed(post):
+                return
+            if images:
+                post.image = images[0].url
+            post.image_status = RecipePost.IMAGES_READY
+            post.save(update_fields=["image", "image_status", "updated_at"])
+
+    def _write_display(self, recipe_image):
+        with recipe_image.image.open("rb") as source, Image.open(source) as image:
+            image = ImageOps.exif_transpose(image).convert("RGB")
+            image.thumbnail((self.max_side, self.max_side))
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=self.quality, optimize=True)
+        stem = os.path.splitext(os.path.basename(recipe_image.image.name))[0]
+        recipe_image.display.save(f"{stem}.jpg", ContentFile(buffer.getvalue()), save=False)
+        recipe_image.save(update_fields=["display"])
+
+    def _still_claimed(self, post):
+        return RecipePost.objects.select_for_update().filter(
+            id=post.id, image_status=RecipePost.IMAGES_PROCESSING
+        ).exists()
+
+    def _set_status(self, post, status):
+        RecipePost.objects.filter(id=post.id, image_status=RecipePost.IMAGES_PROCESSING).update(image_status=status)
+        post.image_status = status
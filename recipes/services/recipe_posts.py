@@ -1,17 +1,46 @@
 """Service helpers for recipe post content and engagement."""
 
+import uuid
+from datetime import datetime
+
+from django.db.models import Count, Exists, F, Max, OuterRef, Q, Subquery, UUIDField
+from django.db.models.functions import Coalesce, Greatest
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
-from recipes.models import Favourite, Ingredient, Like, RecipePost
+from recipes.models import Comment, Favourite, Ingredient, Like, RecipePost
 from recipes.models.favourite_item import FavouriteItem
-from recipes.models.followers import Follower
 from recipes.models.recipe_step import RecipeStep
+from recipes.services.comments import CommentService
+from recipes.services.privacy import PrivacyService
+from recipes.services.social_graph import SocialGraph
+
+COLLECTIONS_MODAL_PAGE_SIZE = 20
+SAVED_POSTS_PAGE_SIZE = 24
+
+
+def saved_cursor(saved_at, post_id):
+    """Encode a saved-recipes keyset position as an opaque string."""
+    return f"{saved_at.isoformat()}|{post_id}"
+
+
+def parse_saved_cursor(cursor):
+    """Decode saved_cursor output into (saved_at, post_id), or None when missing or malformed."""
+    if not cursor:
+        return None
+    saved_at, _, post_id = str(cursor).partition("|")
+    try:
+        return datetime.fromisoformat(saved_at), uuid.UUID(post_id)
+    except ValueError:
+        return None
 
 
 class RecipeContentService:
     """Handle recipe post CRUD and content-related helpers."""
 
+    def __init__(self, comment_service=None):
+        self.comment_service = comment_service or CommentService()
+
     def fetch_post(self, post_id):
         """Fetch a recipe post by id or raise 404."""
         return get_object_or_404(RecipePost, id=post_id)
@@ -74,22 +103,23 @@ class RecipeContentService:
     def set_primary_image(self, recipe):
         """Persist the first RecipeImage URL onto the legacy image field for display."""
         primary_image = recipe.images.first()
-        if primary_image and primary_image.image:
-            recipe.image = primary_image.image.url
+        if primary_image and primary_image.url:
+            recipe.image = primary_image.url
             recipe.save(update_fields=["image"])
 
     def comments_page(self, recipe, request, page_size=50):
-        """Return a slice of comments for a recipe along with pagination metadata."""
-        comments_qs = recipe.comments.select_related("user").order_by("-created_at")
+        """Return a slice of comments for a recipe along with pagination metadata.
+
+        Fetches one row past the page to detect a next page instead of counting the thread.
+        """
         try:
             page_number = max(1, int(request.GET.get("comments_page") or 1))
         except (TypeError, ValueError):
             page_number = 1
         start = (page_number - 1) * page_size
-        end = start + page_size
-        comments_page = list(comments_qs[start:end])
-        has_more_comments = comments_qs.count() > end
-        return comments_page, has_more_comments, page_number
+        rows = self.comment_service.thread_rows(recipe, start, page_size + 1)
+        has_more_comments = len(rows) > page_size
+        return rows[:page_size], has_more_comments, page_number
 
     def ingredient_lists(self, recipe):
         """Split ingredients into non-shop list and shop-linked list."""
@@ -109,6 +139,10 @@ class RecipeContentService:
 class RecipeEngagementService:
     """Handle saves/likes/favourites and collection/UI helpers."""
 
+    def __init__(self, social_graph=None, privacy_service=None):
+        self.social_graph = social_graph or SocialGraph()
+        self.privacy_service = privacy_service or PrivacyService(social_graph=self.social_graph)
+
     def resolve_collection(self, user, *, collection_id=None, collection_name=None):
         """Find or create a Favourite collection for a user."""
         if collection_id:
@@ -156,7 +190,8 @@ class RecipeEngagementService:
             collection_name=collection_name,
         )
         is_saved_now, new_count = self.toggle_save(favourite, recipe)
-        RecipePost.objects.filter(id=recipe.id).update(saved_count=new_count)
+        # saved_count is part of the API representation, so its Last-Modified moves with it.
+        RecipePost.objects.filter(id=recipe.id).update(saved_count=new_count, updated_at=timezone.now())
         collection = {
             "id": str(favourite.id),
             "name": favourite.name,
@@ -176,27 +211,75 @@ class RecipeEngagementService:
 
     def saved_posts_for_user(self, user):
         """List all unique recipes saved by the given user (most recent first)."""
-        favourite_items = (
-            FavouriteItem.objects.filter(favourite__user=user)
-            .select_related("recipe_post")
-            .order_by("-added_at")
+        return self.saved_posts_page(user, limit=None)[0]
+
+    def saved_posts_page(self, user, after=None, limit=SAVED_POSTS_PAGE_SIZE):
+        """Return (posts, next_cursor) for the user's saved recipes, most recently saved first.
+
+        Saves are grouped per recipe with MAX(added_at) in the database, posts
+        the user can no longer see are dropped, and pages are keyset-paginated
+        on (last saved time, post id) so the next page never rescans earlier ones.
+        """
+        rows = self._saved_rows(user)
+        position = parse_saved_cursor(after)
+        if position is not None:
+            saved_at, post_id = position
+            rows = rows.filter(Q(last_saved_at__lt=saved_at) | Q(last_saved_at=saved_at, recipe_post_id__lt=post_id))
+        rows = list(rows if limit is None else rows[:limit + 1])
+        has_more = limit is not None and len(rows) > limit
+        rows = rows[:limit] if has_more else rows
+        posts = RecipePost.objects.filter(id__in=[row["recipe_post_id"] for row in rows]).prefetch_related("images")
+        posts_by_id = {post.id: post for post in posts}
+        ordered = [posts_by_id[row["recipe_post_id"]] for row in rows if row["recipe_post_id"] in posts_by_id]
+        next_cursor = saved_cursor(rows[-1]["last_saved_at"], rows[-1]["recipe_post_id"]) if has_more else None
+        return ordered, next_cursor
+
+    def collections_modal_state(self, user, recipe, query="", page=1, page_size=COLLECTIONS_MODAL_PAGE_SIZE):
+        """Return one page of the save modal's collection rows for a recipe."""
+        return self.collections_modal_page(user, recipe, query=query, page=page, page_size=page_size)[0]
+
+    def collections_modal_page(self, user, recipe, query="", page=1, page_size=COLLECTIONS_MODAL_PAGE_SIZE):
+        """Return (rows, has_more) for the save modal, collections holding the recipe first.
+
+        Counts, last save times and the saved flag come from one aggregated
+        query filtered by name; thumbnails for the page are loaded together.
+        """
+        start = (max(1, page) - 1) * page_size
+        favourites = list(self._modal_favourites(user, recipe, query)[start:start + page_size + 1])
+        has_more = len(favourites) > page_size
+        favourites = favourites[:page_size]
+        thumb_posts = self._thumb_posts(favourites)
+        return [self._collection_entry(fav, recipe, thumb_posts) for fav in favourites], has_more
+
+    def detail_version(self, recipe, user):
+        """Return what recipe_detail shows beyond the recipe row itself, in four small queries.
+
+        Covers like and comment counts, the newest commenter profile edit, the
+        viewer's like/save/follow state and the save modal's collections, so an
+        ETag can be built before the page context.
+        """
+        likes = Like.objects.filter(recipe_post=recipe).aggregate(
+            total=Count("id"), mine=Count("id", filter=Q(user=user))
+        )
+        comments = Comment.objects.filter(recipe_post=recipe, is_hidden=False).aggregate(
+            total=Count("id"), latest=Max("created_at"), authors=Max("user__updated_at")
+        )
+        saves = FavouriteItem.objects.filter(Q(recipe_post=recipe) | Q(favourite__user=user)).aggregate(
+            here=Count("id", filter=Q(recipe_post=recipe)),
+            mine=Count("id", filter=Q(favourite__user=user)),
+            mine_latest=Max("added_at", filter=Q(favourite__user=user)),
+        )
+        collections = Favourite.objects.filter(user=user).order_by("id").values_list("id", "name")
+        return (
+            likes["total"],
+            likes["mine"],
+            comments["total"],
+            comments["latest"],
+            comments["authors"],
+            *saves.values(),
+            *collections,
+            self.social_graph.is_following(user, recipe.author_id),
         )
-
-        seen_ids = set()
-        posts = []
-        for item in favourite_items:
-            post = self._valid_saved_post(item, seen_ids)
-            if not post:
-                continue
-            posts.append(post)
-        return posts
-
-    def collections_modal_state(self, user, recipe):
-        """Build modal-friendly collection metadata for a user and target recipe."""
-        collections = [self._collection_entry(fav, recipe) for fav in self._favourites_for(user)]
-        collections.sort(key=lambda c: c.get("last_saved_at") or c.get("created_at"), reverse=True)
-        collections.sort(key=lambda c: 0 if c.get("saved") else 1)
-        return collections
 
     def user_reactions(self, request_user, recipe):
         """Return flags and counts for likes/saves and following for the current user."""
@@ -205,10 +288,7 @@ class RecipeEngagementService:
             favourite__user=request_user,
             recipe_post=recipe,
         ).exists()
-        is_following_author = Follower.objects.filter(
-            follower=request_user,
-            author=recipe.author,
-        ).exists()
+        is_following_author = self.social_graph.is_following(request_user, recipe.author_id)
         likes_count = Like.objects.filter(recipe_post=recipe).count()
         saves_count = FavouriteItem.objects.filter(recipe_post=recipe).count()
         return {
@@ -219,54 +299,55 @@ class RecipeEngagementService:
             "saves_count": saves_count,
         }
 
-    def _favourites_for(self, user):
-        """Return all Favourite collections for a user with prefetched items and cover posts."""
-        return Favourite.objects.filter(user=user).prefetch_related("items__recipe_post", "cover_post")
+    def _saved_rows(self, user):
+        """One row per saved recipe visible to the user, with its latest save time."""
+        visible = self.privacy_service.filter_visible_posts(RecipePost.objects.all(), user).values("id")
+        return (
+            FavouriteItem.objects.filter(favourite__user=user, recipe_post_id__in=visible)
+            .values("recipe_post_id")
+            .annotate(last_saved_at=Max("added_at"))
+            .order_by("-last_saved_at", "-recipe_post_id")
+        )
 
-    def _collection_entry(self, fav, recipe):
+    def _modal_favourites(self, user, recipe, query=""):
+        """Favourites annotated with item count, last save time, saved flag and latest saved post."""
+        items = FavouriteItem.objects.filter(favourite=OuterRef("pk"))
+        favourites = Favourite.objects.filter(user=user)
+        query = (query or "").strip()
+        if query:
+            favourites = favourites.filter(name__icontains=query)
+        return favourites.annotate(
+            item_count=Count("items"),
+            last_saved_at=Greatest(Coalesce(Max("items__added_at"), F("created_at")), F("created_at")),
+            saved=Exists(items.filter(recipe_post=recipe)),
+            latest_post_id=Subquery(
+                items.order_by("-added_at", "-id").values("recipe_post_id")[:1], output_field=UUIDField()
+            ),
+        ).order_by("-saved", "-last_saved_at", "name")
+
+    def _thumb_posts(self, favourites):
+        """Load cover and latest saved posts for a page of favourites in one query."""
+        post_ids = {fav.cover_post_id for fav in favourites} | {fav.latest_post_id for fav in favourites}
+        post_ids.discard(None)
+        if not post_ids:
+            return {}
+        return {post.id: post for post in RecipePost.objects.filter(id__in=post_ids).prefetch_related("images")}
+
+    def _collection_entry(self, fav, recipe, thumb_posts):
         """Build a dictionary entry representing a collection's state relative to a recipe."""
-        items = list(fav.items.all())
-        saved_here = any(item.recipe_post_id == recipe.id for item in items)
-        cover_post = fav.cover_post or self._first_item_post(items)
-        fallback_cover = recipe if saved_here else self._first_item_post(items)
+        latest_post = thumb_posts.get(fav.latest_post_id)
+        cover_post = thumb_posts.get(fav.cover_post_id) or latest_post
+        fallback_cover = recipe if fav.saved else latest_post
         return {
             "id": str(fav.id),
             "name": fav.name,
-            "saved": saved_here,
-            "count": len(items),
+            "saved": fav.saved,
+            "count": fav.item_count,
             "thumb_url": self.collection_thumb(cover_post, fallback_cover),
-            "last_saved_at": self._last_saved_at(items, fav.created_at),
+            "last_saved_at": fav.last_saved_at,
             "created_at": fav.created_at,
         }
 
-    def _first_item_post(self, items):
-        """Return the first recipe post found in a list of FavouriteItems, or None."""
-        for item in items:
-            if item.recipe_post:
-                return item.recipe_post
-        return None
-
-    def _last_saved_at(self, items, default):
-        """Find the most recent added_at timestamp from items, or return default."""
-        latest = default
-        for item in items:
-            latest = self._maybe_update_latest(latest, getattr(item, "added_at", None))
-        return latest
-
-    def _valid_saved_post(self, item, seen_ids):
-        post = getattr(item, "recipe_post", None)
-        if not post or post.id in seen_ids:
-            return None
-        seen_ids.add(post.id)
-        return post
-
-    def _maybe_update_latest(self, current, added_at):
-        if not added_at:
-            return current
-        if current is None or added_at > current:
-            return added_at
-        return current
-
 
 class RecipePostService:
     """
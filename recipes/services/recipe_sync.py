@@ -0,0 +1,164 @@
+"""Delta sync for offline clients, read from the recipe_change log."""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from recipes.models import Like, RecipeChange, RecipePost
+from recipes.repos.post_repo import PostRepo
+from recipes.services.privacy import PrivacyService
+
+SYNC_BATCH_LIMIT = 1000
+
+
+def parse_sync_token(token):
+    """Return the change id encoded in a sync token, or None when missing or malformed."""
+    try:
+        value = int(token)
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+class RecipeSyncService:
+    """Record recipe changes and replay them per viewer.
+
+    Tokens are change ids, so a sync reads only the rows written since the
+    client's token. Ids are handed out before their transaction commits, so
+    rows younger than RECIPE_SYNC_COMMIT_LAG are held back until any lower id
+    still in flight has landed. A missing, pruned or future token, or a change
+    to who the viewer may see, answers with reset=True and the client refetches
+    its lists.
+    """
+
+    def __init__(self, privacy_service=None, post_repo=None):
+        self.privacy_service = privacy_service or PrivacyService()
+        self.post_repo = post_repo or PostRepo()
+
+    def record(self, kind, recipe_post_id):
+        """Log one change to a recipe."""
+        RecipeChange.objects.create(kind=kind, recipe_post_id=recipe_post_id)
+
+    def record_engagement(self, recipe_post_id):
+        """Log that a recipe's counters moved, replacing its previous engagement row.
+
+        Counters are read live when a client syncs, so a single row at the
+        newest id reaches every token older than it and the log keeps at most
+        one engagement row per recipe however busy it is.
+        """
+        RecipeChange.objects.filter(kind=RecipeChange.KIND_ENGAGEMENT, recipe_post_id=recipe_post_id).delete()
+        self.record(RecipeChange.KIND_ENGAGEMENT, recipe_post_id)
+
+    def record_updated_for_author(self, author_id):
+        """Log an update for every recipe by author_id, e.g. after their profile privacy flips."""
+        for post_ids in self.post_repo.iter_batches(filters={"author_id": author_id}):
+            RecipeChange.objects.bulk_create(
+                [RecipeChange(kind=RecipeChange.KIND_UPDATED, recipe_post_id=post_id) for post_id in post_ids]
+            )
+
+    def record_audience(self, *user_ids):
+        """Log that the given viewers' visible sets changed (follows, close friends)."""
+        RecipeChange.objects.bulk_create(
+            [RecipeChange(kind=RecipeChange.KIND_AUDIENCE, user_id=user_id) for user_id in user_ids]
+        )
+
+    def latest_token(self):
+        """Return the token a client should hold after a full refetch."""
+        return str(self._settled_id())
+
+    def changes_since(self, user, token, limit=SYNC_BATCH_LIMIT):
+        """Return created/updated/deleted recipe ids and fresh counters visible to user since token."""
+        since = parse_sync_token(token)
+        newest = RecipeChange.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        latest = self._settled_id()
+        if since is None or since > newest or since < self._floor():
+            return self._reset(latest)
+        rows = list(
+            RecipeChange.objects.filter(id__gt=since, id__lte=latest)
+            .filter(Q(recipe_post_id__isnull=False) | Q(user_id=user.pk))
+            .order_by("id")
+            .values_list("id", "kind", "recipe_post_id")[: limit + 1]
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if any(kind == RecipeChange.KIND_AUDIENCE for _, kind, _ in rows):
+            return self._reset(latest)
+        states = self._collapse(rows)
+        visible = self._visible_counters(user, [post_id for post_id, state in states.items() if state != RecipeChange.KIND_DELETED])
+        payload = {"created": [], "updated": [], "deleted": [], "counters": {}}
+        for post_id, state in states.items():
+            if post_id not in visible:
+                if state in (RecipeChange.KIND_DELETED, RecipeChange.KIND_UPDATED):
+                    payload["deleted"].append(post_id)
+                continue
+            if state != RecipeChange.KIND_ENGAGEMENT:
+                payload[state].append(post_id)
+            payload["counters"][str(post_id)] = visible[post_id]
+        return {
+            **payload,
+            "reset": False,
+            "has_more": has_more,
+            "next": str(rows[-1][0] if rows else since),
+        }
+
+    def prune(self, before):
+        """Delete changes older than before, always keeping the newest row; return rows deleted."""
+        newest = RecipeChange.objects.order_by("-id").values_list("id", flat=True).first()
+        deleted, _ = RecipeChange.objects.filter(created_at__lt=before).exclude(id=newest).delete()
+        return deleted
+
+    def _collapse(self, rows):
+        """Reduce a run of changes to one state per recipe, in order of first appearance."""
+        states = {}
+        for _, kind, post_id in rows:
+            previous = states.get(post_id)
+            if kind == RecipeChange.KIND_ENGAGEMENT:
+                states.setdefault(post_id, kind)
+            elif kind == RecipeChange.KIND_UPDATED and previous == RecipeChange.KIND_CREATED:
+                continue
+            else:
+                states[post_id] = kind
+        return states
+
+    def _visible_counters(self, user, post_ids):
+        """Return {post_id: counters} for the post_ids the user may still see."""
+        if not post_ids:
+            return {}
+        qs = self.privacy_service.filter_visible_posts(RecipePost.objects.filter(pk__in=post_ids), user)
+        rows = list(qs.values_list("id", "saved_count", "comments_count"))
+        likes = dict(
+            Like.objects.filter(recipe_post_id__in=[row[0] for row in rows])
+            .values("recipe_post_id")
+            .annotate(total=Count("id"))
+            .values_list("recipe_post_id", "total")
+        )
+        return {
+            post_id: {"likes": likes.get(post_id, 0), "saved": saved, "comments": comments}
+            for post_id, saved, comments in rows
+        }
+
+    def _settled_id(self):
+        """Newest change id past the commit-lag window; later ids may sit behind open transactions."""
+        horizon = timezone.now() - timedelta(seconds=getattr(settings, "RECIPE_SYNC_COMMIT_LAG", 0))
+        return (
+            RecipeChange.objects.filter(created_at__lte=horizon).order_by("-id").values_list("id", flat=True).first()
+            or 0
+        )
+
+    def _floor(self):
+        """Oldest token still answerable: anything before the first retained change was pruned."""
+        oldest = RecipeChange.objects.order_by("id").values_list("id", flat=True).first()
+        return oldest - 1 if oldest else 0
+
+    def _reset(self, latest):
+        return {
+            "created": [],
+            "updated": [],
+            "deleted": [],
+            "counters": {},
+            "reset": True,
+            "has_more": False,
+            "next": str(latest),
+        }
@@ -1,61 +1,109 @@
-"""Service helpers for shoppable ingredient items."""
+"""Service helpers for shoppable products."""
 
 import hashlib
+from dataclasses import dataclass
+
 from django.core.paginator import Paginator
-from django.db.models import Q
-from recipes.models import Ingredient, RecipePost
+from django.db.models import Count, Max, Q
+from recipes.models import Ingredient, ShopItem, ShopItemWord
+from recipes.pagination import PeekPaginator
 from recipes.services import PrivacyService
+from recipes.utils.ingredient_names import normalise_ingredient_name
+from recipes.utils.search_terms import search_words
+
+
+@dataclass(frozen=True)
+class ShopCard:
+    """One product as a given viewer sees it, built only from ingredients they may see."""
+
+    name: str
+    url: str
+    image: object
+    recipe_post: object
+    recipe_count: int
 
 
 class ShopService:
-    """Encapsulate visibility, shuffling, and pagination of shop items."""
+    """Encapsulate visibility, shuffling, and pagination of shop products.
+
+    Listing and search read the shop_item table and collapse the viewer's
+    visible rows to one card per product; ingredients are loaded only for the
+    page being rendered.
+    """
 
     def __init__(self, privacy_service=None):
         self.privacy_service = privacy_service or PrivacyService()
 
     def visible_items(self, user):
-        """Return Ingredient queryset limited to items with shop links visible to the user."""
-        items_qs = Ingredient.objects.filter(
-            Q(shop_url__isnull=False) & ~Q(shop_url__regex=r'^\s*$')
-        ).select_related("recipe_post")
+        """Return ShopItem queryset limited to items with shop links visible to the user."""
+        return self.privacy_service.filter_visible_shop_items(ShopItem.objects.filter(has_shop_url=True), user)
 
-        visible_posts = self.privacy_service.filter_visible_posts(
-            RecipePost.objects.filter(
-                id__in=items_qs.values_list("recipe_post_id", flat=True).distinct()
-            ),
-            user,
-        ).values_list("id", flat=True)
+    def visible_products(self, items):
+        """Collapse shop items to (product_id, latest item, latest item with an image, recipe count) rows, newest first."""
+        has_image = Q(ingredient__shop_image_upload__isnull=False) & ~Q(ingredient__shop_image_upload="")
+        return (
+            items.filter(product__isnull=False)
+            .values("product_id")
+            .annotate(
+                latest=Max("ingredient_id"),
+                latest_image=Max("ingredient_id", filter=has_image),
+                recipes=Count("recipe_post", distinct=True),
+            )
+            .order_by("-latest")
+            .values_list("product_id", "latest", "latest_image", "recipes")
+        )
 
-        return items_qs.filter(recipe_post_id__in=visible_posts)
+    def products_for(self, rows):
+        """Build ShopCards for visible_products rows, in order."""
+        wanted = {row[1] for row in rows} | {row[2] for row in rows if row[2]}
+        ingredients = Ingredient.objects.select_related("recipe_post").in_bulk(wanted)
+        cards = []
+        for _, latest, latest_image, recipes in rows:
+            ingredient = ingredients.get(latest)
+            if ingredient is None:
+                continue
+            pictured = ingredients.get(latest_image)
+            cards.append(
+                ShopCard(
+                    name=ingredient.name,
+                    url=ingredient.shop_url,
+                    image=pictured.shop_image_upload if pictured else None,
+                    recipe_post=ingredient.recipe_post,
+                    recipe_count=recipes,
+                )
+            )
+        return cards
 
     def paginated_shuffled_items(self, user, seed, page_number):
-        """Shuffle shop items deterministically by seed and return the paginated page."""
-        items_qs = self.visible_items(user)
-        item_ids = list(items_qs.values_list("id", flat=True))
-        shuffled_ids = sorted(
-            item_ids, key=lambda pk: hashlib.sha256(f"{seed}-{pk}".encode("utf-8")).hexdigest()
+        """Shuffle visible products deterministically by seed and return the paginated page."""
+        rows = list(self.visible_products(self.visible_items(user)))
+        shuffled = sorted(
+            rows, key=lambda row: hashlib.sha256(f"{seed}-{row[0]}".encode("utf-8")).hexdigest()
         )
 
-        paginator = Paginator(shuffled_ids, 24)
+        paginator = Paginator(shuffled, 24)
         page_obj = paginator.get_page(page_number or 1)
-
-        current_ids = list(page_obj.object_list)
-        if not current_ids:  # pragma: no cover - empty page fallback
-            page_obj.object_list = []
-            return page_obj
-
-        id_positions = {pk: idx for idx, pk in enumerate(current_ids)}
-        current_items = sorted(
-            items_qs.filter(id__in=current_ids),
-            key=lambda obj: id_positions.get(obj.id, 0),
-        )
-        page_obj.object_list = current_items
+        page_obj.object_list = self.products_for(list(page_obj.object_list))
         return page_obj
 
     def search_items_page(self, user, query, page_number, page_size=24):
-        """Return paginated, filtered shop items visible to the user."""
-        qs = self.visible_items(user).order_by("-id")
+        """Return paginated products visible to the user whose ingredient names match query.
+
+        An item matches when every query word prefixes one of its name words, or
+        when the query names the item's canonical term. Both go through indexes,
+        so text in the middle of a word ("ugar") is not found.
+        """
+        items = self.visible_items(user)
         if query:
-            qs = qs.filter(Q(name__icontains=query)).distinct()
-        paginator = Paginator(qs, page_size)
-        return paginator.get_page(page_number)
+            items = items.filter(self._word_match(search_words(query)) | Q(term__name=normalise_ingredient_name(query)))
+        page_obj = PeekPaginator(self.visible_products(items), page_size).get_page(page_number)
+        page_obj.object_list = self.products_for(list(page_obj.object_list))
+        return page_obj
+
+    def _word_match(self, words):
+        if not words:
+            return Q(pk__in=[])
+        match = Q()
+        for word in words:
+            match &= Q(pk__in=ShopItemWord.objects.filter(word__gte=word, word__lt=word + "\uffff").values("item_id"))
+        return match
@@ -0,0 +1,78 @@
+"""Maintenance of the shop_item read model."""
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from recipes.db_accessor import DB_Accessor
+from recipes.models import Ingredient, ShopItem, ShopItemWord
+from recipes.utils.search_terms import search_words
+
+SOURCE_FIELDS = (
+    "id",
+    "recipe_post_id",
+    "recipe_post__author_id",
+    "name",
+    "term_id",
+    "product_id",
+    "shop_url",
+    "recipe_post__visibility",
+    "recipe_post__author__is_private",
+)
+
+
+def shop_item_from_row(row):
+    """Build an unsaved ShopItem from a SOURCE_FIELDS values row."""
+    ingredient_id, post_id, author_id, name, term_id, product_id, shop_url, visibility, author_is_private = row
+    return ShopItem(
+        ingredient_id=ingredient_id,
+        recipe_post_id=post_id,
+        author_id=author_id,
+        name=name,
+        term_id=term_id,
+        product_id=product_id,
+        has_shop_url=bool((shop_url or "").strip()),
+        visibility=visibility,
+        author_is_private=author_is_private,
+    )
+
+
+def shop_item_words(item):
+    """Build unsaved ShopItemWord rows indexing each word of a shop item's name."""
+    return [ShopItemWord(item_id=item.ingredient_id, word=word) for word in set(search_words(item.name))]
+
+
+class ShopCatalogueService:
+    """Keep shop_item and its name words in step with ingredients, their posts and the posts' authors."""
+
+    def __init__(self, ingredient_accessor=None):
+        self.ingredients = ingredient_accessor or DB_Accessor(Ingredient)
+
+    @transaction.atomic
+    def sync_ingredients(self, ingredient_ids=None, batch_size=1000):
+        """Rebuild rows for the given ingredients (all when None); return rows written."""
+        stale = ShopItem.objects.all()
+        filters = None
+        if ingredient_ids is not None:
+            stale = stale.filter(ingredient_id__in=ingredient_ids)
+            filters = {"id__in": ingredient_ids}
+        stale.delete()
+        written = 0
+        for batch in self.ingredients.iter_batches(batch_size, fields=SOURCE_FIELDS, filters=filters):
+            items = ShopItem.objects.bulk_create([shop_item_from_row(row) for row in batch])
+            ShopItemWord.objects.bulk_create([word for item in items for word in shop_item_words(item)])
+            written += len(items)
+        return written
+
+    def sync_post(self, post):
+        """Copy a post's visibility and author onto its shop rows."""
+        ShopItem.objects.filter(recipe_post_id=post.pk).update(visibility=post.visibility, author_id=post.author_id)
+
+    def sync_author(self, author_id, is_private):
+        """Record an author's profile privacy on all of their shop rows."""
+        ShopItem.objects.filter(author_id=author_id).update(author_is_private=is_private)
+
+    def sync_terms(self):
+        """Re-copy ingredient terms after bulk term updates; return rows updated."""
+        return ShopItem.objects.update(
+            term_id=Subquery(Ingredient.objects.filter(pk=OuterRef("ingredient_id")).values("term_id")[:1])
+        )
@@ -0,0 +1,192 @@
+"""Maintenance of the deduplicated shop product catalogue."""
+
+import hashlib
+import os
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from recipes.db_accessor import DB_Accessor
+from recipes.models import Ingredient, ShopProduct
+from recipes.utils.shop_urls import normalise_shop_url
+
+PRODUCT_IMAGE_DIR = "shop_products"
+UPLOAD_DIR = "shop_items"
+# Uploads younger than this may belong to a save that has not committed yet.
+ORPHAN_MIN_AGE = timedelta(hours=1)
+
+
+class ShopProductService:
+    """Link ingredients to one ShopProduct per normalised shop URL.
+
+    Each product keeps a reference count of the ingredients pointing at it and
+    is deleted when the last one goes. Uploaded shop images are stored once per
+    distinct content: files are named by their SHA-256, and an ingredient's own
+    upload is re-pointed at the shared copy. The originals left behind are only
+    removed by delete_orphaned_uploads (run from rebuild_shop_catalogue).
+    Products only group ingredients; what a viewer sees is taken from
+    ingredients they may see (see ShopService).
+    """
+
+    def __init__(self, storage=None, ingredient_accessor=None):
+        self.storage = storage or default_storage
+        self.ingredients = ingredient_accessor or DB_Accessor(Ingredient)
+
+    @transaction.atomic
+    def attach(self, ingredient):
+        """Point a saved ingredient at the product for its shop URL; return the product or None."""
+        key = normalise_shop_url(ingredient.shop_url)
+        product = self._product_for(key, ingredient.shop_url, ingredient.name) if key else None
+        new_id = product.pk if product else None
+        old_id = ingredient.product_id
+        if new_id != old_id:
+            Ingredient.objects.filter(pk=ingredient.pk).update(product_id=new_id)
+            ingredient.product_id = new_id
+            if new_id:
+                ShopProduct.objects.filter(pk=new_id).update(ingredient_count=F("ingredient_count") + 1)
+            self._release(old_id)
+        if product and ingredient.shop_image_upload:
+            self._share_image(ingredient, product)
+        return product
+
+    @transaction.atomic
+    def attach_many(self, ingredient_ids):
+        """Point a batch of saved ingredients at their products; return how many were re-linked."""
+        ingredients = list(
+            Ingredient.objects.filter(pk__in=ingredient_ids).only("id", "name", "shop_url", "shop_image_upload", "product")
+        )
+        rows = [(ingredient, normalise_shop_url(ingredient.shop_url)) for ingredient in ingredients]
+        first_seen = {key: ingredient for ingredient, key in reversed(rows) if key}
+        ShopProduct.objects.bulk_create(
+            [ShopProduct(url_key=key, url=item.shop_url.strip(), name=item.name) for key, item in first_seen.items()],
+            ignore_conflicts=True,
+        )
+        products = {product.url_key: product for product in ShopProduct.objects.filter(url_key__in=first_seen)}
+        moved, gained, released = defaultdict(list), Counter(), []
+        for ingredient, key in rows:
+            product = products.get(key)
+            new_id = product.pk if product else None
+            if new_id == ingredient.product_id:
+                continue
+            moved[new_id].append(ingredient.pk)
+            if new_id:
+                gained[new_id] += 1
+            released.append(ingredient.product_id)
+            ingredient.product_id = new_id
+        for product_id, ids in moved.items():
+            Ingredient.objects.filter(pk__in=ids).update(product_id=product_id)
+        for product_id, count in gained.items():
+            ShopProduct.objects.filter(pk=product_id).update(ingredient_count=F("ingredient_count") + count)
+        for product_id in released:
+            self._release(product_id)
+        for ingredient, key in rows:
+            if key in products and ingredient.shop_image_upload:
+                self._share_image(ingredient, products[key])
+        return sum(len(ids) for ids in moved.values())
+
+    def detach(self, ingredient):
+        """Drop a deleted ingredient's reference to its product."""
+        self._release(ingredient.product_id)
+
+    @transaction.atomic
+    def rebuild(self, batch_size=1000):
+        """Re-link every ingredient and recount references; return the number of products kept."""
+        for batch in self.ingredients.iter_batches(batch_size, fields=("id", "name", "shop_url")):
+            rows = [(pk, name, url, normalise_shop_url(url)) for pk, name, url in batch]
+            keys = {key: (url, name) for _, name, url, key in reversed(rows) if key}
+            ShopProduct.objects.bulk_create(
+                [ShopProduct(url_key=key, url=url.strip(), name=name) for key, (url, name) in keys.items()],
+                ignore_conflicts=True,
+            )
+            product_ids = dict(ShopProduct.objects.filter(url_key__in=keys).values_list("url_key", "id"))
+            ids_by_product = defaultdict(list)
+            for pk, _, _, key in rows:
+                ids_by_product[product_ids.get(key)].append(pk)
+            for product_id, ingredient_ids in ids_by_product.items():
+                Ingredient.objects.filter(pk__in=ingredient_ids).update(product_id=product_id)
+        references = (
+            Ingredient.objects.filter(product_id=OuterRef("pk"))
+            .values("product_id")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        ShopProduct.objects.update(ingredient_count=Coalesce(Subquery(references), Value(0)))
+        ShopProduct.objects.filter(ingredient_count=0).delete()
+        imageless = Q(product__image__isnull=True) | Q(product__image="")
+        with_upload = Ingredient.objects.filter(imageless, shop_image_upload__gt="").select_related("product")
+        for ingredient in with_upload.order_by("pk"):
+            if not ingredient.product.image:
+                self._share_image(ingredient, ingredient.product)
+        return ShopProduct.objects.count()
+
+    def delete_orphaned_uploads(self, min_age=ORPHAN_MIN_AGE):
+        """Delete ingredient uploads no row points at any more; return how many were removed.
+
+        Sharing re-points ingredients at the content-addressed copy and leaves
+        their original upload behind. Files newer than min_age are kept.
+        """
+        try:
+            _, files = self.storage.listdir(UPLOAD_DIR)
+        except FileNotFoundError:
+            return 0
+        referenced = set(
+            Ingredient.objects.filter(shop_image_upload__startswith=f"{UPLOAD_DIR}/").values_list(
+                "shop_image_upload", flat=True
+            )
+        )
+        cutoff = timezone.now() - min_age
+        removed = 0
+        for name in sorted(f"{UPLOAD_DIR}/{file}" for file in files):
+            if name in referenced or self.storage.get_modified_time(name) > cutoff:
+                continue
+            self.storage.delete(name)
+            removed += 1
+        return removed
+
+    def store_image(self, file):
+        """Save file under its content hash unless that content is already stored; return (name, digest)."""
+        digest = hashlib.sha256()
+        file.open("rb")
+        try:
+            for chunk in file.chunks():
+                digest.update(chunk)
+            digest = digest.hexdigest()
+            extension = os.path.splitext(file.name)[1].lower()
+            name = f"{PRODUCT_IMAGE_DIR}/{digest[:2]}/{digest}{extension}"
+            if not self.storage.exists(name):
+                file.seek(0)
+                name = self.storage.save(name, file)
+        finally:
+            file.close()
+        return name, digest
+
+    def _product_for(self, key, url, name):
+        product, _ = ShopProduct.objects.get_or_create(url_key=key, defaults={"url": url.strip(), "name": name})
+        return product
+
+    def _release(self, product_id):
+        if product_id is None:
+            return
+        ShopProduct.objects.filter(pk=product_id, ingredient_count__gt=0).update(
+            ingredient_count=F("ingredient_count") - 1
+        )
+        ShopProduct.objects.filter(pk=product_id, ingredient_count=0).delete()
+
+    def _share_image(self, ingredient, product):
+        upload = ingredient.shop_image_upload
+        if upload.name.startswith(f"{PRODUCT_IMAGE_DIR}/"):
+            shared, digest = upload.name, os.path.splitext(os.path.basename(upload.name))[0]
+        else:
+            shared, digest = self.store_image(upload)
+            Ingredient.objects.filter(pk=ingredient.pk).update(shop_image_upload=shared)
+            upload.name = shared
+        if not product.image:
+            product.image, product.image_hash = shared, digest
+            ShopProduct.objects.filter(Q(image__isnull=True) | Q(image=""), pk=product.pk).update(
+                image=shared, image_hash=digest
+            )
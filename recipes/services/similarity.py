@@ -0,0 +1,156 @@
+"""Offline item-to-item similarity index backing the "view similar" section."""
+
+import math
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.urls import reverse
+
+from recipes.models import Ingredient, Like, RecipePost, SimilarRecipe
+from recipes.services.privacy import PrivacyService
+
+DEFAULT_TOP_K = 12
+CO_LIKE_WEIGHT = 0.5
+# Tokens shared by more posts than this are too common to discriminate (e.g. "salt").
+MAX_TOKEN_POSTS = 500
+# Cap likes per user so a single heavy liker cannot dominate the pair counts.
+MAX_LIKES_PER_USER = 200
+PLACEHOLDER_IMAGE = "https://placehold.co/800x1000/0f0f14/ffffff?text=Recipe"
+
+
+class SimilarityService:
+    """Compute and read the top-K similar recipe table."""
+
+    def __init__(self, privacy_service=None, top_k=DEFAULT_TOP_K):
+        self.privacy_service = privacy_service or PrivacyService()
+        self.top_k = top_k
+
+    def candidate_posts(self):
+        """Return posts eligible to appear in the similarity index."""
+        return RecipePost.objects.filter(published_at__isnull=False, is_hidden=False)
+
+    def feature_sets(self, post_ids):
+        """Return {post_id: set(tokens)} built from category, tags and ingredient terms."""
+        features = defaultdict(set)
+        rows = self.candidate_posts().filter(id__in=post_ids).values_list("id", "category", "tags")
+        for post_id, category, tags in rows:
+            features[post_id].update(self._post_tokens(category, tags))
+        ingredient_rows = Ingredient.objects.filter(recipe_post_id__in=post_ids).values_list(
+            "recipe_post_id", "term_id", "name"
+        )
+        for post_id, term_id, name in ingredient_rows:
+            if term_id:
+                features[post_id].add(f"i:{term_id}")
+            elif name:
+                features[post_id].add(f"i:{name.strip().lower()}")
+        return features
+
+    def co_like_counts(self, post_ids):
+        """Return ({(a, b): shared_likers}, {post_id: like_total}) for posts liked by the same users."""
+        likes_by_user = defaultdict(list)
+        rows = Like.objects.filter(recipe_post_id__in=post_ids).order_by("user_id", "-id").values_list(
+            "user_id", "recipe_post_id"
+        )
+        for user_id, post_id in rows:
+            if len(likes_by_user[user_id]) < MAX_LIKES_PER_USER:
+                likes_by_user[user_id].append(post_id)
+        pair_counts = Counter()
+        like_totals = Counter()
+        for liked in likes_by_user.values():
+            like_totals.update(liked)
+            for idx, left in enumerate(liked):
+                for right in liked[idx + 1:]:
+                    pair_counts[(left, right)] += 1
+                    pair_counts[(right, left)] += 1
+        return pair_counts, like_totals
+
+    def compute_neighbours(self, post_ids=None):
+        """Return {post_id: [(similar_id, score), ...]} ranked by combined score."""
+        if post_ids is None:
+            post_ids = list(self.candidate_posts().values_list("id", flat=True))
+        features = self.feature_sets(post_ids)
+        pair_counts, like_totals = self.co_like_counts(post_ids)
+        scores = self._content_scores(features)
+        for (left, right), shared in pair_counts.items():
+            denom = math.sqrt(like_totals[left] * like_totals[right]) or 1
+            scores[left][right] += CO_LIKE_WEIGHT * shared / denom
+        return {post_id: self._top_k(candidates) for post_id, candidates in scores.items()}
+
+    @transaction.atomic
+    def rebuild(self):
+        """Recompute the neighbour table from scratch; return the number of rows written."""
+        neighbours = self.compute_neighbours()
+        SimilarRecipe.objects.all().delete()
+        rows = [
+            SimilarRecipe(recipe_post_id=post_id, similar_post_id=similar_id, score=score, rank=rank)
+            for post_id, ranked in neighbours.items()
+            for rank, (similar_id, score) in enumerate(ranked, start=1)
+        ]
+        SimilarRecipe.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    def similar_posts(self, recipe, viewer, limit=6):
+        """Return neighbour posts for a recipe visible to the viewer, in rank order."""
+        rows = (
+            self._visible_neighbours(recipe, viewer)
+            .select_related("similar_post")
+            .prefetch_related("similar_post__images")[:limit]
+        )
+        return [row.similar_post for row in rows]
+
+    def similar_version(self, recipe, viewer, limit=6):
+        """Return (id, updated_at) of the neighbours similar_posts would show, for ETags."""
+        return tuple(
+            self._visible_neighbours(recipe, viewer).values_list("similar_post_id", "similar_post__updated_at")[:limit]
+        )
+
+    def _visible_neighbours(self, recipe, viewer):
+        visible_ids = self.privacy_service.filter_visible_posts(self.candidate_posts(), viewer).values("id")
+        return SimilarRecipe.objects.filter(recipe_post=recipe, similar_post_id__in=visible_ids).order_by("rank")
+
+    def view_similar_items(self, recipe, viewer, limit=6):
+        """Return template-ready cards for the post_view_similar partial."""
+        return [
+            {
+                "url": reverse("recipe_detail", args=[post.id]),
+                "title": post.title,
+                "image": post.primary_image_url or PLACEHOLDER_IMAGE,
+                "description": post.description or "",
+            }
+            for post in self.similar_posts(recipe, viewer, limit=limit)
+        ]
+
+    def _post_tokens(self, category, tags):
+        tokens = set()
+        if category:
+            tokens.add(f"c:{category.strip().lower()}")
+        for tag in tags or []:
+            tag = str(tag).strip().lower()
+            if tag and not tag.startswith("category:"):
+                tokens.add(f"t:{tag}")
+        return tokens
+
+    def _content_scores(self, features):
+        """Exact Jaccard over token sets, using an inverted index to skip disjoint pairs."""
+        posts_by_token = defaultdict(list)
+        for post_id, tokens in features.items():
+            for token in tokens:
+                posts_by_token[token].append(post_id)
+        overlaps = defaultdict(Counter)
+        for posts in posts_by_token.values():
+            if len(posts) > MAX_TOKEN_POSTS:
+                continue
+            for left in posts:
+                for right in posts:
+                    if left != right:
+                        overlaps[left][right] += 1
+        scores = defaultdict(lambda: defaultdict(float))
+        for left, shared_counts in overlaps.items():
+            for right, shared in shared_counts.items():
+                union = len(features[left]) + len(features[right]) - shared
+                scores[left][right] = shared / union if union else 0.0
+        return scores
+
+    def _top_k(self, candidates):
+        ranked = sorted(candidates.items(), key=lambda pair: (-pair[1], str(pair[0])))
+        return [(post_id, score) for post_id, score in ranked[: self.top_k] if score > 0]
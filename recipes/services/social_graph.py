@@ -0,0 +1,140 @@
+"""Follow and close-friend adjacency loaded once per request, optionally shared through Django's cache."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from recipes.models import CloseFriend, Follower
+
+# (filter field, returned field) per adjacency direction, on the Follower or CloseFriend table.
+FOLLOW_EDGES = {
+    "following": ("follower", "author_id"),
+    "followers": ("author", "follower_id"),
+}
+CLOSE_FRIEND_EDGES = {
+    "close_friends": ("owner", "friend_id"),
+    "close_friend_of": ("friend", "owner_id"),
+}
+
+_request_memo = ContextVar("social_graph_memo", default=None)
+
+
+@contextmanager
+def request_scope():
+    """Memoise adjacency sets for the duration of one request."""
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+def _user_id(user):
+    return getattr(user, "pk", user)
+
+
+def _version_key(user_id):
+    return f"social_graph:version:{user_id}"
+
+
+def _seed_version():
+    # A version key evicted from the cache must not restart below the stamps it already handed out.
+    return time.time_ns()
+
+
+class SocialGraph:
+    """Answer follow and close-friend questions from per-user id sets.
+
+    Each direction is read with one query the first time it is needed inside a
+    request_scope() and answered from memory afterwards. When
+    SOCIAL_GRAPH_CACHE_TIMEOUT is set the sets are also kept in the shared cache
+    under a per-user version that invalidate() bumps, again once the transaction commits.
+    """
+
+    def __init__(self, follower_model=Follower, close_friend_model=CloseFriend):
+        self.follower_model = follower_model
+        self.close_friend_model = close_friend_model
+
+    def following_ids(self, user):
+        """Return ids of users the given user follows."""
+        return self._ids(user, "following")
+
+    def followers_of(self, user):
+        """Return ids of users who follow the given user."""
+        return self._ids(user, "followers")
+
+    def close_friend_ids(self, user):
+        """Return ids of users on the given user's close friends list."""
+        return self._ids(user, "close_friends")
+
+    def mutuals(self, user):
+        """Return ids of users who both follow and are followed by the given user."""
+        return self.following_ids(user) & self.followers_of(user)
+
+    def is_following(self, viewer, author):
+        """Return True if viewer follows author."""
+        return _user_id(author) in self.following_ids(viewer)
+
+    def is_close_friend(self, viewer, author):
+        """Return True if viewer is on author's close friends list."""
+        return _user_id(author) in self._ids(viewer, "close_friend_of")
+
+    def invalidate(self, *users):
+        """Forget cached adjacency for the given users after their edges change.
+
+        The shared version is bumped now, so later reads in this transaction see
+        the new edges, and again on commit, so sets other requests cached from
+        the pre-commit rows in between are never read.
+        """
+        user_ids = [_user_id(user) for user in users]
+        memo = _request_memo.get()
+        if memo is not None:
+            for key in [key for key in memo if key[0] in user_ids]:
+                del memo[key]
+        if self._cache_timeout():
+            self._bump_versions(user_ids)
+            transaction.on_commit(lambda: self._bump_versions(user_ids))
+
+    def _bump_versions(self, user_ids):
+        for user_id in user_ids:
+            try:
+                cache.incr(_version_key(user_id))
+            except ValueError:
+                cache.add(_version_key(user_id), _seed_version(), None)
+
+    def _ids(self, user, direction):
+        user_id = _user_id(user)
+        memo = _request_memo.get()
+        key = (user_id, direction)
+        if memo is not None and key in memo:
+            return memo[key]
+        ids = self._cached_ids(user_id, direction)
+        if memo is not None:
+            memo[key] = ids
+        return ids
+
+    def _cached_ids(self, user_id, direction):
+        timeout = self._cache_timeout()
+        if not timeout:
+            return self._load(user_id, direction)
+        version = cache.get_or_set(_version_key(user_id), _seed_version, None)
+        cache_key = f"social_graph:{user_id}:{version}:{direction}"
+        ids = cache.get(cache_key)
+        if ids is None:
+            ids = self._load(user_id, direction)
+            cache.set(cache_key, ids, timeout)
+        return ids
+
+    def _load(self, user_id, direction):
+        if direction in FOLLOW_EDGES:
+            model, (filter_field, value_field) = self.follower_model, FOLLOW_EDGES[direction]
+        else:
+            model, (filter_field, value_field) = self.close_friend_model, CLOSE_FRIEND_EDGES[direction]
+        return frozenset(model.objects.filter(**{filter_field: user_id}).values_list(value_field, flat=True))
+
+    def _cache_timeout(self):
+        return getattr(settings, "SOCIAL_GRAPH_CACHE_TIMEOUT", None)
@@ -0,0 +1,176 @@
+"""Friends-of-friends "people you may know" suggestions, rebuilt in batch and patched on follow events."""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from recipes.models import Follower, Like, UserSuggestion
+from recipes.services.social_graph import SocialGraph
+
+DEFAULT_TOP_N = 20
+# Friends-of-friends scored per user before the top-N cut.
+CANDIDATE_LIMIT = 200
+TAG_WEIGHT = 0.25
+# Recent likes sampled per user when comparing liked tags.
+MAX_LIKES_PER_USER = 200
+# Follow events skip any fan-out wider than this and leave it to the batch rebuild.
+MAX_FANOUT = 2000
+# Rows kept per user between rebuilds; follow events trim the lowest scores beyond this.
+MAX_STORED_PER_USER = 5 * DEFAULT_TOP_N
+
+
+class SuggestionService:
+    """Compute, incrementally maintain and read the user_suggestion table."""
+
+    def __init__(self, social_graph=None, top_n=DEFAULT_TOP_N):
+        self.social_graph = social_graph or SocialGraph()
+        self.top_n = top_n
+
+    def compute_for_user(self, user_id):
+        """Return [(suggested_id, mutual_count, shared_tags, score), ...] ranked best first."""
+        followed = Follower.objects.filter(follower_id=user_id).values("author_id")
+        mutuals = dict(
+            Follower.objects.filter(follower_id__in=followed)
+            .exclude(author_id__in=followed)
+            .exclude(author_id=user_id)
+            .values("author_id")
+            .annotate(mutuals=Count("id"))
+            .order_by("-mutuals")
+            .values_list("author_id", "mutuals")[:CANDIDATE_LIMIT]
+        )
+        if not mutuals:
+            return []
+        liked_tags = self.liked_tags([user_id, *mutuals])
+        own_tags = liked_tags.get(user_id, set())
+        scored = []
+        for suggested_id, mutual_count in mutuals.items():
+            shared = len(own_tags & liked_tags.get(suggested_id, set()))
+            scored.append((suggested_id, mutual_count, shared, mutual_count + TAG_WEIGHT * shared))
+        scored.sort(key=lambda row: (-row[3], row[0]))
+        return scored[: self.top_n]
+
+    def liked_tags(self, user_ids):
+        """Return {user_id: set(tags)} from each user's most recent likes."""
+        tags = defaultdict(set)
+        sampled = defaultdict(int)
+        rows = (
+            Like.objects.filter(user_id__in=user_ids)
+            .order_by("user_id", "-id")
+            .values_list("user_id", "recipe_post__tags")
+        )
+        for user_id, post_tags in rows:
+            if sampled[user_id] >= MAX_LIKES_PER_USER:
+                continue
+            sampled[user_id] += 1
+            for tag in post_tags or []:
+                tag = str(tag).strip().lower()
+                if tag and not tag.startswith("category:"):
+                    tags[user_id].add(tag)
+        return tags
+
+    @transaction.atomic
+    def refresh_for(self, user_ids):
+        """Recompute suggestions for the given users; return the number of rows written."""
+        rows = [
+            UserSuggestion(user_id=user_id, suggested_id=suggested_id, mutual_count=mutual, shared_tags=shared, score=score)
+            for user_id in user_ids
+            for suggested_id, mutual, shared, score in self.compute_for_user(user_id)
+        ]
+        UserSuggestion.objects.filter(user_id__in=user_ids).delete()
+        UserSuggestion.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    def rebuild(self, batch_size=500):
+        """Recompute suggestions for every user who follows someone; return rows written."""
+        user_ids = list(Follower.objects.values_list("follower_id", flat=True).distinct().order_by("follower_id"))
+        UserSuggestion.objects.exclude(user_id__in=Follower.objects.values("follower_id")).delete()
+        written = 0
+        for start in range(0, len(user_ids), batch_size):
+            written += self.refresh_for(user_ids[start:start + batch_size])
+        return written
+
+    def record_follow(self, follower_id, author_id):
+        """Patch suggestion rows after follower_id starts following author_id."""
+        UserSuggestion.objects.filter(user_id=follower_id, suggested_id=author_id).delete()
+        self._apply_delta(follower_id, author_id, 1)
+
+    def record_unfollow(self, follower_id, author_id):
+        """Undo record_follow: remove its mutual-count contributions and restore the unfollowed pair."""
+        self._apply_delta(follower_id, author_id, -1)
+        self._restore_pair(follower_id, author_id)
+
+    def suggested_users(self, user, limit=12):
+        """Return suggested users for the dashboard, best first, skipping anyone already followed."""
+        following = self.social_graph.following_ids(user)
+        rows = (
+            UserSuggestion.objects.filter(user=user, mutual_count__gt=0)
+            .exclude(suggested_id__in=following)
+            .select_related("suggested")
+            .order_by("-score", "suggested_id")[:limit]
+        )
+        return [row.suggested for row in rows]
+
+    def _apply_delta(self, follower_id, author_id, delta):
+        """A follow edge A->B changes A's mutual count for each of B's followees and each follower's count for B."""
+        following = self.social_graph.following_ids(follower_id)
+        new_candidates = set(self.social_graph.following_ids(author_id)) - following - {follower_id}
+        if len(new_candidates) <= MAX_FANOUT:
+            self._bump({follower_id}, new_candidates, delta)
+        followers = self.social_graph.followers_of(follower_id)
+        if len(followers) > MAX_FANOUT:
+            return
+        already = set(
+            Follower.objects.filter(author_id=author_id, follower_id__in=followers).values_list("follower_id", flat=True)
+        )
+        self._bump(set(followers) - already - {author_id}, {author_id}, delta)
+
+    def _restore_pair(self, user_id, suggested_id):
+        """Re-score the suggestion record_follow deleted, now that user_id no longer follows suggested_id."""
+        followed = Follower.objects.filter(follower_id=user_id).values("author_id")
+        mutual = Follower.objects.filter(follower_id__in=followed, author_id=suggested_id).count()
+        if not mutual:
+            return
+        liked_tags = self.liked_tags([user_id, suggested_id])
+        shared = len(liked_tags.get(user_id, set()) & liked_tags.get(suggested_id, set()))
+        UserSuggestion.objects.update_or_create(
+            user_id=user_id,
+            suggested_id=suggested_id,
+            defaults={"mutual_count": mutual, "shared_tags": shared, "score": mutual + TAG_WEIGHT * shared},
+        )
+        self._trim([user_id])
+
+    def _trim(self, user_ids):
+        """Drop the lowest-scored rows of any user holding more than MAX_STORED_PER_USER."""
+        crowded = (
+            UserSuggestion.objects.filter(user_id__in=user_ids)
+            .values("user_id")
+            .annotate(rows=Count("id"))
+            .filter(rows__gt=MAX_STORED_PER_USER)
+            .values_list("user_id", flat=True)
+        )
+        for user_id in list(crowded):
+            rows = UserSuggestion.objects.filter(user_id=user_id)
+            keep = list(rows.order_by("-score", "suggested_id").values_list("id", flat=True)[:MAX_STORED_PER_USER])
+            rows.exclude(id__in=keep).delete()
+
+    def _bump(self, user_ids, suggested_ids, delta):
+        if not user_ids or not suggested_ids:
+            return
+        pairs = UserSuggestion.objects.filter(user_id__in=user_ids, suggested_id__in=suggested_ids)
+        existing = set(pairs.values_list("user_id", "suggested_id"))
+        pairs.update(mutual_count=F("mutual_count") + delta, score=F("score") + delta)
+        if delta > 0:
+            UserSuggestion.objects.bulk_create(
+                [
+                    UserSuggestion(user_id=user_id, suggested_id=suggested_id, mutual_count=delta, score=delta)
+                    for user_id in user_ids
+                    for suggested_id in suggested_ids
+                    if (user_id, suggested_id) not in existing
+                ],
+                ignore_conflicts=True,
+                batch_size=1000,
+            )
+            self._trim(user_ids)
+        else:
+            UserSuggestion.objects.filter(user_id__in=user_ids, mutual_count__lte=0).delete()
@@ -0,0 +1,76 @@
+"""Maintenance helpers for the denormalised follower/following/post counts on User."""
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from recipes.models import Follower, RecipePost
+from recipes.repos.user_repo import UserRepo
+
+User = get_user_model()
+
+# posts_count is shown to every viewer, so it only counts posts anyone may see.
+PUBLIC_POSTS = Q(visibility=RecipePost.VISIBILITY_PUBLIC, is_hidden=False)
+# Post fields whose change can move a post in or out of posts_count.
+POSTS_COUNT_FIELDS = {"visibility", "is_hidden", "author"}
+
+
+def is_public_post(post):
+    """Return True when the post counts towards its author's posts_count."""
+    return post.visibility == RecipePost.VISIBILITY_PUBLIC and not post.is_hidden
+
+
+def _count_subquery(model, field, condition=Q()):
+    rows = (
+        model.objects.filter(condition, **{field: OuterRef("pk")})
+        .values(field)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(rows), Value(0))
+
+
+class UserCountsService:
+    """Recompute User.followers_count, following_count and posts_count (public posts) from source rows."""
+
+    def __init__(self, user_repo=None):
+        self.user_repo = user_repo or UserRepo()
+
+    def refresh(self, user_ids=None):
+        """Repair drifted counters; return the number of user rows updated."""
+        users = User.objects.all()
+        if user_ids is not None:
+            users = users.filter(id__in=user_ids)
+        return users.update(
+            followers_count=_count_subquery(Follower, "author"),
+            following_count=_count_subquery(Follower, "follower"),
+            posts_count=_count_subquery(RecipePost, "author", PUBLIC_POSTS),
+        )
+
+    def refresh_posts(self, user_ids):
+        """Recount posts_count for the given users, e.g. after a post's visibility changes."""
+        return User.objects.filter(id__in=user_ids).update(
+            posts_count=_count_subquery(RecipePost, "author", PUBLIC_POSTS)
+        )
+
+    def drifted_ids(self, batch_size=1000):
+        """Return ids of users whose stored counters disagree with the source rows."""
+        annotated = User.objects.annotate(
+            actual_followers=_count_subquery(Follower, "author"),
+            actual_following=_count_subquery(Follower, "follower"),
+            actual_posts=_count_subquery(RecipePost, "author", PUBLIC_POSTS),
+        )
+        batches = self.user_repo.iter_batches(
+            batch_size,
+            fields=(
+                "id",
+                "followers_count",
+                "following_count",
+                "posts_count",
+                "actual_followers",
+                "actual_following",
+                "actual_posts",
+            ),
+            queryset=annotated,
+        )
+        return [row[0] for batch in batches for row in batch if row[1:4] != row[4:]]
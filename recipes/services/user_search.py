@@ -0,0 +1,103 @@
+"""Indexed user search: word prefixes for type-ahead, trigrams for typos."""
+
+from math import ceil
+
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Value, When
+
+from recipes.models import User, UserSearchTerm
+from recipes.repos.user_repo import UserRepo
+from recipes.utils.search_terms import search_words, trigrams, user_search_terms
+
+# Fraction of the query's trigrams a user must share to count as a fuzzy match.
+TRIGRAM_MATCH_RATIO = 0.5
+# Fields whose changes require the user's search terms to be rebuilt.
+INDEXED_FIELDS = frozenset({"username", "first_name", "last_name"})
+
+
+class UserSearchService:
+    """Maintain the user_search_term table and answer user search queries from it."""
+
+    def __init__(self, user_repo=None):
+        self.user_repo = user_repo or UserRepo()
+
+    def terms_for(self, user):
+        """Return UserSearchTerm rows (unsaved) for a user."""
+        return self._terms(user.pk, user.username, user.first_name, user.last_name)
+
+    def _terms(self, user_id, username, first_name, last_name):
+        words, grams = user_search_terms(username, first_name, last_name)
+        return [UserSearchTerm(user_id=user_id, kind=UserSearchTerm.KIND_WORD, term=word) for word in words] + [
+            UserSearchTerm(user_id=user_id, kind=UserSearchTerm.KIND_TRIGRAM, term=gram) for gram in grams
+        ]
+
+    @transaction.atomic
+    def refresh(self, user_ids=None, batch_size=1000):
+        """Rebuild search terms for the given users (all users when None); return rows written."""
+        filters = {"id__in": user_ids} if user_ids is not None else None
+        terms = UserSearchTerm.objects.all()
+        if user_ids is not None:
+            terms = terms.filter(user_id__in=user_ids)
+        terms.delete()
+        written = 0
+        batches = self.user_repo.iter_batches(
+            batch_size, fields=("id", "username", "first_name", "last_name"), filters=filters
+        )
+        for batch in batches:
+            rows = [term for user_row in batch for term in self._terms(*user_row)]
+            written += len(UserSearchTerm.objects.bulk_create(rows, batch_size=batch_size))
+        return written
+
+    def search(self, query, limit=18):
+        """Return up to limit users matching query.
+
+        Every query word must prefix-match one of the user's indexed words;
+        usernames starting with the query rank first, then more-followed users.
+        Only when nothing prefix-matches are users sharing most of the query's
+        trigrams returned instead, so small typos still find someone.
+        """
+        tokens = search_words(query)
+        if not tokens or limit <= 0:
+            return []
+        users = self._ranked(self._prefix_matches(tokens), tokens)
+        results = list(users[:limit])
+        return results or self._trigram_matches(tokens, limit)
+
+    def _prefix_matches(self, tokens):
+        users = User.objects.all()
+        for token in tokens:
+            users = users.filter(
+                id__in=UserSearchTerm.objects.filter(
+                    kind=UserSearchTerm.KIND_WORD, term__gte=token, term__lt=token + "\uffff"
+                ).values("user_id")
+            )
+        return users
+
+    def _ranked(self, users, tokens):
+        joined = "".join(tokens)
+        return users.annotate(
+            search_tier=Case(
+                When(username__istartswith=f"@{joined}", then=Value(0)),
+                When(username__istartswith=joined, then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            )
+        ).order_by("search_tier", "-followers_count", "username")
+
+    def _trigram_matches(self, tokens, limit):
+        grams = set()
+        for token in tokens:
+            grams |= trigrams(token)
+        if not grams:
+            return []
+        needed = max(1, ceil(len(grams) * TRIGRAM_MATCH_RATIO))
+        scores = dict(
+            UserSearchTerm.objects.filter(kind=UserSearchTerm.KIND_TRIGRAM, term__in=grams)
+            .values("user_id")
+            .annotate(shared=Count("id"))
+            .filter(shared__gte=needed)
+            .order_by("-shared")
+            .values_list("user_id", "shared")[: limit * 5]
+        )
+        users = User.objects.filter(id__in=list(scores))
+        return sorted(users, key=lambda user: (-scores[user.id], -user.followers_count, user.username))[:limit]
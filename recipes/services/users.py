@@ -13,6 +13,10 @@ class UserService:
         """Fetch a user by username or raise 404."""
         return get_object_or_404(User, username=username)
 
+    def fetch_many_by_username(self, usernames):
+        """Return the users matching any of the given usernames, in one query."""
+        return list(User.objects.filter(username__in=usernames))
+
     def first_by_email(self, email):
         """Return first user with matching email or None."""
         return User.objects.filter(email=email).first()
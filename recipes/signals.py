@@ -1,8 +1,30 @@
 import re
-from django.db.models.signals import post_save, m2m_changed
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save, m2m_changed
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from recipes.models import Like, Comment, Follower, Notification, RecipePost
+from recipes.models import (
+    CloseFriend,
+    Comment,
+    Favourite,
+    FavouriteItem,
+    Follower,
+    Ingredient,
+    Like,
+    Notification,
+    RecipeChange,
+    RecipePost,
+)
+from recipes.services.comments import CommentService
+from recipes.services.notifications import NotificationService
+from recipes.services.profile_cache import ProfileCache
+from recipes.services.recipe_sync import RecipeSyncService
+from recipes.services.shop_catalogue import ShopCatalogueService
+from recipes.services.shop_products import ShopProductService
+from recipes.services.social_graph import SocialGraph
+from recipes.services.suggestions import SuggestionService
+from recipes.services.user_counts import POSTS_COUNT_FIELDS, UserCountsService, is_public_post
+from recipes.services.user_search import INDEXED_FIELDS, UserSearchService
 
 User = get_user_model()
 
@@ -72,13 +94,241 @@ def _safe_get_user(username):
 @receiver(post_save, sender=Notification)
 def trim_notification_history(sender, instance, created, **kwargs):
     """Keep a reasonable cap on notification history without nuking recent items."""
-    if not created:
+    if created:
+        NotificationService(notification_model=Notification).trim_history(instance.recipient)
+
+
+@receiver(post_save, sender=Ingredient)
+def increment_ingredient_count(sender, instance, created, **kwargs):
+    """Keep RecipePost.ingredient_count in step with new ingredient rows."""
+    if created:
+        RecipePost.objects.filter(id=instance.recipe_post_id).update(ingredient_count=F("ingredient_count") + 1)
+
+
+@receiver(post_delete, sender=Ingredient)
+def decrement_ingredient_count(sender, instance, **kwargs):
+    """Decrement RecipePost.ingredient_count when an ingredient row is removed."""
+    RecipePost.objects.filter(id=instance.recipe_post_id, ingredient_count__gt=0).update(
+        ingredient_count=F("ingredient_count") - 1
+    )
+
+
+@receiver(post_save, sender=Comment)
+def sync_comments_count_on_save(sender, instance, created, **kwargs):
+    """Keep RecipePost.comments_count in step with visible comments."""
+    if created:
+        if not instance.is_hidden:
+            RecipePost.objects.filter(id=instance.recipe_post_id).update(comments_count=F("comments_count") + 1)
+        return
+    CommentService().refresh_counts([instance.recipe_post_id])
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comments_count(sender, instance, **kwargs):
+    """Decrement RecipePost.comments_count when a visible comment is removed."""
+    if instance.is_hidden:
+        return
+    RecipePost.objects.filter(id=instance.recipe_post_id, comments_count__gt=0).update(
+        comments_count=F("comments_count") - 1
+    )
+
+
+@receiver(post_save, sender=Follower)
+def increment_follow_counts(sender, instance, created, **kwargs):
+    """Bump the author's followers_count and the follower's following_count."""
+    if created:
+        User.objects.filter(id=instance.author_id).update(followers_count=F("followers_count") + 1)
+        User.objects.filter(id=instance.follower_id).update(following_count=F("following_count") + 1)
+
+
+@receiver(post_delete, sender=Follower)
+def decrement_follow_counts(sender, instance, **kwargs):
+    """Reverse increment_follow_counts when a follow row is removed."""
+    User.objects.filter(id=instance.author_id, followers_count__gt=0).update(
+        followers_count=F("followers_count") - 1
+    )
+    User.objects.filter(id=instance.follower_id, following_count__gt=0).update(
+        following_count=F("following_count") - 1
+    )
+
+
+@receiver(post_save, sender=RecipePost)
+def sync_posts_count(sender, instance, created, update_fields=None, **kwargs):
+    """Keep User.posts_count in step with the author's public posts."""
+    if created:
+        if is_public_post(instance):
+            User.objects.filter(id=instance.author_id).update(posts_count=F("posts_count") + 1)
+        return
+    if update_fields is not None and not POSTS_COUNT_FIELDS.intersection(update_fields):
+        return
+    UserCountsService().refresh_posts([instance.author_id])
+
+
+@receiver(post_delete, sender=RecipePost)
+def decrement_posts_count(sender, instance, **kwargs):
+    """Decrement User.posts_count when a public recipe post is removed."""
+    if not is_public_post(instance):
+        return
+    User.objects.filter(id=instance.author_id, posts_count__gt=0).update(posts_count=F("posts_count") - 1)
+
+
+@receiver(post_save, sender=Follower)
+@receiver(post_delete, sender=Follower)
+def invalidate_follow_graph(sender, instance, **kwargs):
+    """Drop cached adjacency for both ends of a follow edge."""
+    SocialGraph().invalidate(instance.follower_id, instance.author_id)
+
+
+@receiver(post_save, sender=Follower)
+def add_follow_to_suggestions(sender, instance, created, **kwargs):
+    """Patch friends-of-friends suggestions for a new follow edge."""
+    if created:
+        SuggestionService().record_follow(instance.follower_id, instance.author_id)
+
+
+@receiver(post_delete, sender=Follower)
+def remove_follow_from_suggestions(sender, instance, **kwargs):
+    """Reverse add_follow_to_suggestions when a follow edge is removed."""
+    SuggestionService().record_unfollow(instance.follower_id, instance.author_id)
+
+
+@receiver(post_save, sender=CloseFriend)
+@receiver(post_delete, sender=CloseFriend)
+def invalidate_close_friend_graph(sender, instance, **kwargs):
+    """Drop cached adjacency for both ends of a close-friend edge."""
+    SocialGraph().invalidate(instance.owner_id, instance.friend_id)
+
+
+@receiver(post_save, sender=User)
+def refresh_user_search_terms(sender, instance, created, update_fields=None, **kwargs):
+    """Re-index a user's search terms when their username or names may have changed."""
+    if update_fields is not None and not INDEXED_FIELDS.intersection(update_fields):
+        return
+    UserSearchService().refresh([instance.pk])
+
+
+@receiver(post_save, sender=User)
+def bump_profile_on_edit(sender, instance, **kwargs):
+    """Profile edits change the cached header and stats."""
+    ProfileCache().bump(instance.pk)
+
+
+@receiver(post_save, sender=Follower)
+@receiver(post_delete, sender=Follower)
+def bump_profiles_on_follow(sender, instance, **kwargs):
+    """A follow edge changes counts and follow lists on both profiles."""
+    ProfileCache().bump(instance.follower_id, instance.author_id)
+
+
+@receiver(post_save, sender=CloseFriend)
+@receiver(post_delete, sender=CloseFriend)
+def bump_profile_on_close_friend(sender, instance, **kwargs):
+    """Close-friend changes only show on the owner's profile."""
+    ProfileCache().bump(instance.owner_id)
+
+
+@receiver(post_save, sender=RecipePost)
+@receiver(post_delete, sender=RecipePost)
+def bump_profile_on_post(sender, instance, **kwargs):
+    """New, edited and removed posts change the author's post count."""
+    ProfileCache().bump(instance.author_id)
+
+
+@receiver(post_save, sender=Favourite)
+@receiver(post_delete, sender=Favourite)
+def bump_profile_on_collection(sender, instance, **kwargs):
+    """Collection changes alter the owner's collections grid."""
+    ProfileCache().bump(instance.user_id)
+
+
+@receiver(post_save, sender=FavouriteItem)
+@receiver(post_delete, sender=FavouriteItem)
+def bump_profile_on_collection_item(sender, instance, **kwargs):
+    """Saving into or removing from a collection changes its card."""
+    profile_cache = ProfileCache()
+    if not profile_cache.enabled():
         return
+    owner_id = Favourite.objects.filter(pk=instance.favourite_id).values_list("user_id", flat=True).first()
+    if owner_id is not None:
+        profile_cache.bump(owner_id)
+
+
+@receiver(post_save, sender=RecipePost)
+def log_recipe_saved(sender, instance, created, **kwargs):
+    """Record new and edited recipes for delta sync."""
+    kind = RecipeChange.KIND_CREATED if created else RecipeChange.KIND_UPDATED
+    RecipeSyncService().record(kind, instance.pk)
+
+
+@receiver(post_delete, sender=RecipePost)
+def log_recipe_deleted(sender, instance, **kwargs):
+    """Leave a tombstone so syncing clients drop the recipe."""
+    RecipeSyncService().record(RecipeChange.KIND_DELETED, instance.pk)
+
 
-    keep_ids = list(
-        Notification.objects.filter(recipient=instance.recipient)
-        .order_by("-created_at", "-id")
-        .values_list("id", flat=True)[:100]
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+@receiver(post_save, sender=FavouriteItem)
+@receiver(post_delete, sender=FavouriteItem)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def log_recipe_engagement(sender, instance, **kwargs):
+    """Likes, saves and comments move a recipe's counters."""
+    RecipeSyncService().record_engagement(instance.recipe_post_id)
+
+
+@receiver(post_save, sender=Follower)
+@receiver(post_delete, sender=Follower)
+def log_follow_audience(sender, instance, **kwargs):
+    """Following or unfollowing changes which recipes the follower may see."""
+    RecipeSyncService().record_audience(instance.follower_id)
+
+
+@receiver(post_save, sender=CloseFriend)
+@receiver(post_delete, sender=CloseFriend)
+def log_close_friend_audience(sender, instance, **kwargs):
+    """Close-friend changes alter which recipes the friend may see."""
+    RecipeSyncService().record_audience(instance.friend_id)
+
+
+@receiver(pre_save, sender=User)
+def remember_privacy_flag(sender, instance, update_fields=None, **kwargs):
+    """Note the stored is_private value so apply_privacy_change can spot a flip."""
+    if instance.pk is None or (update_fields is not None and "is_private" not in update_fields):
+        return
+    instance._stored_is_private = (
+        User.objects.filter(pk=instance.pk).values_list("is_private", flat=True).first()
     )
-    if keep_ids:
-        Notification.objects.filter(recipient=instance.recipient).exclude(id__in=keep_ids).delete()
+
+
+@receiver(post_save, sender=User)
+def apply_privacy_change(sender, instance, created, **kwargs):
+    """A profile going private or public changes who may see every one of its recipes."""
+    stored = instance.__dict__.pop("_stored_is_private", None)
+    if created or stored is None or stored == instance.is_private:
+        return
+    RecipeSyncService().record_updated_for_author(instance.pk)
+    ShopCatalogueService().sync_author(instance.pk, instance.is_private)
+
+
+@receiver(post_save, sender=Ingredient)
+def sync_shop_item(sender, instance, **kwargs):
+    """Link a one-off ingredient save (admin, shell) to its shop product and rebuild its shop_item row.
+
+    Recipe forms bulk-create their ingredients and do this once per post after commit.
+    """
+    ShopProductService().attach(instance)
+    ShopCatalogueService().sync_ingredients([instance.pk])
+
+
+@receiver(post_delete, sender=Ingredient)
+def release_shop_product(sender, instance, **kwargs):
+    """Drop the ingredient's product reference; its shop_item row cascades."""
+    ShopProductService().detach(instance)
+
+
+@receiver(post_save, sender=RecipePost)
+def sync_shop_items_for_post(sender, instance, created, **kwargs):
+    """Visibility or author changes on a post move its shop rows."""
+    if not created:
+        ShopCatalogueService().sync_post(instance)
@@ -1,5 +1,6 @@
 from .repos.test_post_repo import *
 from .utils.test_db_accessor import *
+from .utils.test_pagination import *
 from .test_permissions import *
 from .test_firebase import *
 from .test_firebase_admin_client import *
\ No newline at end of file
@@ -1,11 +1,20 @@
+import io
+
 from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
 
 from recipes.forms.recipe_forms import MAX_IMAGE_UPLOAD_BYTES
 
 
+def image_bytes(image_format="JPEG", size=(4, 4)):
+    # Smallest real image Pillow can verify; uploads are checked by magic bytes
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 80, 40)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
 def fake_image(name="img.jpg"):
-    # Minimal bytes; enough for SimpleUploadedFile usage in tests
-    return SimpleUploadedFile(name, b"fake-image-bytes", content_type="image/jpeg")
+    return SimpleUploadedFile(name, image_bytes(), content_type="image/jpeg")
 
 
 def oversized_image(name="big.jpg"):
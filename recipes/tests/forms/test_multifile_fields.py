@@ -3,9 +3,10 @@ from django.utils.datastructures import MultiValueDict
 
 from recipes.forms.recipe_forms import MultiFileInput, MultiFileField
 from recipes.tests.forms.form_file_helpers import fake_image
+from recipes.tests.media import TempMediaMixin
 
 
-class MultiFileInputTests(TestCase):
+class MultiFileInputTests(TempMediaMixin, TestCase):
     def test_value_from_datadict_returns_getlist(self):
         widget = MultiFileInput()
         files = MultiValueDict({"images": [fake_image("a.jpg"), fake_image("b.jpg")]})
@@ -15,7 +16,7 @@ class MultiFileInputTests(TestCase):
         self.assertEqual(out[1].name, "b.jpg")
 
 
-class MultiFileFieldTests(TestCase):
+class MultiFileFieldTests(TempMediaMixin, TestCase):
     def test_clean_accepts_list(self):
         field = MultiFileField(required=False)
         first, second = fake_image("1.jpg"), fake_image("2.jpg")
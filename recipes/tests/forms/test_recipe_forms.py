@@ -6,14 +6,15 @@ from recipes.forms.recipe_forms import (
     MAX_SHOPPING_LINKS,
     RecipePostForm,
 )
-from recipes.models import User
+from recipes.models import ShopItem, ShopProduct, User
 from recipes.models.recipe_post import RecipePost, RecipeImage
 from recipes.models.recipe_step import RecipeStep
 from recipes.models.ingredient import Ingredient
-from recipes.tests.forms.form_file_helpers import fake_image, fake_non_image, oversized_image
+from recipes.tests.forms.form_file_helpers import fake_image, fake_non_image, image_bytes, oversized_image
+from recipes.tests.media import TempMediaMixin
 
 
-class RecipePostFormTests(TestCase):
+class RecipePostFormTests(TempMediaMixin, TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             username="@tester",
@@ -165,6 +166,24 @@ class RecipePostFormTests(TestCase):
         result = [(i.name, i.shop_url, bool(i.shop_image_upload)) for i in ingredients]
         self.assertEqual(result, expected)
 
+    def test_create_ingredients_batches_shop_upkeep_until_commit(self):
+        recipe = self.make_recipe()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            ingredients = self._create_shop_ingredients(recipe, [fake_image("s1.jpg"), fake_image("s2.jpg")])
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(ShopItem.objects.exists())
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.ingredient_count, 4)
+
+        callbacks[0]()
+
+        self.assertEqual(ShopItem.objects.filter(recipe_post=recipe).count(), 4)
+        self.assertEqual(ShopProduct.objects.count(), 2)
+        self.assertTrue(all(row.term_id for row in ingredients))
+        shared = Ingredient.objects.filter(recipe_post=recipe, product__isnull=False).values_list("shop_image_upload", flat=True)
+        self.assertTrue(all(name.startswith("shop_products/") for name in shared))
+
     def test_clean_images_limits_to_10(self):
         files = [fake_image(f"{i}.jpg") for i in range(11)]
         form = self.build_form(files=self.form_files(images=files))
@@ -186,11 +205,23 @@ class RecipePostFormTests(TestCase):
         self.assertIn("Only image files", str(form.errors["images"]))
         self.assertIn("doc.pdf", str(form.errors["images"]))
 
-    def test_clean_images_allows_guessable_extension_without_content_type(self):
-        png_without_type = SimpleUploadedFile("guess.png", b"png-bytes", content_type="")
+    def test_clean_images_accepts_real_image_without_content_type(self):
+        png_without_type = SimpleUploadedFile("guess.png", image_bytes("PNG"), content_type="")
         form = self.build_form(files=self.form_files(images=[png_without_type]))
         self.assertTrue(form.is_valid(), form.errors)
 
+    def test_clean_images_rejects_image_extension_with_foreign_bytes(self):
+        disguised = SimpleUploadedFile("photo.jpg", b"%PDF-1.7 not an image", content_type="image/jpeg")
+        form = self.build_form(files=self.form_files(images=[disguised]))
+        self.assertFalse(form.is_valid())
+        self.assertIn("photo.jpg", str(form.errors["images"]))
+
+    def test_clean_images_rejects_truncated_image(self):
+        truncated = SimpleUploadedFile("cut.png", image_bytes("PNG")[:20], content_type="image/png")
+        form = self.build_form(files=self.form_files(images=[truncated]))
+        self.assertFalse(form.is_valid())
+        self.assertIn("cut.png", str(form.errors["images"]))
+
     def test_clean_shop_images_limits_to_10(self):
         files = [fake_image(f"{i}.jpg") for i in range(11)]
         form = self.build_form(files=self.form_files(shop_images=files))
@@ -9,9 +9,10 @@ from recipes.models import User
 from recipes.models.ingredient import Ingredient
 from recipes.models.recipe_post import RecipePost, RecipeImage
 from recipes.tests.forms.form_file_helpers import fake_image
+from recipes.tests.media import TempMediaMixin
 
 
-class RecipePostFormAdditionalTests(TestCase):
+class RecipePostFormAdditionalTests(TempMediaMixin, TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             username="@tester",
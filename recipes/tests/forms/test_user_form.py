@@ -3,8 +3,9 @@ from django.test import TestCase
 from recipes.forms import UserForm
 from recipes.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
+from recipes.tests.media import TempMediaMixin
 
-class UserFormTestCase(TestCase):
+class UserFormTestCase(TempMediaMixin, TestCase):
 
     fixtures = [
         'recipes/tests/fixtures/default_user.json'
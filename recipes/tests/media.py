@@ -0,0 +1,25 @@
+"""Throwaway MEDIA_ROOT for tests that store uploaded files."""
+
+import shutil
+import tempfile
+
+from django.test import override_settings
+
+
+class TempMediaMixin:
+    """Point MEDIA_ROOT at a temporary directory for the whole test class and remove it afterwards."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._media_root = tempfile.mkdtemp()
+        cls._media_override = override_settings(MEDIA_ROOT=cls._media_root)
+        cls._media_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            super().tearDownClass()
+        finally:
+            cls._media_override.disable()
+            shutil.rmtree(cls._media_root, ignore_errors=True)
@@ -16,6 +16,23 @@ class IngredientModelTestCase(TestCase):
         self.assertEqual(ing.name, "chilipowder")
         self.assertIn("g", str(ing))
 
+    def test_renaming_resolves_the_term_again(self):
+        ing = Ingredient.objects.create(recipe_post=self.post, name="Cilantro", position=1)
+        self.assertEqual(ing.term.name, "coriander")
+
+        ing = Ingredient.objects.get(pk=ing.pk)
+        ing.name = "Zucchini"
+        ing.save()
+        self.assertEqual(Ingredient.objects.get(pk=ing.pk).term.name, "courgette")
+
+        ing.name = "Scallions"
+        ing.save(update_fields=["name"])
+        self.assertEqual(Ingredient.objects.get(pk=ing.pk).term.name, "spring onion")
+
+        ing.quantity = 2
+        ing.save()
+        self.assertEqual(Ingredient.objects.get(pk=ing.pk).term.name, "spring onion")
+
     def test_position_must_be_positive(self):
         with self.assertRaises(IntegrityError):
             Ingredient.objects.create(recipe_post=self.post, name="bad", position=0)
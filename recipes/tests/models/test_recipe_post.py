@@ -8,9 +8,10 @@ from django.utils import timezone
 from recipes.models import User, Like
 from recipes.models.recipe_post import RecipePost, RecipeImage
 from recipes.tests.test_utils import make_user, make_recipe_post
+from recipes.tests.media import TempMediaMixin
 
 
-class RecipePostModelTests(TestCase):
+class RecipePostModelTests(TempMediaMixin, TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             username="@tester",
@@ -4,8 +4,9 @@ from unittest.mock import patch
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from recipes.models import User
+from recipes.tests.media import TempMediaMixin
 
-class UserModelTestCase(TestCase):
+class UserModelTestCase(TempMediaMixin, TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             'johndoe',
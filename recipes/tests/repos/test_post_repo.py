@@ -86,7 +86,7 @@ class PostRepoTestCase(TestCase):
         self.assertEqual(qs_offset.count(), 1)
 
         # Ensure the offset actually changes which object we see
-        titles = {p.title for p in qs.union(qs_offset)}
+        titles = {p.title for p in [*qs, *qs_offset]}
         self.assertEqual(titles, {"Soup", "Toast"})
 
     def test_list_for_feed_offset_without_limit_returns_slice(self):
@@ -94,6 +94,20 @@ class PostRepoTestCase(TestCase):
         self.assertEqual(qs.count(), 1)
         self.assertEqual(qs.first().title, "Toast")
 
+    def test_page_applies_privacy_filter_before_slicing(self):
+        RecipePost.objects.create(
+            author=self.other,
+            title="Hidden",
+            description="d",
+            category="dinner",
+            visibility=RecipePost.VISIBILITY_CLOSE_FRIENDS,
+        )
+        page = self.repo.page(
+            self.repo.list_for_user(self.other.id, order_by=("-created_at",)), limit=1
+        ).exclude(visibility=RecipePost.VISIBILITY_CLOSE_FRIENDS)
+        self.assertEqual([p.title for p in page.items], ["Toast"])
+        self.assertFalse(page.has_more)
+
     def test_list_for_user_calls_feed_for_that_user(self):
         qs = self.repo.list_for_user(self.other.id)
         self.assertEqual(qs.count(), 1)
@@ -113,7 +127,7 @@ class PostRepoTestCase(TestCase):
 
         qs_offset = self.repo.list_for_user(self.other.id, limit=1, offset=1)
         self.assertEqual(qs_offset.count(), 1)
-        titles = {p.title for p in qs.union(qs_offset)}
+        titles = {p.title for p in [*qs, *qs_offset]}
         self.assertEqual(titles, {"Toast", "Rice"})
 
     def test_list_for_following_handles_branches(self):
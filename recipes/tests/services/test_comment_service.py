@@ -0,0 +1,63 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from recipes.models import Comment, RecipePost, User
+from recipes.services.comments import CommentService
+
+
+class CommentServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(username="@johndoe")
+        self.other = User.objects.get(username="@janedoe")
+        self.post = RecipePost.objects.create(
+            author=self.user, title="Soup", description="d", published_at=timezone.now()
+        )
+        self.service = CommentService()
+
+    def test_thread_rows_skip_hidden_and_carry_author_fields(self):
+        Comment.objects.create(recipe_post=self.post, user=self.other, text="first")
+        Comment.objects.create(recipe_post=self.post, user=self.user, text="hidden", is_hidden=True)
+        latest = Comment.objects.create(recipe_post=self.post, user=self.user, text="latest")
+
+        rows = self.service.thread_rows(self.post, 0, 10)
+
+        self.assertEqual([row.text for row in rows], ["latest", "first"])
+        self.assertEqual(rows[0].id, latest.id)
+        self.assertEqual(rows[0].user_id, self.user.id)
+        self.assertEqual(rows[0].user.username, self.user.username)
+        self.assertEqual(rows[0].user.mini_avatar_url, self.user.mini_gravatar())
+
+    def test_thread_rows_use_a_single_query(self):
+        for idx in range(3):
+            Comment.objects.create(recipe_post=self.post, user=self.other, text=f"c{idx}")
+        with self.assertNumQueries(1):
+            rows = self.service.thread_rows(self.post, 0, 10)
+            [row.user.mini_avatar_url for row in rows]
+
+    def test_comments_count_tracks_create_hide_and_delete(self):
+        first = Comment.objects.create(recipe_post=self.post, user=self.other, text="a")
+        Comment.objects.create(recipe_post=self.post, user=self.other, text="b")
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 2)
+
+        first.is_hidden = True
+        first.save()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 1)
+
+        first.delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 1)
+
+    def test_refresh_counts_repairs_bulk_created_comments(self):
+        Comment.objects.bulk_create(
+            [Comment(recipe_post=self.post, user=self.other, text=f"c{idx}") for idx in range(4)]
+        )
+        self.service.refresh_counts([self.post.id])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 4)
@@ -1,8 +1,11 @@
 import uuid
+from datetime import timedelta
 from django.utils import timezone
 from django.test import TestCase
-from recipes.models import User, Follower, FollowRequest, Notification, CloseFriend
+from recipes.models import User, Follower, FollowRequest, Notification, CloseFriend, UserSuggestion
 from recipes.services import FollowService
+from recipes.services.follow_read import FollowReadService
+from recipes.services.notifications import HISTORY_LIMIT
 
 class FollowServiceTestCase(TestCase):
     fixtures = [
@@ -240,3 +243,143 @@ class FollowServiceTestCase(TestCase):
         FollowRequest.objects.filter(id=pending.id).update(status=FollowRequest.STATUS_PENDING)
         self.assertEqual(FollowService(self.alice).pending_request(self.bob), pending)
         self.assertIsNone(FollowService(None).pending_request(self.bob))
+
+
+class FollowServiceBulkTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.alice = User.objects.get(username="@johndoe")
+        self.bob = User.objects.get(username="@janedoe")
+        self.cara = User.objects.get(username="@petrapickles")
+        self.dan = User.objects.get(username="@peterpickles")
+        User.objects.filter(pk=self.cara.pk).update(is_private=True)
+        self.cara.refresh_from_db()
+        self.service = FollowService(self.alice)
+
+    def test_follow_many_returns_per_target_statuses(self):
+        Follower.objects.create(follower=self.alice, author=self.dan)
+
+        statuses = self.service.follow_many([self.bob, self.cara, self.dan, self.alice, self.bob])
+
+        self.assertEqual(
+            statuses,
+            {self.bob.pk: "following", self.cara.pk: "requested", self.dan.pk: "following", self.alice.pk: "noop"},
+        )
+        self.assertTrue(Follower.objects.filter(follower=self.alice, author=self.bob).exists())
+        self.assertFalse(Follower.objects.filter(follower=self.alice, author=self.cara).exists())
+        request = FollowRequest.objects.get(requester=self.alice, target=self.cara)
+        self.assertEqual(request.status, FollowRequest.STATUS_PENDING)
+        self.assertTrue(Notification.objects.filter(follow_request=request, notification_type="follow_request").exists())
+        self.assertEqual(Notification.objects.filter(recipient=self.bob, notification_type="follow").count(), 1)
+
+    def test_follow_many_keeps_counters_and_graph_in_step(self):
+        self.assertFalse(self.service.is_following(self.bob))
+
+        self.service.follow_many([self.bob, self.dan])
+
+        self.alice.refresh_from_db()
+        self.bob.refresh_from_db()
+        self.assertEqual(self.alice.following_count, 2)
+        self.assertEqual(self.bob.followers_count, 1)
+        self.assertTrue(self.service.is_following(self.bob))
+
+    def test_follow_many_counts_only_landed_follows_and_trims_history(self):
+        Notification.objects.bulk_create(
+            [Notification(recipient=self.bob, sender=self.dan, notification_type="like") for _ in range(HISTORY_LIMIT)]
+        )
+        Follower.objects.create(follower=self.alice, author=self.dan)
+        self.alice.refresh_from_db()
+
+        # dan was followed after follow_many filtered its targets; only bob's insert lands.
+        self.service._bulk_follow_public([self.bob, self.dan])
+
+        self.alice.refresh_from_db()
+        self.dan.refresh_from_db()
+        self.assertEqual(self.alice.following_count, 2)
+        self.assertEqual(self.dan.followers_count, 1)
+        self.assertEqual(Notification.objects.filter(recipient=self.dan, notification_type="follow").count(), 1)
+        self.assertEqual(Notification.objects.filter(recipient=self.bob).count(), HISTORY_LIMIT)
+        self.assertTrue(Notification.objects.filter(recipient=self.bob, notification_type="follow").exists())
+
+    def test_follow_many_patches_followers_suggestions(self):
+        Follower.objects.create(follower=self.cara, author=self.alice)
+
+        self.service.follow_many([self.bob])
+
+        self.assertTrue(UserSuggestion.objects.filter(user=self.cara, suggested=self.bob, mutual_count=1).exists())
+
+    def test_follow_many_reopens_rejected_request_without_duplicate_prompts(self):
+        FollowRequest.objects.create(requester=self.alice, target=self.cara, status=FollowRequest.STATUS_REJECTED)
+
+        self.service.follow_many([self.cara])
+        self.service.follow_many([self.cara])
+
+        request = FollowRequest.objects.get(requester=self.alice, target=self.cara)
+        self.assertEqual(request.status, FollowRequest.STATUS_PENDING)
+        self.assertEqual(Notification.objects.filter(follow_request=request).count(), 1)
+
+    def test_add_close_friends_requires_follow(self):
+        Follower.objects.create(follower=self.bob, author=self.alice)
+
+        statuses = self.service.add_close_friends([self.bob, self.dan])
+
+        self.assertEqual(statuses, {self.bob.pk: "added", self.dan.pk: "requires_follow"})
+        self.assertEqual(list(CloseFriend.objects.filter(owner=self.alice).values_list("friend_id", flat=True)), [self.bob.pk])
+
+    def test_remove_followers_drops_follow_and_close_friend_rows(self):
+        Follower.objects.create(follower=self.bob, author=self.alice)
+        Follower.objects.create(follower=self.dan, author=self.alice)
+        CloseFriend.objects.create(owner=self.alice, friend=self.bob)
+
+        statuses = self.service.remove_followers([self.bob, self.dan])
+
+        self.assertEqual(statuses, {self.bob.pk: "removed", self.dan.pk: "removed"})
+        self.assertFalse(Follower.objects.filter(author=self.alice).exists())
+        self.assertFalse(CloseFriend.objects.filter(owner=self.alice).exists())
+
+
+class FollowReadServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.alice = User.objects.get(username="@johndoe")
+        self.bob = User.objects.get(username="@janedoe")
+        self.cara = User.objects.get(username="@petrapickles")
+        Follower.objects.create(follower=self.bob, author=self.alice)
+        Follower.objects.create(follower=self.cara, author=self.alice)
+        self.service = FollowReadService()
+
+    def test_follow_rows_page_by_cursor_with_light_rows(self):
+        first = self.service.follow_rows(self.alice, "followers", limit=1)
+        rest = self.service.follow_rows(self.alice, "followers", after=first[0].cursor, limit=5)
+
+        self.assertEqual(len(first), 1)
+        self.assertCountEqual([row.id for row in first + rest], [self.bob.id, self.cara.id])
+        self.assertTrue(all(row.mini_avatar_url for row in first + rest))
+        following = self.service.follow_rows(self.bob, "following")
+        self.assertEqual([row.username for row in following], [self.alice.username])
+
+    def test_follow_rows_newest_follow_first(self):
+        Follower.objects.filter(follower=self.bob).update(created_at=timezone.now() - timedelta(days=1))
+
+        rows = self.service.follow_rows(self.alice, "followers")
+
+        self.assertEqual([row.id for row in rows], [self.cara.id, self.bob.id])
+        self.assertEqual(self.service.follow_rows(self.alice, "followers", after="garbage"), rows)
+
+    def test_close_friend_ids_among_checks_only_given_ids(self):
+        CloseFriend.objects.create(owner=self.alice, friend=self.bob)
+        CloseFriend.objects.create(owner=self.alice, friend=self.cara)
+
+        with self.assertNumQueries(1):
+            ids = self.service.close_friend_ids_among(self.alice, [self.bob.id])
+
+        self.assertEqual(ids, {self.bob.id})
+        self.assertEqual(self.service.close_friend_ids_among(self.alice, []), set())
@@ -0,0 +1,67 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from recipes.models import Ingredient, RecipePost, User
+from recipes.services.feed import FeedService
+from recipes.services.ingredient_index import HAVE_MATCH_COVERAGE, IngredientIndexService
+
+
+class IngredientIndexServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(username="@johndoe")
+        self.service = IngredientIndexService()
+        self.toast = self._post("Toast", ["bread", "butter"])
+        self.sandwich = self._post("Sandwich", ["bread", "cheese", "ham"])
+        self.soup = self._post("Soup", ["leek", "potato"])
+
+    def _post(self, title, ingredients):
+        post = RecipePost.objects.create(
+            author=self.user, title=title, description="d", published_at=timezone.now()
+        )
+        for idx, name in enumerate(ingredients, start=1):
+            Ingredient.objects.create(recipe_post=post, name=name, position=idx)
+        return post
+
+    def test_ingredient_count_tracks_creates_and_deletes(self):
+        self.sandwich.refresh_from_db()
+        self.assertEqual(self.sandwich.ingredient_count, 3)
+        Ingredient.objects.filter(recipe_post=self.sandwich, name="ham").delete()
+        self.sandwich.refresh_from_db()
+        self.assertEqual(self.sandwich.ingredient_count, 2)
+
+    def test_refresh_counts_repairs_drift(self):
+        RecipePost.objects.update(ingredient_count=0)
+        self.service.refresh_counts()
+        self.toast.refresh_from_db()
+        self.assertEqual(self.toast.ingredient_count, 2)
+
+    def test_filter_covered_requires_every_ingredient(self):
+        qs = self.service.filter_covered(RecipePost.objects.all(), ["Bread", "butter", "cheese"])
+        self.assertEqual(list(qs), [self.toast])
+
+    def test_annotate_coverage_ranks_partial_matches(self):
+        qs = self.service.annotate_coverage(RecipePost.objects.all(), ["bread", "cheese"]).order_by("-have_coverage")
+        rows = [(post.title, post.have_matched) for post in qs]
+        self.assertEqual(rows, [("Sandwich", 2), ("Toast", 1)])
+
+    def test_filter_covered_matches_name_variants(self):
+        qs = self.service.filter_covered(RecipePost.objects.all(), ["2 slices bread", "Butter"])
+        self.assertEqual(list(qs), [self.toast])
+
+    def test_feed_coverage_mode_orders_by_coverage(self):
+        qs = FeedService().discover_queryset(
+            self.user,
+            query=None,
+            category=None,
+            ingredient_q=None,
+            have_ingredients_list=["bread", "butter", "cheese"],
+            min_prep=None,
+            max_prep=None,
+            sort="newest",
+            have_match=HAVE_MATCH_COVERAGE,
+        )
+        self.assertEqual([post.title for post in qs], ["Toast", "Sandwich"])
@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+from recipes.models import Ingredient, IngredientTerm, RecipePost, User
+from recipes.services.ingredient_terms import IngredientTermService
+
+
+class IngredientTermServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+    ]
+
+    def setUp(self):
+        author = User.objects.get(username="@johndoe")
+        self.post = RecipePost.objects.create(author=author, title="Salad", description="d")
+        self.service = IngredientTermService()
+
+    def test_resolve_maps_variants_to_one_term(self):
+        resolved = self.service.resolve(["Tomatoes", "2 tomatoes", "basil"])
+        self.assertEqual(resolved["tomatoes"], resolved["2 tomatoes"])
+        self.assertEqual(IngredientTerm.objects.count(), 2)
+
+    def test_ingredient_save_assigns_term(self):
+        ing = Ingredient.objects.create(recipe_post=self.post, name="Cucumbers", position=1)
+        self.assertEqual(ing.term.name, "cucumber")
+
+    def test_term_ids_is_read_only(self):
+        self.assertEqual(self.service.term_ids(["unknown thing"]), [])
+        self.assertFalse(IngredientTerm.objects.exists())
+
+    def test_backfill_links_rows_created_without_terms(self):
+        Ingredient.objects.bulk_create([
+            Ingredient(recipe_post=self.post, name="Lemons", position=1),
+            Ingredient(recipe_post=self.post, name="lemon", position=2),
+        ])
+        updated = self.service.backfill()
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            set(Ingredient.objects.values_list("term__name", flat=True)),
+            {"lemon"},
+        )
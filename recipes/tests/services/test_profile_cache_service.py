@@ -0,0 +1,184 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from recipes.models import CloseFriend, Favourite, FavouriteItem, Follower, FollowRequest, RecipePost, User
+from recipes.services.follow import FollowService
+from recipes.services.profile_cache import ProfileCache
+import recipes.views.profile_view as profile_view
+import recipes.views.profile_view_logic as logic
+
+
+@override_settings(PROFILE_CACHE_TIMEOUT=60)
+class ProfileCacheTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.john = User.objects.get(username="@johndoe")
+        self.jane = User.objects.get(username="@janedoe")
+        self.peter = User.objects.get(username="@petrapickles")
+        self.profile_cache = ProfileCache()
+        self.builds = 0
+
+    def tearDown(self):
+        cache.clear()
+
+    def _build(self):
+        self.builds += 1
+        return {"builds": self.builds}
+
+    def test_get_or_build_reuses_block_until_bumped(self):
+        first = self.profile_cache.get_or_build(self.jane, "header", self._build)
+        again = self.profile_cache.get_or_build(self.jane, "header", self._build)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile_cache.bump(self.jane)
+        rebuilt = self.profile_cache.get_or_build(self.jane, "header", self._build)
+
+        self.assertEqual(first, again)
+        self.assertEqual(rebuilt, {"builds": 2})
+
+    def test_bump_waits_for_commit_and_survives_eviction(self):
+        self.profile_cache.get_or_build(self.jane, "header", self._build)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile_cache.bump(self.jane)
+            self.assertEqual(self.profile_cache.get_or_build(self.jane, "header", self._build), {"builds": 1})
+        self.assertEqual(self.profile_cache.get_or_build(self.jane, "header", self._build), {"builds": 2})
+
+        cache.delete(f"profile_cache:version:{self.jane.pk}")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile_cache.bump(self.jane)
+
+        self.assertEqual(self.profile_cache.get_or_build(self.jane, "header", self._build), {"builds": 3})
+
+    @override_settings(PROFILE_CACHE_TIMEOUT=None)
+    def test_disabled_cache_always_builds(self):
+        self.profile_cache.get_or_build(self.jane, "header", self._build)
+        self.profile_cache.get_or_build(self.jane, "header", self._build)
+
+        self.assertFalse(self.profile_cache.enabled())
+        self.assertEqual(self.builds, 2)
+
+    def test_model_changes_bump_the_affected_profiles(self):
+        def version(user):
+            return cache.get(f"profile_cache:version:{user.pk}", 0)
+
+        before = {user.pk: version(user) for user in (self.john, self.jane, self.peter)}
+        with self.captureOnCommitCallbacks(execute=True):
+            Follower.objects.create(follower=self.john, author=self.jane)
+        self.assertGreater(version(self.john), before[self.john.pk])
+        self.assertGreater(version(self.jane), before[self.jane.pk])
+
+        before_peter = version(self.peter)
+        with self.captureOnCommitCallbacks(execute=True):
+            post = RecipePost.objects.create(author=self.peter, title="T", description="d")
+        self.assertGreater(version(self.peter), before_peter)
+
+        before_jane = version(self.jane)
+        with self.captureOnCommitCallbacks(execute=True):
+            favourite = Favourite.objects.create(user=self.jane, name="Dinner")
+            FavouriteItem.objects.create(favourite=favourite, recipe_post=post)
+        self.assertEqual(version(self.jane), before_jane + 2)
+
+        before_john = version(self.john)
+        self.john.first_name = "Johnny"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.john.save()
+        self.assertGreater(version(self.john), before_john)
+
+    def test_bulk_follow_bumps_actor_and_targets(self):
+        before = cache.get(f"profile_cache:version:{self.peter.pk}", 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            FollowService(self.john).follow_many([self.peter])
+
+        self.assertGreater(cache.get(f"profile_cache:version:{self.peter.pk}", 0), before)
+
+    def test_follow_context_serves_lists_from_cache_and_refreshes_on_follow(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Follower.objects.create(follower=self.john, author=self.jane)
+        self.jane.refresh_from_db()
+        profile_view._follow_context(self.jane, self.john)
+
+        with self.assertNumQueries(2):
+            ctx = profile_view._follow_context(self.jane, self.peter)
+        self.assertEqual([u.id for u in ctx["followers_users"]], [self.john.id])
+        self.assertFalse(ctx["is_following"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Follower.objects.create(follower=self.peter, author=self.jane)
+        self.jane.refresh_from_db()
+        ctx = profile_view._follow_context(self.jane, self.peter)
+
+        self.assertTrue(ctx["is_following"])
+        self.assertEqual(ctx["followers_count"], 2)
+        self.assertEqual({u.id for u in ctx["followers_users"]}, {self.john.id, self.peter.id})
+
+    def test_cached_follow_lists_show_current_names_and_avatars(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Follower.objects.create(follower=self.john, author=self.jane)
+        self.jane.refresh_from_db()
+        profile_view._follow_context(self.jane, self.peter)
+        version = cache.get(f"profile_cache:version:{self.jane.pk}")
+
+        User.objects.filter(pk=self.john.pk).update(first_name="Renamed", avatar="avatars/new.png")
+        ctx = profile_view._follow_context(self.jane, self.peter)
+
+        self.assertEqual(cache.get(f"profile_cache:version:{self.jane.pk}"), version)
+        self.assertEqual(ctx["followers_users"][0].first_name, "Renamed")
+        self.assertIn("avatars/new.png", ctx["followers_users"][0].mini_avatar_url)
+
+    def test_pending_request_is_computed_per_viewer(self):
+        self.jane.is_private = True
+        self.jane.save()
+        FollowRequest.objects.create(requester=self.john, target=self.jane, status=FollowRequest.STATUS_PENDING)
+
+        john_ctx = profile_view._follow_context(self.jane, self.john)
+        peter_ctx = profile_view._follow_context(self.jane, self.peter)
+
+        self.assertIsNotNone(john_ctx["pending_request"])
+        self.assertIsNone(peter_ctx["pending_request"])
+        self.assertFalse(peter_ctx["can_view_follow_lists"])
+
+    def test_collections_grid_cached_until_collection_changes(self):
+        deps = profile_view._deps()
+        post = RecipePost.objects.create(author=self.jane, title="T", description="d")
+        favourite = Favourite.objects.create(user=self.jane, name="Dinner")
+        self.assertEqual(logic.profile_collections(self.jane, deps)[0]["count"], 0)
+
+        with self.assertNumQueries(0):
+            logic.profile_collections(self.jane, deps)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            FavouriteItem.objects.create(favourite=favourite, recipe_post=post)
+        self.assertEqual(logic.profile_collections(self.jane, deps)[0]["count"], 1)
+
+    def test_cached_collections_show_current_cover_images(self):
+        deps = profile_view._deps()
+        post = RecipePost.objects.create(author=self.john, title="T", description="d", image="old.png")
+        favourite = Favourite.objects.create(user=self.jane, name="Dinner")
+        FavouriteItem.objects.create(favourite=favourite, recipe_post=post)
+        self.assertEqual(logic.profile_collections(self.jane, deps)[0]["cover"], "old.png")
+
+        RecipePost.objects.filter(pk=post.pk).update(image="new.png")
+        self.assertEqual(logic.profile_collections(self.jane, deps)[0]["cover"], "new.png")
+
+        RecipePost.objects.filter(pk=post.pk).update(image="")
+        card = logic.profile_collections(self.jane, deps)[0]
+        self.assertIsNone(card["cover"])
+        self.assertFalse(card["has_image"])
+
+    def test_close_friend_change_refreshes_owner_stats(self):
+        Follower.objects.create(follower=self.jane, author=self.john)
+        self.john.refresh_from_db()
+        deps = profile_view._deps()
+        ctx = logic.follow_context(self.john, self.john, deps)
+        self.assertEqual(logic.profile_stats(self.john, ctx, deps)["close_friends_count"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CloseFriend.objects.create(owner=self.john, friend=self.jane)
+        ctx = logic.follow_context(self.john, self.john, deps)
+
+        self.assertEqual(logic.profile_stats(self.john, ctx, deps)["close_friends_count"], 1)
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from PIL import Image
+
+from recipes.models import RecipePost, User
+from recipes.models.recipe_post import RecipeImage
+from recipes.services.recipe_images import RecipeImageService, is_valid_image, sniff_image_format
+from recipes.tests.forms.form_file_helpers import image_bytes
+from recipes.tests.media import TempMediaMixin
+
+
+class RecipeImageServiceTestCase(TempMediaMixin, TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(username="@johndoe")
+        self.post = RecipePost.objects.create(
+            author=self.user, title="Pie", description="d", published_at=timezone.now()
+        )
+        self.service = RecipeImageService(max_side=8)
+
+    def _attach(self, name, content, position=0):
+        return RecipeImage.objects.create(
+            recipe_post=self.post, image=SimpleUploadedFile(name, content), position=position
+        )
+
+    def test_sniff_image_format_reads_magic_bytes(self):
+        self.assertEqual(sniff_image_format(SimpleUploadedFile("a.bin", image_bytes("PNG"))), "PNG")
+        self.assertEqual(sniff_image_format(SimpleUploadedFile("a.jpg", image_bytes("WEBP"))), "WEBP")
+        self.assertIsNone(sniff_image_format(SimpleUploadedFile("a.jpg", b"GIF-ish text")))
+
+    def test_is_valid_image_rewinds_the_upload(self):
+        upload = SimpleUploadedFile("a.png", image_bytes("PNG"))
+        self.assertTrue(is_valid_image(upload))
+        self.assertEqual(upload.tell(), 0)
+
+    def test_process_pending_writes_display_and_marks_ready(self):
+        first = self._attach("big.png", image_bytes("PNG", size=(32, 16)))
+        self._attach("second.jpg", image_bytes("JPEG"), position=1)
+        self.service.mark_pending(self.post)
+
+        processed = self.service.process_pending()
+
+        self.assertEqual(processed, 1)
+        self.post.refresh_from_db()
+        first.refresh_from_db()
+        self.assertEqual(self.post.image_status, RecipePost.IMAGES_READY)
+        self.assertEqual(self.post.image, first.display.url)
+        self.assertEqual(self.post.primary_image_url, first.display.url)
+        with first.display.open("rb") as handle, Image.open(handle) as display:
+            self.assertEqual(display.format, "JPEG")
+            self.assertEqual(display.size, (8, 4))
+
+    def test_primary_image_url_falls_back_to_original_upload(self):
+        first = self._attach("raw.jpg", image_bytes("JPEG"))
+
+        self.assertEqual(self.post.primary_image_url, first.image.url)
+
+    def test_pending_posts_are_claimed_by_one_worker(self):
+        self._attach("only.jpg", image_bytes("JPEG"))
+        self.service.mark_pending(self.post)
+
+        claimed = self.service.pending_posts()
+
+        self.assertEqual([post.id for post in claimed], [self.post.id])
+        self.assertEqual(RecipeImageService().pending_posts(), [])
+        self.assertFalse(RecipeImageService().process_post(self.post))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.image_status, RecipePost.IMAGES_PROCESSING)
+
+    def test_stale_claims_are_picked_up_again(self):
+        self.service.mark_pending(self.post)
+        self.service.pending_posts()
+        RecipePost.objects.filter(id=self.post.id).update(updated_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(len(self.service.pending_posts()), 1)
+
+    def test_uploads_during_processing_leave_the_post_pending(self):
+        self._attach("keep.jpg", image_bytes("JPEG"))
+        self.service.mark_pending(self.post)
+        post = self.service.pending_posts()[0]
+        self.service.mark_pending(self.post)
+
+        self.service.process_post(post)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.image_status, RecipePost.IMAGES_PENDING)
+
+    def test_process_post_marks_failed_when_image_is_unreadable(self):
+        self._attach("broken.jpg", b"not really an image")
+        self.service.mark_pending(self.post)
+
+        with self.assertLogs("recipes.services.recipe_images", level="ERROR"):
+            self.service.process_post(self.post)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.image_status, RecipePost.IMAGES_FAILED)
+
+    def test_command_processes_pending_posts(self):
+        self._attach("cmd.jpg", image_bytes("JPEG"))
+        RecipeImageService().mark_pending(self.post)
+        out = StringIO()
+
+        call_command("process_recipe_images", stdout=out)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.image_status, RecipePost.IMAGES_READY)
+        self.assertIn("1 post(s)", out.getvalue())
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.test import RequestFactory, TestCase
 
 from recipes.models import Favourite, FavouriteItem, RecipePost, User, Comment
@@ -40,6 +42,42 @@ class RecipeContentServiceTests(TestCase):
         self.assertEqual(len(posts), 1)
         self.assertEqual(posts[0], self.post)
 
+    def test_saved_posts_page_orders_by_latest_save_and_pages_by_cursor(self):
+        fav1 = Favourite.objects.create(user=self.user, name="A")
+        fav2 = Favourite.objects.create(user=self.user, name="B")
+        older = RecipePost.objects.create(author=self.user, title="Older", description="d")
+        FavouriteItem.objects.create(favourite=fav1, recipe_post=older)
+        FavouriteItem.objects.create(favourite=fav1, recipe_post=self.post)
+        resaved = FavouriteItem.objects.create(favourite=fav2, recipe_post=older)
+        FavouriteItem.objects.filter(id=resaved.id).update(added_at=resaved.added_at + timedelta(hours=1))
+
+        first, cursor = self.engagement.saved_posts_page(self.user, limit=1)
+        second, last_cursor = self.engagement.saved_posts_page(self.user, after=cursor, limit=1)
+
+        self.assertEqual(first, [older])
+        self.assertEqual(second, [self.post])
+        self.assertIsNone(last_cursor)
+
+    def test_saved_posts_page_drops_posts_that_became_private(self):
+        other = User.objects.create_user(username="@other", email="other@example.com", password="Password123")
+        hidden = RecipePost.objects.create(author=other, title="Hidden", description="d")
+        fav = Favourite.objects.create(user=self.user, name="A")
+        FavouriteItem.objects.create(favourite=fav, recipe_post=hidden)
+        FavouriteItem.objects.create(favourite=fav, recipe_post=self.post)
+        RecipePost.objects.filter(id=hidden.id).update(visibility=RecipePost.VISIBILITY_FOLLOWERS)
+
+        posts, _ = self.engagement.saved_posts_page(self.user)
+
+        self.assertEqual(posts, [self.post])
+
+    def test_saved_posts_page_ignores_malformed_cursor(self):
+        fav = Favourite.objects.create(user=self.user, name="A")
+        FavouriteItem.objects.create(favourite=fav, recipe_post=self.post)
+
+        posts, _ = self.engagement.saved_posts_page(self.user, after="not-a-cursor")
+
+        self.assertEqual(posts, [self.post])
+
     def test_comments_page_handles_invalid_page_number(self):
         Comment.objects.create(recipe_post=self.post, user=self.user, text="c1")
         Comment.objects.create(recipe_post=self.post, user=self.user, text="c2")
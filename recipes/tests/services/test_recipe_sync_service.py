@@ -0,0 +1,148 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from recipes.models import CloseFriend, Comment, Follower, Like, RecipeChange, RecipePost, User
+from recipes.services.recipe_sync import RecipeSyncService
+
+
+@override_settings(RECIPE_SYNC_COMMIT_LAG=0)
+class RecipeSyncServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.viewer = User.objects.get(username="@johndoe")
+        self.author = User.objects.get(username="@janedoe")
+        self.service = RecipeSyncService()
+        self.post = RecipePost.objects.create(author=self.author, title="Soup", description="d")
+        self.token = self.service.latest_token()
+
+    def test_missing_or_unknown_token_asks_for_reset(self):
+        for token in (None, "abc", str(int(self.token) + 50)):
+            result = self.service.changes_since(self.viewer, token)
+            self.assertTrue(result["reset"])
+            self.assertEqual(result["next"], self.token)
+
+    def test_reports_created_updated_and_deleted_ids(self):
+        created = RecipePost.objects.create(author=self.author, title="Stew", description="d")
+        self.post.title = "Better soup"
+        self.post.save()
+        doomed = RecipePost.objects.create(author=self.author, title="Gone", description="d")
+        doomed_id = doomed.id
+        doomed.delete()
+
+        result = self.service.changes_since(self.viewer, self.token)
+
+        self.assertFalse(result["reset"])
+        self.assertEqual(result["created"], [created.id])
+        self.assertEqual(result["updated"], [self.post.id])
+        self.assertEqual(result["deleted"], [doomed_id])
+        self.assertEqual(result["next"], self.service.latest_token())
+        self.assertEqual(self.service.changes_since(self.viewer, result["next"])["updated"], [])
+
+    def test_engagement_changes_return_counters(self):
+        Like.objects.create(user=self.viewer, recipe_post=self.post)
+        Comment.objects.create(recipe_post=self.post, user=self.viewer, text="Yum")
+
+        result = self.service.changes_since(self.viewer, self.token)
+
+        self.assertEqual(result["updated"], [])
+        self.assertEqual(result["counters"][str(self.post.id)], {"likes": 1, "saved": 0, "comments": 1})
+
+    def test_engagement_rows_are_coalesced_per_recipe(self):
+        Like.objects.create(user=self.viewer, recipe_post=self.post)
+        middle = self.service.latest_token()
+        Comment.objects.create(recipe_post=self.post, user=self.viewer, text="Yum")
+        Comment.objects.create(recipe_post=self.post, user=self.author, text="Thanks")
+
+        engagement = RecipeChange.objects.filter(kind=RecipeChange.KIND_ENGAGEMENT, recipe_post_id=self.post.id)
+        self.assertEqual(engagement.count(), 1)
+        for token in (self.token, middle):
+            result = self.service.changes_since(self.viewer, token)
+            self.assertEqual(result["counters"][str(self.post.id)], {"likes": 1, "saved": 0, "comments": 2})
+
+    def test_posts_leaving_the_visible_set_are_reported_deleted(self):
+        self.post.visibility = RecipePost.VISIBILITY_CLOSE_FRIENDS
+        self.post.save()
+        RecipePost.objects.create(
+            author=self.author, title="Secret", description="d", visibility=RecipePost.VISIBILITY_FOLLOWERS
+        )
+
+        result = self.service.changes_since(self.viewer, self.token)
+
+        self.assertEqual(result["deleted"], [self.post.id])
+        self.assertEqual(result["created"], [])
+        self.assertEqual(result["counters"], {})
+
+    def test_audience_changes_ask_for_reset(self):
+        Follower.objects.create(follower=self.viewer, author=self.author)
+        self.assertTrue(self.service.changes_since(self.viewer, self.token)["reset"])
+
+        token = self.service.latest_token()
+        CloseFriend.objects.create(owner=self.viewer, friend=self.author)
+        self.assertFalse(self.service.changes_since(self.viewer, token)["reset"])
+        self.assertTrue(self.service.changes_since(self.author, token)["reset"])
+
+    def test_privacy_flip_marks_author_posts_updated(self):
+        self.author.is_private = True
+        self.author.save()
+
+        result = self.service.changes_since(self.viewer, self.token)
+
+        self.assertEqual(result["deleted"], [self.post.id])
+
+    def test_batches_are_limited(self):
+        for i in range(3):
+            RecipePost.objects.create(author=self.author, title=f"Batch {i}", description="d")
+
+        first = self.service.changes_since(self.viewer, self.token, limit=2)
+        second = self.service.changes_since(self.viewer, first["next"], limit=2)
+
+        self.assertTrue(first["has_more"])
+        self.assertEqual(len(first["created"]), 2)
+        self.assertFalse(second["has_more"])
+        self.assertEqual(len(second["created"]), 1)
+
+    @override_settings(RECIPE_SYNC_COMMIT_LAG=60)
+    def test_changes_inside_the_commit_lag_window_are_held_back(self):
+        RecipeChange.objects.update(created_at=timezone.now() - timedelta(minutes=5))
+        token = self.service.latest_token()
+        fresh = RecipePost.objects.create(author=self.author, title="Fresh", description="d")
+
+        held = self.service.changes_since(self.viewer, token)
+        self.assertEqual((held["created"], held["next"]), ([], token))
+        self.assertEqual(self.service.latest_token(), token)
+
+        RecipeChange.objects.update(created_at=timezone.now() - timedelta(minutes=5))
+        self.assertEqual(self.service.changes_since(self.viewer, token)["created"], [fresh.id])
+
+    def test_prune_invalidates_old_tokens(self):
+        old_token = self.token
+        RecipePost.objects.create(author=self.author, title="New", description="d")
+        RecipeChange.objects.update(created_at=timezone.now() - timedelta(days=40))
+
+        call_command("prune_recipe_changes", "--days", "30", stdout=StringIO())
+
+        self.assertEqual(RecipeChange.objects.count(), 1)
+        self.assertTrue(self.service.changes_since(self.viewer, str(int(old_token) - 1))["reset"])
+        self.assertFalse(self.service.changes_since(self.viewer, self.service.latest_token())["reset"])
+
+    def test_sync_api_requires_auth_and_returns_changes(self):
+        client = APIClient()
+        url = reverse("recipe_sync_api")
+        self.assertIn(client.get(url).status_code, [401, 403])
+
+        client.force_authenticate(user=self.viewer)
+        RecipePost.objects.create(author=self.author, title="Api", description="d")
+        response = client.get(url, {"since": self.token})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["created"]), 1)
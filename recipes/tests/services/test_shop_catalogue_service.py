@@ -0,0 +1,99 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from recipes.models import CloseFriend, Follower, Ingredient, RecipePost, ShopItem, ShopItemWord, User
+from recipes.services.ingredient_terms import IngredientTermService
+from recipes.services.shop import ShopService
+
+
+class ShopCatalogueServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.viewer = User.objects.get(username="@johndoe")
+        self.author = User.objects.get(username="@janedoe")
+        self.post = RecipePost.objects.create(author=self.author, title="Cake", description="d")
+        self.flour = Ingredient.objects.create(
+            recipe_post=self.post, name="Flour", shop_url="https://shop.example/flour", position=1
+        )
+        self.service = ShopService()
+
+    def _names(self, user):
+        return sorted(self.service.visible_items(user).values_list("name", flat=True))
+
+    def test_ingredient_writes_maintain_rows(self):
+        Ingredient.objects.create(recipe_post=self.post, name="Water", shop_url="  ", position=2)
+
+        item = ShopItem.objects.get(ingredient=self.flour)
+        self.assertEqual((item.name, item.author_id, item.has_shop_url), ("flour", self.author.id, True))
+        self.assertFalse(ShopItem.objects.get(name="water").has_shop_url)
+        self.assertEqual(self._names(self.viewer), ["flour"])
+
+        self.flour.delete()
+        self.assertFalse(ShopItem.objects.filter(name="flour").exists())
+
+    def test_post_visibility_and_close_friends(self):
+        self.post.visibility = RecipePost.VISIBILITY_CLOSE_FRIENDS
+        self.post.save()
+        self.assertEqual(self._names(self.viewer), [])
+
+        CloseFriend.objects.create(owner=self.author, friend=self.viewer)
+        self.assertEqual(self._names(self.viewer), ["flour"])
+        self.assertEqual(self._names(None), [])
+
+    def test_author_privacy_flip(self):
+        self.author.is_private = True
+        self.author.save()
+        self.assertTrue(ShopItem.objects.get(ingredient=self.flour).author_is_private)
+        self.assertEqual(self._names(self.viewer), [])
+
+        Follower.objects.create(follower=self.viewer, author=self.author)
+        self.assertEqual(self._names(self.viewer), ["flour"])
+
+    def test_search_matches_name_and_term(self):
+        Ingredient.objects.create(recipe_post=self.post, name="Caster sugar", shop_url="https://shop.example/s", position=2)
+
+        page = self.service.search_items_page(self.viewer, "sugar", 1)
+        self.assertEqual([item.name for item in page.object_list], ["caster sugar"])
+        self.assertEqual(page.object_list[0].recipe_post, self.post)
+
+        page = self.service.search_items_page(self.viewer, "", 1)
+        self.assertEqual([item.name for item in page.object_list], ["caster sugar", "flour"])
+
+    def test_search_prefix_matches_every_query_word_through_the_word_index(self):
+        sugar = Ingredient.objects.create(
+            recipe_post=self.post, name="Golden caster sugar", shop_url="https://shop.example/s", position=2
+        )
+        self.assertEqual(
+            sorted(ShopItemWord.objects.filter(item_id=sugar.pk).values_list("word", flat=True)),
+            ["caster", "golden", "sugar"],
+        )
+
+        def names(query):
+            return [item.name for item in self.service.search_items_page(self.viewer, query, 1).object_list]
+
+        self.assertEqual(names("cast gold"), ["golden caster sugar"])
+        self.assertEqual(names("fl"), ["flour"])
+        self.assertEqual(names("ugar"), [])
+        self.assertEqual(names("caster flour"), [])
+
+        sugar.name = "Icing sugar"
+        sugar.save()
+        self.assertEqual(names("gold"), [])
+        self.assertEqual(names("icing"), ["icing sugar"])
+
+    def test_term_backfill_and_rebuild_command(self):
+        Ingredient.objects.filter(pk=self.flour.pk).update(term=None)
+        ShopItem.objects.update(term=None)
+
+        IngredientTermService().backfill()
+        self.assertIsNotNone(ShopItem.objects.get(ingredient=self.flour).term_id)
+
+        ShopItem.objects.all().delete()
+        call_command("rebuild_shop_catalogue", stdout=StringIO())
+        self.assertEqual(list(ShopItem.objects.values_list("ingredient_id", flat=True)), [self.flour.pk])
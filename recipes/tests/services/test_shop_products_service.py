@@ -0,0 +1,132 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from recipes.models import Ingredient, RecipePost, ShopItem, ShopProduct, User
+from recipes.services.shop import ShopService
+from recipes.services.shop_products import ShopProductService
+from recipes.tests.media import TempMediaMixin
+from recipes.utils.shop_urls import normalise_shop_url
+
+
+class ShopProductServiceTestCase(TempMediaMixin, TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(username="@johndoe")
+        self.cake = RecipePost.objects.create(author=self.user, title="Cake", description="d")
+        self.bread = RecipePost.objects.create(author=self.user, title="Bread", description="d")
+
+    def _ingredient(self, post, name, url, image=None, position=1):
+        return Ingredient.objects.create(
+            recipe_post=post, name=name, shop_url=url, shop_image_upload=image, position=position
+        )
+
+    def _image(self, content=b"same-bytes"):
+        return SimpleUploadedFile("flour.jpg", content, content_type="image/jpeg")
+
+    def test_normalise_shop_url(self):
+        self.assertEqual(
+            normalise_shop_url("https://WWW.Shop.example/flour/?utm_source=x&b=2&a=1#top"),
+            "shop.example/flour?a=1&b=2",
+        )
+        self.assertEqual(normalise_shop_url("http://shop.example/flour"), "shop.example/flour")
+        self.assertEqual(normalise_shop_url("  "), "")
+
+    def test_same_url_shares_one_counted_product(self):
+        first = self._ingredient(self.cake, "Flour", "https://shop.example/flour")
+        second = self._ingredient(self.bread, "Plain flour", "http://www.shop.example/flour/?utm_medium=x")
+        self._ingredient(self.bread, "Water", "", position=2)
+
+        product = ShopProduct.objects.get()
+        self.assertEqual((product.name, product.ingredient_count), ("flour", 2))
+        self.assertEqual(ShopItem.objects.filter(product=product).count(), 2)
+
+        first.delete()
+        product.refresh_from_db()
+        self.assertEqual(product.ingredient_count, 1)
+        second.shop_url = "https://shop.example/other"
+        second.save()
+        self.assertEqual(list(ShopProduct.objects.values_list("url_key", "ingredient_count")), [("shop.example/other", 1)])
+
+    def test_identical_images_are_stored_once(self):
+        first = self._ingredient(self.cake, "Flour", "https://shop.example/flour", self._image())
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            second = self._ingredient(self.bread, "Flour", "https://shop.example/flour", self._image())
+        self.assertEqual(callbacks, [])
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        product = ShopProduct.objects.get()
+        self.assertEqual(first.shop_image_upload.name, second.shop_image_upload.name)
+        self.assertEqual(product.image.name, first.shop_image_upload.name)
+        self.assertTrue(product.image.name.startswith(f"shop_products/{product.image_hash[:2]}/"))
+        self.assertTrue(product.image.storage.exists(product.image.name))
+
+    def test_orphaned_uploads_are_only_removed_by_the_sweep(self):
+        service = ShopProductService()
+        service.delete_orphaned_uploads(min_age=timedelta(0))
+        self._ingredient(self.cake, "Flour", "https://shop.example/flour", self._image())
+        _, uploads = service.storage.listdir("shop_items")
+        self.assertEqual(len(uploads), 1)
+
+        self.assertEqual(service.delete_orphaned_uploads(), 0)
+        self.assertEqual(service.delete_orphaned_uploads(min_age=timedelta(0)), 1)
+        self.assertFalse(service.storage.exists(f"shop_items/{uploads[0]}"))
+        self.assertTrue(service.storage.exists(Ingredient.objects.get().shop_image_upload.name))
+
+    def test_attach_many_links_a_batch_with_one_count_update_per_product(self):
+        rows = Ingredient.objects.bulk_create([
+            Ingredient(recipe_post=self.cake, name="flour", shop_url="https://shop.example/flour", position=1),
+            Ingredient(recipe_post=self.bread, name="flour", shop_url="http://shop.example/flour/", position=1),
+            Ingredient(recipe_post=self.bread, name="water", shop_url="", position=2),
+        ])
+
+        linked = ShopProductService().attach_many([row.pk for row in rows])
+
+        product = ShopProduct.objects.get()
+        self.assertEqual((linked, product.ingredient_count), (2, 2))
+        self.assertEqual(Ingredient.objects.filter(product=product).count(), 2)
+
+    def test_shop_lists_products_once_with_use_count(self):
+        self._ingredient(self.cake, "Flour", "https://shop.example/flour")
+        self._ingredient(self.bread, "Flour", "https://shop.example/flour")
+
+        page = ShopService().paginated_shuffled_items(self.user, "seed", 1)
+
+        self.assertEqual(len(page.object_list), 1)
+        self.assertEqual(page.object_list[0].recipe_count, 2)
+        self.assertEqual(page.object_list[0].recipe_post, self.bread)
+
+    def test_cards_only_use_ingredients_the_viewer_can_see(self):
+        self.cake.visibility = RecipePost.VISIBILITY_CLOSE_FRIENDS
+        self.cake.save()
+        self._ingredient(self.cake, "Secret flour", "https://shop.example/flour", self._image(b"secret"))
+        self._ingredient(self.bread, "Flour", "https://shop.example/flour")
+        self._ingredient(self.bread, "Flour again", "https://shop.example/flour/", position=2)
+        stranger = User.objects.get(username="@janedoe")
+
+        card = ShopService().paginated_shuffled_items(stranger, "seed", 1).object_list[0]
+
+        self.assertEqual((card.name, card.recipe_post, card.recipe_count), ("flour again", self.bread, 1))
+        self.assertIsNone(card.image)
+        self.assertEqual(ShopProduct.objects.get().ingredient_count, 3)
+
+    def test_rebuild_relinks_and_recounts(self):
+        self._ingredient(self.cake, "Flour", "https://shop.example/flour")
+        self._ingredient(self.bread, "Flour", "https://shop.example/flour/")
+        Ingredient.objects.update(product=None)
+        ShopProduct.objects.all().delete()
+
+        call_command("rebuild_shop_catalogue", stdout=StringIO())
+
+        product = ShopProduct.objects.get()
+        self.assertEqual(product.ingredient_count, 2)
+        self.assertEqual(Ingredient.objects.filter(product=product).count(), 2)
+        self.assertEqual(ShopItem.objects.filter(product=product).count(), 2)
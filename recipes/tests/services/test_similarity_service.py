@@ -0,0 +1,93 @@
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from recipes.models import Ingredient, Like, RecipePost, SimilarRecipe, User
+from recipes.models.recipe_post import RecipeImage
+from recipes.services.similarity import SimilarityService
+from recipes.tests.media import TempMediaMixin
+
+
+class SimilarityServiceTestCase(TempMediaMixin, TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.viewer = User.objects.get(username="@johndoe")
+        self.author = User.objects.get(username="@janedoe")
+        self.liker = User.objects.get(username="@petrapickles")
+        self.service = SimilarityService()
+        self.pasta = self._post("Pasta", ["italian", "quick"], "dinner", ["tomato", "basil", "pasta"])
+        self.pizza = self._post("Pizza", ["italian"], "dinner", ["tomato", "basil", "flour"])
+        self.cake = self._post("Cake", ["sweet"], "dessert", ["sugar", "flour"])
+        self.salad = self._post("Salad", ["fresh"], "lunch", ["lettuce"])
+
+    def _post(self, title, tags, category, ingredients, **extra):
+        post = RecipePost.objects.create(
+            author=self.author,
+            title=title,
+            description=f"{title} desc",
+            tags=tags,
+            category=category,
+            published_at=timezone.now(),
+            **extra,
+        )
+        for idx, name in enumerate(ingredients, start=1):
+            Ingredient.objects.create(recipe_post=post, name=name, position=idx)
+        return post
+
+    def test_compute_neighbours_ranks_by_content_overlap(self):
+        neighbours = self.service.compute_neighbours()
+        ranked_ids = [post_id for post_id, _ in neighbours[self.pasta.id]]
+        self.assertEqual(ranked_ids[0], self.pizza.id)
+        self.assertNotIn(self.salad.id, ranked_ids)
+
+    def test_co_likes_link_posts_without_shared_content(self):
+        Like.objects.create(user=self.liker, recipe_post=self.salad)
+        Like.objects.create(user=self.liker, recipe_post=self.cake)
+        neighbours = self.service.compute_neighbours()
+        self.assertIn(self.cake.id, [post_id for post_id, _ in neighbours[self.salad.id]])
+
+    def test_rebuild_replaces_rows_and_respects_top_k(self):
+        SimilarRecipe.objects.create(recipe_post=self.salad, similar_post=self.pasta, rank=1)
+        written = SimilarityService(top_k=1).rebuild()
+        self.assertEqual(written, SimilarRecipe.objects.count())
+        self.assertFalse(SimilarRecipe.objects.filter(recipe_post=self.salad).exists())
+        self.assertEqual(SimilarRecipe.objects.filter(recipe_post=self.pasta).count(), 1)
+
+    def test_hidden_and_unpublished_posts_are_excluded(self):
+        hidden = self._post("Hidden pasta", ["italian", "quick"], "dinner", ["tomato", "basil", "pasta"], is_hidden=True)
+        self.service.rebuild()
+        self.assertFalse(SimilarRecipe.objects.filter(similar_post=hidden).exists())
+        self.assertFalse(SimilarRecipe.objects.filter(recipe_post=hidden).exists())
+
+    def test_view_similar_items_filters_private_posts(self):
+        self.service.rebuild()
+        self.pasta.visibility = RecipePost.VISIBILITY_FOLLOWERS
+        self.pasta.save()
+        items = self.service.view_similar_items(self.pizza, self.viewer)
+        titles = [item["title"] for item in items]
+        self.assertNotIn("Pasta", titles)
+        self.assertIn("Cake", titles)
+        self.assertTrue(all(item["image"] for item in items))
+
+    def test_view_similar_items_use_gallery_images(self):
+        self.service.rebuild()
+        for post in (self.pasta, self.cake):
+            RecipeImage.objects.create(recipe_post=post, image=SimpleUploadedFile(f"{post.title}.jpg", b"x"))
+
+        with self.assertNumQueries(2):
+            items = self.service.view_similar_items(self.pizza, self.viewer)
+
+        images = {item["title"]: item["image"] for item in items}
+        self.assertEqual(images["Pasta"], self.pasta.images.get().image.url)
+        self.assertEqual(images["Cake"], self.cake.images.get().image.url)
+
+    def test_refresh_command_populates_table(self):
+        call_command("refresh_similar_recipes", "--top-k", "2", stdout=StringIO())
+        self.assertTrue(SimilarRecipe.objects.filter(recipe_post=self.pasta, rank=1).exists())
@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from recipes.models import CloseFriend, Follower, User
+from recipes.services.social_graph import SocialGraph, request_scope
+
+
+class SocialGraphTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.alice = User.objects.get(username="@johndoe")
+        self.bob = User.objects.get(username="@janedoe")
+        self.cara = User.objects.get(username="@petrapickles")
+        Follower.objects.create(follower=self.alice, author=self.bob)
+        Follower.objects.create(follower=self.bob, author=self.alice)
+        Follower.objects.create(follower=self.alice, author=self.cara)
+        CloseFriend.objects.create(owner=self.alice, friend=self.bob)
+        self.graph = SocialGraph()
+
+    def test_adjacency_queries(self):
+        self.assertTrue(self.graph.is_following(self.alice, self.cara))
+        self.assertFalse(self.graph.is_following(self.cara, self.alice))
+        self.assertEqual(self.graph.followers_of(self.alice), {self.bob.id})
+        self.assertEqual(self.graph.mutuals(self.alice), {self.bob.id})
+        self.assertEqual(self.graph.close_friend_ids(self.alice), {self.bob.id})
+        self.assertTrue(self.graph.is_close_friend(self.bob, self.alice))
+        self.assertFalse(self.graph.is_close_friend(self.alice, self.bob))
+
+    def test_request_scope_loads_each_direction_once(self):
+        with request_scope():
+            with self.assertNumQueries(1):
+                for _ in range(3):
+                    self.graph.is_following(self.alice, self.bob)
+                    SocialGraph().following_ids(self.alice)
+
+    def test_follow_changes_invalidate_request_memo(self):
+        with request_scope():
+            self.assertFalse(self.graph.is_following(self.cara, self.alice))
+            relation = Follower.objects.create(follower=self.cara, author=self.alice)
+            self.assertTrue(self.graph.is_following(self.cara, self.alice))
+            relation.delete()
+            self.assertFalse(self.graph.is_following(self.cara, self.alice))
+
+    @override_settings(SOCIAL_GRAPH_CACHE_TIMEOUT=60)
+    def test_shared_cache_is_versioned_per_user(self):
+        cache.clear()
+        self.assertEqual(self.graph.following_ids(self.cara), frozenset())
+        with self.assertNumQueries(0):
+            self.graph.following_ids(self.cara)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Follower.objects.create(follower=self.cara, author=self.bob)
+            self.assertEqual(self.graph.following_ids(self.cara), {self.bob.id})
+        version = cache.get(f"social_graph:version:{self.cara.id}")
+        for callback in callbacks:
+            callback()
+
+        self.assertGreater(cache.get(f"social_graph:version:{self.cara.id}"), version)
+        self.assertEqual(self.graph.following_ids(self.cara), {self.bob.id})
+
+    @override_settings(SOCIAL_GRAPH_CACHE_TIMEOUT=60)
+    def test_evicted_version_never_restarts_at_an_old_stamp(self):
+        cache.clear()
+        self.graph.following_ids(self.cara)
+        with self.captureOnCommitCallbacks(execute=True):
+            Follower.objects.create(follower=self.cara, author=self.bob)
+        self.assertEqual(self.graph.following_ids(self.cara), {self.bob.id})
+
+        cache.delete(f"social_graph:version:{self.cara.id}")
+        with self.captureOnCommitCallbacks(execute=True):
+            Follower.objects.filter(follower=self.cara).delete()
+
+        self.assertEqual(self.graph.following_ids(self.cara), frozenset())
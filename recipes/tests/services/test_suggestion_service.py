@@ -0,0 +1,108 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from recipes.models import Follower, Like, RecipePost, User, UserSuggestion
+from recipes.services.suggestions import SuggestionService
+
+
+class SuggestionServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.john = User.objects.get(username="@johndoe")
+        self.jane = User.objects.get(username="@janedoe")
+        self.petra = User.objects.get(username="@petrapickles")
+        self.peter = User.objects.get(username="@peterpickles")
+        self.service = SuggestionService()
+
+    def _follow(self, follower, author):
+        return Follower.objects.create(follower=follower, author=author)
+
+    def _rows(self, user):
+        return {
+            row.suggested_id: row.mutual_count
+            for row in UserSuggestion.objects.filter(user=user, mutual_count__gt=0)
+        }
+
+    def test_compute_ranks_by_mutuals_then_shared_liked_tags(self):
+        self._follow(self.john, self.jane)
+        self._follow(self.john, self.petra)
+        self._follow(self.jane, self.peter)
+        self._follow(self.petra, self.peter)
+        self._follow(self.jane, self.petra)
+        post = RecipePost.objects.create(author=self.jane, title="T", description="d", tags=["vegan", "category:x"])
+        Like.objects.create(user=self.john, recipe_post=post)
+        Like.objects.create(user=self.peter, recipe_post=post)
+
+        ranked = self.service.compute_for_user(self.john.id)
+
+        self.assertEqual([row[0] for row in ranked], [self.peter.id])
+        self.assertEqual(ranked[0][1:3], (2, 1))
+        self.assertAlmostEqual(ranked[0][3], 2.25)
+
+    def test_follow_events_patch_suggestions_incrementally(self):
+        self._follow(self.jane, self.peter)
+        self._follow(self.petra, self.john)
+        self._follow(self.john, self.jane)
+
+        self.assertEqual(self._rows(self.john), {self.peter.id: 1})
+        self.assertEqual(self._rows(self.petra), {self.jane.id: 1})
+
+        self._follow(self.john, self.peter)
+        self.assertEqual(self._rows(self.john), {})
+        self.assertEqual(self._rows(self.petra), {self.jane.id: 1, self.peter.id: 1})
+
+        Follower.objects.get(follower=self.john, author=self.jane).delete()
+        self.assertEqual(self._rows(self.petra), {self.peter.id: 1})
+
+    def test_unfollow_restores_the_suggestion_removed_at_follow_time(self):
+        self._follow(self.john, self.jane)
+        self._follow(self.jane, self.peter)
+        self._follow(self.john, self.peter)
+        self.assertEqual(self._rows(self.john), {})
+
+        Follower.objects.get(follower=self.john, author=self.peter).delete()
+
+        self.assertEqual(self._rows(self.john), {self.peter.id: 1})
+
+    @patch("recipes.services.suggestions.MAX_STORED_PER_USER", 1)
+    def test_follow_events_cap_stored_rows_per_user(self):
+        UserSuggestion.objects.create(user=self.john, suggested=self.peter, mutual_count=3, score=3)
+        self._follow(self.jane, self.petra)
+
+        self._follow(self.john, self.jane)
+
+        self.assertEqual(self._rows(self.john), {self.peter.id: 3})
+
+    def test_incremental_rows_match_full_refresh(self):
+        self._follow(self.john, self.jane)
+        self._follow(self.john, self.petra)
+        self._follow(self.jane, self.peter)
+        self._follow(self.petra, self.peter)
+        incremental = self._rows(self.john)
+
+        self.service.rebuild()
+
+        self.assertEqual(self._rows(self.john), incremental)
+        self.assertEqual(incremental, {self.peter.id: 2})
+
+    def test_suggested_users_skip_followed_accounts(self):
+        self._follow(self.john, self.jane)
+        self._follow(self.jane, self.peter)
+        self.assertEqual(self.service.suggested_users(self.john), [self.peter])
+
+        Follower.objects.bulk_create([Follower(follower=self.john, author=self.peter)])
+        self.assertEqual(SuggestionService().suggested_users(self.john), [])
+
+    def test_refresh_command_reports_rows(self):
+        self._follow(self.john, self.jane)
+        self._follow(self.jane, self.peter)
+        out = StringIO()
+        call_command("refresh_user_suggestions", "--user", self.john.username, stdout=out)
+        self.assertIn("Stored 1 user-suggestion rows", out.getvalue())
@@ -0,0 +1,88 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from recipes.models import Follower, RecipePost, User
+from recipes.services.user_counts import UserCountsService
+
+
+class UserCountsServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.john = User.objects.get(username="@johndoe")
+        self.jane = User.objects.get(username="@janedoe")
+        self.service = UserCountsService()
+
+    def test_follow_signals_update_both_sides(self):
+        relation = Follower.objects.create(follower=self.john, author=self.jane)
+        self.john.refresh_from_db()
+        self.jane.refresh_from_db()
+        self.assertEqual((self.john.following_count, self.jane.followers_count), (1, 1))
+
+        relation.delete()
+        self.john.refresh_from_db()
+        self.jane.refresh_from_db()
+        self.assertEqual((self.john.following_count, self.jane.followers_count), (0, 0))
+
+    def test_post_signals_update_posts_count(self):
+        post = RecipePost.objects.create(author=self.jane, title="T", description="d")
+        self.jane.refresh_from_db()
+        self.assertEqual(self.jane.posts_count, 1)
+        post.delete()
+        self.jane.refresh_from_db()
+        self.assertEqual(self.jane.posts_count, 0)
+
+    def test_posts_count_only_counts_public_visible_posts(self):
+        RecipePost.objects.create(
+            author=self.jane, title="Secret", description="d", visibility=RecipePost.VISIBILITY_FOLLOWERS
+        )
+        post = RecipePost.objects.create(author=self.jane, title="T", description="d")
+        self.jane.refresh_from_db()
+        self.assertEqual(self.jane.posts_count, 1)
+
+        post.is_hidden = True
+        post.save()
+        self.jane.refresh_from_db()
+        self.assertEqual(self.jane.posts_count, 0)
+
+        post.is_hidden = False
+        post.visibility = RecipePost.VISIBILITY_PUBLIC
+        post.save(update_fields=["is_hidden", "visibility"])
+        self.jane.refresh_from_db()
+        self.assertEqual(self.jane.posts_count, 1)
+        self.assertEqual(self.service.drifted_ids(), [])
+
+        post.delete()
+        RecipePost.objects.get(title="Secret").delete()
+        self.jane.refresh_from_db()
+        self.assertEqual(self.jane.posts_count, 0)
+
+    def test_refresh_repairs_drift_from_bulk_writes(self):
+        Follower.objects.bulk_create([Follower(follower=self.john, author=self.jane)])
+        RecipePost.objects.bulk_create([RecipePost(author=self.john, title="T", description="d")])
+        self.assertCountEqual(self.service.drifted_ids(), [self.john.id, self.jane.id])
+
+        self.service.refresh([self.john.id, self.jane.id])
+
+        self.john.refresh_from_db()
+        self.jane.refresh_from_db()
+        self.assertEqual((self.john.following_count, self.john.posts_count), (1, 1))
+        self.assertEqual(self.jane.followers_count, 1)
+        self.assertEqual(self.service.drifted_ids(), [])
+
+    def test_repair_command_reports_consistent_counts(self):
+        out = StringIO()
+        call_command("repair_user_counts", stdout=out)
+        self.assertIn("already consistent", out.getvalue())
+
+        User.objects.filter(id=self.john.id).update(followers_count=9)
+        out = StringIO()
+        call_command("repair_user_counts", stdout=out)
+        self.john.refresh_from_db()
+        self.assertEqual(self.john.followers_count, 0)
+        self.assertIn("1 user(s)", out.getvalue())
@@ -0,0 +1,68 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from recipes.models import User, UserSearchTerm
+from recipes.services.user_search import UserSearchService
+
+
+class UserSearchServiceTestCase(TestCase):
+    fixtures = [
+        "recipes/tests/fixtures/default_user.json",
+        "recipes/tests/fixtures/other_users.json",
+    ]
+
+    def setUp(self):
+        self.service = UserSearchService()
+        self.ann = User.objects.create_user(
+            username="@annbaker", email="ann@example.org", password="Password123", first_name="Ann", last_name="Baker"
+        )
+        self.anna = User.objects.create_user(
+            username="@breadfan", email="anna@example.org", password="Password123", first_name="Anna", last_name="Bakewell"
+        )
+
+    def test_saving_a_user_indexes_words_and_trigrams(self):
+        words = set(self.ann.search_terms.filter(kind=UserSearchTerm.KIND_WORD).values_list("term", flat=True))
+        self.assertEqual(words, {"annbaker", "ann", "baker"})
+        self.assertTrue(self.ann.search_terms.filter(kind=UserSearchTerm.KIND_TRIGRAM, term="bak").exists())
+
+    def test_prefix_match_ranks_username_prefix_first_then_followers(self):
+        User.objects.filter(pk=self.anna.pk).update(followers_count=50)
+
+        results = self.service.search("ann")
+
+        self.assertEqual(results[:2], [self.ann, self.anna])
+
+    def test_every_token_must_prefix_match(self):
+        self.assertEqual(self.service.search("ann bakew"), [self.anna])
+        self.assertEqual(self.service.search("@annb"), [self.ann])
+
+    def test_trigram_fallback_tolerates_typos(self):
+        self.assertIn(self.anna, self.service.search("bakewel1"))
+        self.assertEqual(self.service.search("zzzzzz"), [])
+
+    def test_renaming_reindexes_but_login_does_not(self):
+        self.ann.first_name = "Hannah"
+        self.ann.save()
+        self.assertEqual(self.service.search("hannah"), [self.ann])
+
+        fresh = User.objects.get(pk=self.ann.pk)
+        with self.assertNumQueries(1):
+            fresh.save(update_fields=["last_login"])
+
+    def test_refresh_rebuilds_missing_terms(self):
+        UserSearchTerm.objects.all().delete()
+        self.assertEqual(self.service.search("ann"), [])
+
+        self.assertGreater(self.service.refresh(), 0)
+
+        self.assertIn(self.ann, self.service.search("ann"))
+
+    def test_autocomplete_endpoint_returns_compact_rows(self):
+        self.client.login(email="ann@example.org", password="Password123")
+
+        response = self.client.get(reverse("user_search_api"), {"q": "annb"})
+
+        self.assertEqual(response.status_code, 200)
+        row = response.json()["results"][0]
+        self.assertEqual(row["username"], "@annbaker")
+        self.assertEqual(row["name"], "Ann Baker")
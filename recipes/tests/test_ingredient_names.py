@@ -0,0 +1,30 @@
+from django.test import SimpleTestCase
+
+from recipes.utils.ingredient_names import normalise_ingredient_name, singularise
+
+
+class NormaliseIngredientNameTests(SimpleTestCase):
+    def test_strips_quantities_and_units(self):
+        self.assertEqual(normalise_ingredient_name("2 cups Flour"), "flour")
+        self.assertEqual(normalise_ingredient_name("1/2 tsp salt"), "salt")
+        self.assertEqual(normalise_ingredient_name("200g butter"), "butter")
+        self.assertEqual(normalise_ingredient_name("1 ½ cups of milk"), "milk")
+        self.assertEqual(normalise_ingredient_name("2 to 3 onions"), "onion")
+        self.assertEqual(normalise_ingredient_name("2 tomatoes"), "tomato")
+
+    def test_singularises_head_word(self):
+        self.assertEqual(normalise_ingredient_name("Tomatoes"), normalise_ingredient_name("tomato"))
+        self.assertEqual(normalise_ingredient_name("bay leaves"), "bay leaf")
+        self.assertEqual(normalise_ingredient_name("berries"), "berry")
+
+    def test_drops_notes_and_resolves_aliases(self):
+        self.assertEqual(normalise_ingredient_name("3 cloves garlic, crushed"), "garlic")
+        self.assertEqual(normalise_ingredient_name("onion (chopped)"), "onion")
+        self.assertEqual(normalise_ingredient_name("Scallions"), "spring onion")
+
+    def test_falls_back_to_lowercased_input_when_nothing_remains(self):
+        self.assertEqual(normalise_ingredient_name("2 Cups"), "2 cups")
+
+    def test_singularise_leaves_invariant_words(self):
+        self.assertEqual(singularise("hummus"), "hummus")
+        self.assertEqual(singularise("glass"), "glass")
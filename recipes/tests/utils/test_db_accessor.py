@@ -1,5 +1,7 @@
+from django.db import connection
 from django.test import TestCase
-from recipes.db_accessor import DB_Accessor
+from django.test.utils import CaptureQueriesContext
+from recipes.db_accessor import DB_Accessor, LazyPage
 from recipes.models import RecipePost, User
 
 
@@ -61,6 +63,48 @@ class DBAccessorTests(TestCase):
         qs = self.repo.list(limit=1, offset=10)
         self.assertEqual(qs.count(), 0)
 
+    def test_sliced_list_is_one_query_in_order(self):
+        page = self.repo.list(order_by=["title"], limit=1, offset=1)
+        self.assertIsInstance(page, LazyPage)
+        with CaptureQueriesContext(connection) as queries:
+            titles = [obj.title for obj in page]
+            self.assertEqual(page.count(), 1)
+        self.assertEqual(titles, ["Soup"])
+        self.assertEqual(len(queries), 1)
+
+    def test_page_has_more_without_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            first = self.repo.page(RecipePost.objects.order_by("title"), limit=1)
+            self.assertEqual([obj.title for obj in first.items], ["Cake"])
+            self.assertTrue(first.has_more)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("COUNT(", queries[0]["sql"].upper())
+        self.assertFalse(self.repo.page(RecipePost.objects.all(), offset=1, limit=1).has_more)
+
+    def test_page_filters_compose_before_fetch(self):
+        page = self.repo.list(order_by=["title"], limit=1)
+        narrowed = page.filter(category="dinner")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(narrowed.first().title, "Soup")
+        self.assertEqual(len(queries), 1)
+
+    def test_iter_batches_walks_pk_ranges(self):
+        extra = RecipePost.objects.create(author=self.user, title="Pie", description="d", category="dessert")
+        with CaptureQueriesContext(connection) as queries:
+            batches = list(self.repo.iter_batches(2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(
+            sorted(pk for batch in batches for pk in batch),
+            sorted([self.obj1.pk, self.obj2.pk, extra.pk]),
+        )
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn("OFFSET", queries[1]["sql"].upper())
+
+    def test_iter_batches_fields_and_filters(self):
+        batches = list(self.repo.iter_batches(10, fields=("title", "category"), filters={"category": "dinner"}))
+        self.assertEqual(batches, [[("Soup", "dinner")]])
+        self.assertEqual(list(self.repo.iter_batches(10, fields=("title",), filters={"title": "Nope"})), [])
+
     def test_get(self):
         obj = self.repo.get(id=self.obj1.id)
         self.assertEqual(obj, self.obj1)
@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from recipes.models import RecipePost, User
+from recipes.pagination import PeekPaginator
+
+
+class PeekPaginatorTests(TestCase):
+
+    fixtures = ["recipes/tests/fixtures/default_user.json"]
+
+    def setUp(self):
+        user = User.objects.get(username="@johndoe")
+        for title in ("A", "B", "C"):
+            RecipePost.objects.create(author=user, title=title, description="d")
+        self.qs = RecipePost.objects.order_by("title")
+
+    def test_pages_peek_one_row_ahead(self):
+        paginator = PeekPaginator(self.qs, 2)
+        with CaptureQueriesContext(connection) as queries:
+            first = paginator.get_page(1)
+        self.assertEqual([post.title for post in first.object_list], ["A", "B"])
+        self.assertTrue(first.has_next())
+        self.assertEqual(first.next_page_number(), 2)
+        self.assertEqual(len(queries), 1)
+
+        second = paginator.get_page("2")
+        self.assertEqual([post.title for post in second], ["C"])
+        self.assertFalse(second.has_next())
+        self.assertTrue(second.has_previous())
+
+    def test_invalid_and_out_of_range_numbers(self):
+        paginator = PeekPaginator(self.qs, 2)
+        self.assertEqual(paginator.get_page("abc").number, 1)
+        past_end = paginator.get_page(9)
+        self.assertEqual((len(past_end), past_end.has_next()), (0, False))
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+    def test_count_is_cached(self):
+        cache.clear()
+        self.assertEqual(PeekPaginator(self.qs, 2).count, 3)
+        RecipePost.objects.filter(title="C").delete()
+        self.assertEqual(PeekPaginator(self.qs, 2).count, 3)
+        self.assertEqual(PeekPaginator([1, 2], 2).count, 2)
@@ -4,6 +4,7 @@ from django.contrib.sessions.middleware import SessionMiddleware
 from django.test import RequestFactory, TestCase
 
 from recipes.models.recipe_post import RecipePost
+from recipes.tests.media import TempMediaMixin
 
 User = get_user_model()
 
@@ -17,7 +18,7 @@ def add_session_and_messages(request):
     return request
 
 
-class RecipeViewTestCase(TestCase):
+class RecipeViewTestCase(TempMediaMixin, TestCase):
     """Shared setup for recipe view tests."""
 
     __test__ = False  # prevent Django from treating this base as a test case
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from recipes.models import Ingredient, Follower, Like
@@ -218,6 +220,29 @@ class DashboardSearchViewTests(TestCase):
         self.assertIn("html", payload)
         self.assertIn("has_more", payload)
 
+    def test_dashboard_following_ajax_revalidates_with_etag(self):
+        author = make_user(username="followed")
+        Follower.objects.create(follower=self.user, author=author)
+        make_recipe_post(author=author, title="Followed post")
+        self.client.login(username=self.user.username, password="Password123")
+        etag = self.client.get(self.url, {"following_ajax": "1"})["ETag"]
+
+        cached = self.client.get(self.url, {"following_ajax": "1"}, HTTP_IF_NONE_MATCH=etag)
+        make_recipe_post(author=author, title="Another post")
+        fresh = self.client.get(self.url, {"following_ajax": "1"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(fresh.status_code, 200)
+        self.assertIn("Another post", fresh.json()["html"])
+
+    def test_dashboard_following_ajax_etag_differs_per_page(self):
+        self.client.login(username=self.user.username, password="Password123")
+
+        first = self.client.get(self.url, {"following_ajax": "1"})["ETag"]
+        second = self.client.get(self.url, {"following_ajax": "1", "following_offset": "24"})["ETag"]
+
+        self.assertNotEqual(first, second)
+
     def test_dashboard_user_search_scope(self):
         target = make_user(username="alice")
         self.client.login(username=self.user.username, password="Password123")
@@ -226,6 +251,18 @@ class DashboardSearchViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(target, response.context["users_results"])
 
+    def test_dashboard_user_scope_shows_people_you_may_know(self):
+        friend = make_user(username="friend")
+        suggested = make_user(username="friendoffriend")
+        Follower.objects.create(follower=self.user, author=friend)
+        Follower.objects.create(follower=friend, author=suggested)
+
+        response = self.client.get(self.url, {"scope": "users", "mode": "search"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["suggested_users"], [suggested])
+        self.assertContains(response, "People you may know")
+
     def test_dashboard_recipe_search_ajax_returns_json(self):
         for i in range(20):
             make_recipe_post(author=self.user, title=f"Post {i}")
@@ -237,6 +274,27 @@ class DashboardSearchViewTests(TestCase):
         self.assertIn("html", payload)
         self.assertTrue(payload["has_next"])
 
+    def test_dashboard_search_pages_skip_count_queries(self):
+        for i in range(25):
+            make_recipe_post(author=self.user, title=f"Post {i}")
+            Ingredient.objects.create(
+                recipe_post=make_recipe_post(author=self.user, title=f"Shop {i}"),
+                name=f"item {i}",
+                shop_url=f"https://shop.example/{i}",
+                position=1,
+            )
+        self.client.login(username=self.user.username, password="Password123")
+
+        with CaptureQueriesContext(connection) as queries:
+            recipes_page = self.client.get(self.url, {"mode": "search", "ajax": "1", "page": 3}).json()
+            shopping_page = self.client.get(
+                self.url, {"scope": "shopping", "mode": "search", "ajax": "1", "page": 1}
+            ).json()
+
+        self.assertFalse(recipes_page["has_next"])
+        self.assertTrue(shopping_page["has_next"])
+        self.assertFalse(any('"__count"' in query["sql"] for query in queries))
+
     def test_dashboard_filters_by_ingredients_and_prep_time(self):
         good = make_recipe_post(author=self.user, title="Allowed", prep_time_min=5, cook_time_min=5)
         Ingredient.objects.create(recipe_post=good, name="garlic", position=1)
@@ -1,7 +1,6 @@
 from unittest.mock import patch
 from django.test import TestCase
 from django.urls import reverse
-from django.utils import timezone
 
 from recipes.models import (
     User,
@@ -14,9 +13,10 @@ from recipes.models import (
 )
 from recipes.views.profile_view import _collections_for_user
 from recipes.tests.test_utils import reverse_with_next
+from recipes.tests.media import TempMediaMixin
 
 
-class ProfileCollectionViewTests(TestCase):
+class ProfileCollectionViewTests(TempMediaMixin, TestCase):
     fixtures = [
         "recipes/tests/fixtures/default_user.json",
         "recipes/tests/fixtures/other_users.json",
@@ -39,22 +39,6 @@ class ProfileCollectionViewTests(TestCase):
     def tearDown(self):
         self.firebase_patch.stop()
 
-    def _fake_qs(self, fav):
-        class FakeFavQS(list):
-            def prefetch_related(self, *args, **kwargs):
-                return self
-        return FakeFavQS([fav])
-
-    def _fake_fav(self, name, cover_post, created_at, items):
-        class FakeFav:
-            def __init__(self, cover_post, created_at, items):
-                self.id = "fav"
-                self.name = name
-                self.cover_post = cover_post
-                self.created_at = created_at
-                self.items = items
-        return FakeFav(cover_post, created_at, items)
-
     def test_collections_helper_builds_payload(self):
         fav = Favourite.objects.create(user=self.user, name="List")
         post = RecipePost.objects.create(author=self.user, title="Pie", description="d", image="img.png")
@@ -348,38 +332,61 @@ class ProfileCollectionViewTests(TestCase):
         resp4 = self.client.post(reverse("remove_close_friend", kwargs={"username": pal.username}), HTTP_HX_REQUEST="true")
         self.assertEqual(resp4.status_code, 200)
 
-    def test_collections_helper_skips_items_without_recipe(self):
-        class Items(list):
-            def select_related(self, *args, **kwargs):
-                return self
-            def order_by(self, *args, **kwargs):
-                return [type("Item", (), {"recipe_post": None, "added_at": None})()]
+    def test_bulk_follow_reports_status_per_username(self):
+        self.client.login(username=self.user.username, password="Password123")
+
+        resp = self.client.post(
+            reverse("bulk_follow"),
+            data='{"usernames": ["@janedoe", "@nobody", "@johndoe"]}',
+            content_type="application/json",
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            resp.json()["results"],
+            {"@janedoe": "following", "@nobody": "not_found", "@johndoe": "noop"},
+        )
+        self.assertTrue(Follower.objects.filter(follower=self.user, author__username="@janedoe").exists())
+
+    def test_bulk_endpoints_validate_payload(self):
+        self.client.login(username=self.user.username, password="Password123")
+
+        bad = self.client.post(reverse("bulk_add_close_friends"), data='{"usernames": "x"}', content_type="application/json")
+        too_many = self.client.post(
+            reverse("bulk_remove_followers"), {"usernames": [f"@user{i}" for i in range(201)]}
+        )
+
+        self.assertEqual(bad.status_code, 400)
+        self.assertEqual(too_many.status_code, 400)
 
-        ghost = self._fake_fav("Ghost", None, timezone.now(), Items())
-        with patch("recipes.views.profile_view.Favourite.objects") as fav_mgr:
-            fav_mgr.filter.return_value = self._fake_qs(ghost)
+    def test_collections_helper_query_count_is_independent_of_collections(self):
+        for i in range(5):
+            fav = Favourite.objects.create(user=self.user, name=f"Fav {i}")
+            post = RecipePost.objects.create(author=self.user, title=f"Post {i}", description="d", image=f"{i}.png")
+            FavouriteItem.objects.create(favourite=fav, recipe_post=post)
+
+        with self.assertNumQueries(3):
             cols = _collections_for_user(self.user)
-        self.assertEqual(cols[0]["count"], 0)
+
+        self.assertEqual(len(cols), 5)
+        self.assertTrue(all(col["count"] == 1 for col in cols))
+
+    def test_collections_helper_pages_in_database_by_last_saved(self):
+        older = Favourite.objects.create(user=self.user, name="Older")
+        newer = Favourite.objects.create(user=self.user, name="Newer")
+        post = RecipePost.objects.create(author=self.user, title="Saved", description="d")
+        item = FavouriteItem.objects.create(favourite=older, recipe_post=post)
+        FavouriteItem.objects.filter(id=item.id).update(added_at=newer.created_at.replace(year=newer.created_at.year + 1))
+
+        self.assertEqual([c["title"] for c in _collections_for_user(self.user, limit=1)], ["Older"])
+        self.assertEqual([c["title"] for c in _collections_for_user(self.user, offset=1, limit=1)], ["Newer"])
 
     def test_collections_helper_respects_cover_post_and_existing_images(self):
         cover = RecipePost.objects.create(author=self.user, title="Cover", description="d", image="cover.png")
-
         first = RecipePost.objects.create(author=self.user, title="First", description="d", image="first.png")
-        second = RecipePost.objects.create(author=self.user, title="Second", description="d", image="second.png")
-        class Items(list):
-            def select_related(self, *args, **kwargs):
-                return self
-            def order_by(self, *args, **kwargs):
-                return self
-        fake_items = Items(
-            [
-                type("Item", (), {"recipe_post": first, "added_at": None})(),
-                type("Item", (), {"recipe_post": second, "added_at": cover.created_at})(),
-            ]
-        )
-        fake_fav = self._fake_fav("Has cover", cover, cover.created_at, fake_items)
-        with patch("recipes.views.profile_view.Favourite.objects") as fav_mgr:
-            fav_mgr.filter.return_value = self._fake_qs(fake_fav)
-            cols = _collections_for_user(self.user)
+        fav = Favourite.objects.create(user=self.user, name="Has cover", cover_post=cover)
+        FavouriteItem.objects.create(favourite=fav, recipe_post=first)
+
+        cols = _collections_for_user(self.user)
 
         self.assertEqual(cols[0]["cover"], "cover.png")
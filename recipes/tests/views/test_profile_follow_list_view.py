@@ -1,3 +1,4 @@
+import re
 from unittest.mock import patch
 
 from django.test import TestCase
@@ -27,6 +28,7 @@ class ProfileFollowListViewTest(TestCase):
         private_user.save()
         extra_follower = User.objects.create_user(username="@viewerx", email="v@example.org", password="Password123")
         Follower.objects.create(author=private_user, follower=extra_follower)
+        private_user.refresh_from_db()
 
         ctx = profile_view._follow_context(private_user, self.user)
 
@@ -49,7 +51,7 @@ class ProfileFollowListViewTest(TestCase):
 
         self.assertEqual(len(ctx["followers_users"]), profile_view.FOLLOW_LIST_PAGE_SIZE)
         self.assertTrue(ctx["followers_has_more"])
-        self.assertEqual(ctx["followers_next_page"], 2)
+        self.assertEqual(ctx["followers_next_cursor"], ctx["followers_users"][-1].cursor)
 
     def test_profile_follow_list_endpoint_returns_paginated_followers(self):
         self.client.login(username=self.user.username, password="Password123")
@@ -61,16 +63,25 @@ class ProfileFollowListViewTest(TestCase):
             )
             Follower.objects.create(author=self.user, follower=follower)
 
-        url = f"{reverse('profile_follow_list')}?user={self.user.username}&list=followers&page=2"
+        url = f"{reverse('profile_follow_list')}?user={self.user.username}&list=followers"
+        first = self.client.get(url).json()
 
-        response = self.client.get(url)
+        response = self.client.get(f"{url}&cursor={first['next_cursor']}")
 
         self.assertEqual(response.status_code, 200)
         payload = response.json()
         self.assertIn("html", payload)
         self.assertTrue(payload["has_more"])
-        self.assertEqual(payload["next_page"], 3)
-        self.assertIn("fol25", payload["html"])
+        self.assertIsNotNone(payload["next_cursor"])
+        self.assertEqual(payload["total"], profile_view.FOLLOW_LIST_PAGE_SIZE * 2 + 1)
+        last = self.client.get(f"{url}&cursor={payload['next_cursor']}").json()
+        self.assertFalse(last["has_more"])
+        handles = [
+            handle
+            for page in (first, payload, last)
+            for handle in re.findall(r'data-name="(\S+)', page["html"])
+        ]
+        self.assertCountEqual(handles, [f"fol{i}" for i in range(profile_view.FOLLOW_LIST_PAGE_SIZE * 2 + 1)])
 
     def test_profile_follow_list_endpoint_defaults_invalid_page_params(self):
         self.client.login(username=self.user.username, password="Password123")
@@ -82,15 +93,28 @@ class ProfileFollowListViewTest(TestCase):
             )
             Follower.objects.create(author=self.user, follower=follower)
 
-        url = f"{reverse('profile_follow_list')}?user={self.user.username}&list=followers&page=bad&page_size=oops"
+        url = f"{reverse('profile_follow_list')}?user={self.user.username}&list=followers&cursor=bad&page_size=oops"
 
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         payload = response.json()
         self.assertTrue(payload["has_more"])
-        self.assertEqual(payload["next_page"], 2)
-        self.assertIn("err0", payload["html"])
+        self.assertIsNotNone(payload["next_cursor"])
+        self.assertEqual(payload["html"].count("follow-list-item"), profile_view.FOLLOW_LIST_PAGE_SIZE)
+
+    def test_profile_follow_list_endpoint_caps_page_size(self):
+        self.client.login(username=self.user.username, password="Password123")
+        with patch.object(profile_view.logic, "FOLLOW_LIST_MAX_PAGE_SIZE", 2):
+            for i in range(3):
+                follower = User.objects.create_user(username=f"cap{i}", email=f"cap{i}@example.org", password="Password123")
+                Follower.objects.create(author=self.user, follower=follower)
+
+            url = f"{reverse('profile_follow_list')}?user={self.user.username}&list=followers&page_size=100000"
+            payload = self.client.get(url).json()
+
+        self.assertTrue(payload["has_more"])
+        self.assertEqual(payload["html"].count("follow-list-item"), 2)
 
     def test_profile_follow_list_endpoint_returns_following(self):
         self.client.login(username=self.user.username, password="Password123")
@@ -111,7 +135,7 @@ class ProfileFollowListViewTest(TestCase):
         self.assertIn("html", payload)
         self.assertIn("auth1", payload["html"])
         self.assertFalse(payload["has_more"])
-        self.assertIsNone(payload["next_page"])
+        self.assertIsNone(payload["next_cursor"])
 
     def test_profile_follow_list_endpoint_respects_privacy(self):
         private_user = User.objects.get(username='@janedoe')
@@ -148,3 +172,16 @@ class ProfileFollowListViewTest(TestCase):
         payload = response.json()
         self.assertIn("html", payload)
         self.assertIn("@cf", payload["html"])
+
+    def test_follow_lists_show_and_index_full_names(self):
+        self.client.login(username=self.user.username, password="Password123")
+        follower = User.objects.create_user(
+            username="@named", email="named@example.org", password="Password123", first_name="Ada", last_name="Lovelace"
+        )
+        Follower.objects.create(author=self.user, follower=follower)
+
+        for list_type in ("followers", "close_friends"):
+            url = f"{reverse('profile_follow_list')}?user={self.user.username}&list={list_type}"
+            html = self.client.get(url).json()["html"]
+            self.assertIn("Ada Lovelace", html)
+            self.assertIn('data-name="ada lovelace @named"', html)
@@ -1,10 +1,13 @@
+import msgpack
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.test import Client
-from recipes.models import User, RecipePost, Notification
+from recipes.models import User, RecipePost, Notification, Follower
+from recipes.models.recipe_post import RecipeImage
+from recipes.tests.media import TempMediaMixin
 
-class RecipeApiViewTestCase(TestCase):
+class RecipeApiViewTestCase(TempMediaMixin, TestCase):
     def setUp(self):
         self.client = APIClient()
         self.user = User.objects.create_user(
@@ -81,6 +84,135 @@ class RecipeApiViewTestCase(TestCase):
         self.assertIn("Lemon chicken pasta", titles)
         self.assertNotIn("Chicken salad", titles)
 
+    def test_list_is_cursor_paginated(self):
+        for i in range(5):
+            RecipePost.objects.create(author=self.user, title=f"Recipe {i}")
+
+        first = self.client.get(self.list_url, {"page_size": 2}).json()
+        second = self.client.get(first["next"]).json()
+
+        self.assertEqual([item["title"] for item in first["results"]], ["Recipe 4", "Recipe 3"])
+        self.assertEqual([item["title"] for item in second["results"]], ["Recipe 2", "Recipe 1"])
+        self.assertIsNotNone(first["next"])
+
+    def test_list_hides_posts_the_viewer_cannot_see(self):
+        RecipePost.objects.create(author=self.other_user, title="Public")
+        RecipePost.objects.create(author=self.other_user, title="Followers", visibility=RecipePost.VISIBILITY_FOLLOWERS)
+        RecipePost.objects.create(author=self.user, title="Mine", visibility=RecipePost.VISIBILITY_CLOSE_FRIENDS)
+        private_author = User.objects.create_user(username="private", email="p@example.com", password="password123")
+        private_author.is_private = True
+        private_author.save()
+        RecipePost.objects.create(author=private_author, title="Private profile")
+
+        titles = {item["title"] for item in self.client.get(self.list_url).json()["results"]}
+        self.assertEqual(titles, {"Public", "Mine"})
+
+        Follower.objects.create(follower=self.user, author=self.other_user)
+        titles = {item["title"] for item in self.client.get(self.list_url).json()["results"]}
+        self.assertEqual(titles, {"Public", "Followers", "Mine"})
+
+    def test_list_returns_only_requested_fields(self):
+        RecipePost.objects.create(author=self.user, title="Lean", description="long text")
+
+        response = self.client.get(self.list_url, {"fields": "id,title,bogus"})
+
+        self.assertEqual(set(response.json()["results"][0]), {"id", "title"})
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        for i in range(3):
+            post = RecipePost.objects.create(author=self.user, title=f"Recipe {i}")
+            RecipeImage.objects.create(recipe_post=post, image=f"recipes/{i}.jpg", position=0)
+        RecipePost.objects.create(author=self.user, title="No image", image="https://example.com/x.jpg")
+
+        with self.assertNumQueries(2):
+            results = self.client.get(self.list_url).json()["results"]
+        with self.assertNumQueries(1):
+            self.client.get(self.list_url, {"fields": "id,title"})
+
+        urls = {item["title"]: item["primary_image_url"] for item in results}
+        self.assertTrue(urls["Recipe 0"].endswith("recipes/0.jpg"))
+        self.assertEqual(urls["No image"], "https://example.com/x.jpg")
+
+    def test_list_ignores_unknown_ordering(self):
+        RecipePost.objects.create(author=self.user, title="Older")
+        RecipePost.objects.create(author=self.user, title="Newer")
+
+        response = self.client.get(self.list_url, {"ordering": "average_rating"})
+        ascending = self.client.get(self.list_url, {"ordering": "created_at"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["title"] for item in response.json()["results"]], ["Newer", "Older"])
+        self.assertEqual([item["title"] for item in ascending.json()["results"]], ["Older", "Newer"])
+
+    def test_batch_returns_visible_recipes_in_request_order(self):
+        first = RecipePost.objects.create(author=self.user, title="First")
+        second = RecipePost.objects.create(author=self.other_user, title="Second")
+        hidden = RecipePost.objects.create(
+            author=self.other_user, title="Hidden", visibility=RecipePost.VISIBILITY_FOLLOWERS
+        )
+        url = reverse("recipe_batch_api")
+        ids = [str(second.id), "not-a-uuid", str(hidden.id), str(first.id)]
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {"ids": ",".join(ids)})
+
+        data = response.json()
+        self.assertEqual([item["title"] for item in data["results"]], ["Second", "First"])
+        self.assertEqual(data["missing"], ["not-a-uuid", str(hidden.id)])
+        self.assertTrue(all(item["etag"].startswith('W/"') for item in data["results"]))
+
+    def test_batch_post_and_etag_changes_with_recipe(self):
+        recipe = RecipePost.objects.create(author=self.user, title="Soup")
+        url = reverse("recipe_batch_api")
+
+        before = self.client.post(url, {"ids": [str(recipe.id)]}, format="json").json()["results"][0]["etag"]
+        RecipePost.objects.filter(id=recipe.id).update(saved_count=3)
+        after = self.client.post(url, {"ids": [str(recipe.id)]}, format="json").json()["results"][0]["etag"]
+
+        self.assertNotEqual(before, after)
+
+    def test_batch_rejects_bad_payloads(self):
+        url = reverse("recipe_batch_api")
+        too_many = ",".join(str(i) for i in range(101))
+
+        self.assertEqual(self.client.get(url, {"ids": too_many}).status_code, 400)
+        self.assertEqual(self.client.post(url, {"ids": "abc"}, format="json").status_code, 400)
+
+    def test_detail_supports_conditional_get(self):
+        recipe = RecipePost.objects.create(author=self.user, title="Stew")
+        url = reverse('recipe_detail_api', kwargs={"pk": recipe.pk})
+        response = self.client.get(url)
+
+        by_etag = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        by_date = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+
+        self.assertEqual(by_etag.status_code, 304)
+        self.assertEqual(by_date.status_code, 304)
+        RecipePost.objects.filter(pk=recipe.pk).update(saved_count=2)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 200)
+
+    def test_list_renders_columnar_msgpack_on_request(self):
+        RecipePost.objects.create(author=self.user, title="Packed")
+
+        response = self.client.get(self.list_url, {"fields": "id,title,created_at"}, HTTP_ACCEPT="application/msgpack")
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        body = msgpack.unpackb(response.content, timestamp=3)
+        self.assertEqual(body["results"]["columns"], ["id", "title", "created_at"])
+        row = dict(zip(body["results"]["columns"], body["results"]["rows"][0]))
+        self.assertEqual(row["title"], "Packed")
+        self.assertEqual(row["created_at"], RecipePost.objects.get().created_at)
+
+    def test_detail_and_sync_accept_msgpack_format(self):
+        recipe = RecipePost.objects.create(author=self.user, title="Packed")
+        detail = self.client.get(reverse('recipe_detail_api', kwargs={"pk": recipe.pk}), {"format": "msgpack"})
+        sync = self.client.get(reverse("recipe_sync_api"), {"format": "msgpack"})
+        json_etag = self.client.get(reverse('recipe_detail_api', kwargs={"pk": recipe.pk}))["ETag"]
+
+        self.assertEqual(msgpack.unpackb(detail.content)["title"], "Packed")
+        self.assertTrue(msgpack.unpackb(sync.content)["reset"])
+        self.assertNotEqual(detail["ETag"], json_etag)
+
     def test_owner_can_update_recipe(self):
         recipe = RecipePost.objects.create(
             author=self.user,
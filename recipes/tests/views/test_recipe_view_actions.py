@@ -8,6 +8,7 @@ from recipes.models.favourite import Favourite
 from recipes.models.favourite_item import FavouriteItem
 from recipes.models.like import Like
 from recipes.models.recipe_post import RecipePost
+from recipes.models.similar_recipe import SimilarRecipe
 from recipes.tests.views.base import RecipeViewTestCase, add_session_and_messages
 import recipes.views.recipe_views as recipe_views
 from recipes.views.recipe_views import (
@@ -72,6 +73,77 @@ class RecipeViewActionsTests(RecipeViewTestCase):
         self.assertEqual(response.context["comments_next_page"], 2)
         self.assertTrue(response.context["source_link"].startswith("http://testserver/"))
 
+    def test_recipe_detail_returns_304_until_engagement_changes(self):
+        self.client.login(username=self.other.username, password="Password123")
+        url = reverse("recipe_detail", args=[self.post.id])
+        self.client.get(url)  # first visit sets the CSRF cookie the ETag covers
+        etag = self.client.get(url)["ETag"]
+
+        with patch.object(recipe_views, "build_recipe_context") as build:
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        build.assert_not_called()
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], etag)
+        self.assertIn("private", cached["Cache-Control"])
+
+        Like.objects.create(user=self.user, recipe_post=self.post)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_recipe_detail_renders_pending_messages_instead_of_304(self):
+        self.client.login(username=self.other.username, password="Password123")
+        url = reverse("recipe_detail", args=[self.post.id])
+        comment = Comment.objects.create(recipe_post=self.post, user=self.user, text="Mine")
+        self.client.get(url)
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.post(reverse("delete_comment", args=[comment.id]), HTTP_IF_NONE_MATCH=etag, follow=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "You are not allowed to delete this comment.")
+        self.assertNotIn("ETag", response)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_recipe_detail_etag_tracks_viewer_collections_and_comments(self):
+        self.client.login(username=self.other.username, password="Password123")
+        url = reverse("recipe_detail", args=[self.post.id])
+        self.client.get(url)
+        first = self.client.get(url)["ETag"]
+
+        favourite = Favourite.objects.create(user=self.other, name="Later")
+        created = self.client.get(url)["ETag"]
+        favourite.name = "Soon"
+        favourite.save()
+        renamed = self.client.get(url)["ETag"]
+        comment = Comment.objects.create(recipe_post=self.post, user=self.user, text="Nice")
+        commented = self.client.get(url)["ETag"]
+
+        self.assertEqual(len({first, created, renamed, commented}), 4)
+        comment.delete()
+        self.assertNotEqual(self.client.get(url)["ETag"], commented)
+
+    def test_recipe_detail_etag_tracks_profiles_and_similar_recipes(self):
+        neighbour = RecipePost.objects.create(
+            author=self.user, title="Neighbour", description="d", published_at=self.post.created_at
+        )
+        SimilarRecipe.objects.create(recipe_post=self.post, similar_post=neighbour, rank=1)
+        Comment.objects.create(recipe_post=self.post, user=self.other, text="Nice")
+        self.client.login(username=self.other.username, password="Password123")
+        url = reverse("recipe_detail", args=[self.post.id])
+        self.client.get(url)
+        etags = [self.client.get(url)["ETag"]]
+
+        self.user.first_name = "Renamed"
+        self.user.save()
+        etags.append(self.client.get(url)["ETag"])
+        self.other.last_name = "Commenter"
+        self.other.save()
+        etags.append(self.client.get(url)["ETag"])
+        neighbour.visibility = RecipePost.VISIBILITY_CLOSE_FRIENDS
+        neighbour.save()
+        etags.append(self.client.get(url)["ETag"])
+
+        self.assertEqual(len(set(etags)), 4)
+
     def test_toggle_like_creates_then_deletes_like(self):
         req1 = self.factory.post(f"/fake/recipe/{self.post.id}/like/")
         req1.user = self.user
@@ -162,6 +234,23 @@ class RecipeViewActionsTests(RecipeViewTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertFalse(Comment.objects.filter(id=comment.id).exists())
 
+    def test_save_collections_endpoint_filters_and_flags_saved(self):
+        saved = Favourite.objects.create(user=self.user, name="Weeknight")
+        Favourite.objects.create(user=self.user, name="Weekend")
+        Favourite.objects.create(user=self.user, name="Baking")
+        FavouriteItem.objects.create(favourite=saved, recipe_post=self.post)
+        self.client.login(username=self.user.username, password="Password123")
+
+        response = self.client.get(reverse("save_collections", args=[self.post.id]), {"q": "week"})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([c["name"] for c in data["collections"]], ["Weeknight", "Weekend"])
+        self.assertTrue(data["collections"][0]["saved"])
+        self.assertEqual(data["collections"][0]["count"], 1)
+        self.assertFalse(data["has_more"])
+        self.assertIsNone(data["next_page"])
+
     def test_collections_modal_state_uses_cover_post(self):
         self.post.image = "cover.jpg"
         self.post.save(update_fields=["image"])
@@ -185,6 +274,18 @@ class RecipeViewActionsTests(RecipeViewTestCase):
         self.assertEqual(len(posts), 1)
         self.assertEqual(posts[0].id, self.post.id)
 
+    def test_saved_recipes_xhr_returns_next_page_json(self):
+        fav = Favourite.objects.create(user=self.user, name="favourites")
+        FavouriteItem.objects.create(favourite=fav, recipe_post=self.post)
+        self.client.login(username=self.user.username, password="Password123")
+
+        response = self.client.get(reverse("saved_recipes"), HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+
+        data = response.json()
+        self.assertIn(self.post.title, data["html"])
+        self.assertFalse(data["has_more"])
+        self.assertIsNone(data["next_cursor"])
+
     def test_delete_my_recipe_requires_post(self):
         self.client.login(username=self.user.username, password="Password123")
         url = reverse("delete_my_recipe", args=[self.post.id])
@@ -1,10 +1,8 @@
 from types import SimpleNamespace
-from datetime import timedelta
 
 from django.test import RequestFactory, TestCase
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
-from unittest.mock import patch
 
 from recipes.models import Favourite, FavouriteItem, User, Ingredient
 from recipes.models.followers import Follower
@@ -12,9 +10,10 @@ from recipes.models.like import Like
 from recipes.models.recipe_post import RecipePost, RecipeImage
 from recipes.models.recipe_step import RecipeStep
 import recipes.views.recipe_view_helpers as helpers
+from recipes.tests.media import TempMediaMixin
 
 
-class RecipeViewHelpersTests(TestCase):
+class RecipeViewHelpersTests(TempMediaMixin, TestCase):
     def setUp(self):
         self.factory = RequestFactory()
         self.user = User.objects.create_user(
@@ -142,55 +141,40 @@ class RecipeViewHelpersTests(TestCase):
         self.assertTrue(result["last_saved_at"] > fav.created_at)
         self.assertTrue(result["thumb_url"])
 
-    @patch("recipes.services.recipe_posts.Favourite.objects.filter")
-    def test_collections_modal_state_updates_last_saved_and_cover_for_unsaved(self, mock_filter):
-        added_at = timezone.now()
-        item = SimpleNamespace(
-            recipe_post_id=999,
-            recipe_post=SimpleNamespace(primary_image_url="fromitem", image=None),
-            added_at=added_at,
-        )
-        class FakeQS(list):
-            def prefetch_related(self, *args, **kwargs):
-                return self
-        fav = SimpleNamespace(
-            id="fake",
-            name="Fake",
-            created_at=added_at - timedelta(hours=1),
-            cover_post=None,
-            items=SimpleNamespace(all=lambda: [item]),
+    def test_collections_modal_state_unsaved_uses_latest_item_cover(self):
+        fav = Favourite.objects.create(user=self.user, name="N")
+        other_post = RecipePost.objects.create(
+            author=self.user,
+            title="X",
+            description="d",
+            category="dinner",
+            prep_time_min=1,
+            cook_time_min=1,
+            image="cover.png",
         )
-        mock_filter.return_value = FakeQS([fav])
+        FavouriteItem.objects.create(favourite=fav, recipe_post=other_post)
 
-        result = helpers.collections_modal_state(self.user, self.recipe)[0]
+        entry = helpers.collections_modal_state(self.user, self.recipe)[0]
 
-        self.assertEqual(result["last_saved_at"], added_at)
-        self.assertEqual(result["thumb_url"], "fromitem")
-
-    @patch("recipes.services.recipe_posts.Favourite.objects.filter")
-    def test_collections_modal_state_handles_missing_added_at(self, mock_filter):
-        class FakeQS(list):
-            def prefetch_related(self, *args, **kwargs):
-                return self
-        fav = SimpleNamespace(
-            id="fav",
-            name="Fav",
-            created_at=timezone.now(),
-            cover_post=SimpleNamespace(primary_image_url="cover", image=None),
-            items=SimpleNamespace(
-                all=lambda: [
-                    SimpleNamespace(
-                        recipe_post_id=self.recipe.id,
-                        recipe_post=None,
-                        added_at=None,
-                    )
-                ]
-            ),
-        )
-        mock_filter.return_value = FakeQS([fav])
-        result = helpers.collections_modal_state(self.user, self.recipe)[0]
-        self.assertEqual(result["last_saved_at"], fav.created_at)
-        self.assertEqual(result["thumb_url"], "cover")
+        self.assertFalse(entry["saved"])
+        self.assertEqual(entry["thumb_url"], "cover.png")
+        self.assertEqual(entry["last_saved_at"], FavouriteItem.objects.get(favourite=fav).added_at)
+
+    def test_collections_modal_page_searches_and_paginates_in_constant_queries(self):
+        for i in range(5):
+            Favourite.objects.create(user=self.user, name=f"Soup {i}")
+        Favourite.objects.create(user=self.user, name="Desserts")
+
+        with self.assertNumQueries(1):
+            rows, has_more = helpers._engagement_service().collections_modal_page(
+                self.user, self.recipe, query="soup", page=1, page_size=3
+            )
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(has_more)
+        rows, has_more = helpers.collections_modal_page(self.user, self.recipe, query="soup")
+        self.assertEqual(len(rows), 5)
+        self.assertFalse(has_more)
+        self.assertTrue(all(row["name"].startswith("Soup") for row in rows))
 
     def test_gallery_images_skips_value_error(self):
         class Bad:
@@ -209,16 +193,6 @@ class RecipeViewHelpersTests(TestCase):
         self.assertTrue(image_url.endswith(".jpg"))
         self.assertEqual(gallery, [])
 
-    def test_first_item_post_and_last_saved_defaults(self):
-        self.assertIsNone(helpers._first_item_post([]))
-        now = timezone.now()
-        self.assertEqual(helpers._last_saved_at([], now), now)
-
-    def test_first_item_post_returns_first_available(self):
-        items = [SimpleNamespace(recipe_post=self.recipe)]
-
-        self.assertEqual(helpers._first_item_post(items), self.recipe)
-
     def test_safe_image_url_handles_value_error(self):
         class Bad:
             @property
@@ -226,32 +200,6 @@ class RecipeViewHelpersTests(TestCase):
                 raise ValueError()
         self.assertIsNone(helpers._safe_image_url(SimpleNamespace(image=Bad())))
 
-    def test_favourites_for_returns_user_collections(self):
-        fav = Favourite.objects.create(user=self.user, name="Mine")
-        result = helpers._favourites_for(self.user)
-        self.assertIn(fav, list(result))
-
-    def test_first_item_post_skips_missing_posts(self):
-        items = [SimpleNamespace(recipe_post=None), SimpleNamespace(recipe_post=self.recipe)]
-
-        self.assertEqual(helpers._first_item_post(items), self.recipe)
-
-    def test_collection_entry_unsaved_uses_item_cover(self):
-        fav = Favourite.objects.create(user=self.user, name="N")
-        other_post = RecipePost.objects.create(
-            author=self.user,
-            title="X",
-            description="d",
-            category="dinner",
-            prep_time_min=1,
-            cook_time_min=1,
-            image="cover.png",
-        )
-        FavouriteItem.objects.create(favourite=fav, recipe_post=other_post)
-        entry = helpers._collection_entry(fav, self.recipe)
-        self.assertFalse(entry["saved"])
-        self.assertIn("cover", entry["thumb_url"])
-
     def test_ingredient_lists_split_shop_and_non_shop(self):
         Ingredient.objects.create(recipe_post=self.recipe, name="plain", position=1)
         Ingredient.objects.create(recipe_post=self.recipe, name="shop", shop_url=" https://x.com ", position=2)
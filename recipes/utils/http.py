@@ -1,5 +1,10 @@
 """HTTP-related utility helpers."""
 
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
 
 def is_ajax(request):
     """Detect HTMX/XMLHttpRequest headers or an explicit ajax query flag."""
@@ -10,3 +15,32 @@ def is_ajax(request):
         or xhr_header == "XMLHttpRequest"
         or request.GET.get("ajax") == "1"
     )
+
+
+def weak_etag(*parts):
+    """Return a weak ETag hashed from the given version parts."""
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def recipe_etag(post):
+    """ETag for one recipe's API representation."""
+    return weak_etag(post.pk, post.updated_at.isoformat() if post.updated_at else "", post.saved_count)
+
+
+def not_modified(request, etag, last_modified=None):
+    """Return a 304 when the request's validators still match, else None so the view renders as usual."""
+    if request.method not in ("GET", "HEAD"):
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    return set_validators(response, etag, last_modified) if response is not None else None
+
+
+def set_validators(response, etag, last_modified=None):
+    """Attach ETag/Last-Modified and have browsers revalidate the per-user response on every use."""
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
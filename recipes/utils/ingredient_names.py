@@ -0,0 +1,96 @@
+"""Canonicalise free-text ingredient lines into dictionary terms."""
+
+import re
+from functools import lru_cache
+
+UNITS = {
+    "bag", "bags", "bottle", "bottles", "bunch", "bunches", "can", "cans", "clove", "cloves",
+    "cup", "cups", "dash", "dashes", "g", "gram", "grams", "handful", "handfuls", "jar", "jars",
+    "kg", "kilogram", "kilograms", "l", "lb", "lbs", "litre", "litres", "liter", "liters", "ml",
+    "oz", "ounce", "ounces", "pack", "packs", "pinch", "pinches", "pound", "pounds", "slice",
+    "slices", "sprig", "sprigs", "stick", "sticks", "tbsp", "tbs", "tablespoon", "tablespoons",
+    "tin", "tins", "tsp", "teaspoon", "teaspoons",
+}
+
+# Regional and spelling variants mapped to one canonical term.
+ALIASES = {
+    "all purpose flour": "plain flour",
+    "all-purpose flour": "plain flour",
+    "arugula": "rocket",
+    "cilantro": "coriander",
+    "confectioners sugar": "icing sugar",
+    "eggplant": "aubergine",
+    "garbanzo bean": "chickpea",
+    "green onion": "spring onion",
+    "powdered sugar": "icing sugar",
+    "scallion": "spring onion",
+    "shrimp": "prawn",
+    "zucchini": "courgette",
+}
+
+# Plurals the suffix rules below would get wrong.
+IRREGULAR = {
+    "brownies": "brownie",
+    "calves": "calf",
+    "cookies": "cookie",
+    "halves": "half",
+    "leaves": "leaf",
+    "loaves": "loaf",
+    "pies": "pie",
+}
+
+# Words that look plural but are not, so singularisation must leave them alone.
+INVARIANT = {"asparagus", "couscous", "hummus", "molasses", "swiss", "watercress", "grass", "glass"}
+
+_QUANTITY = r"(?:\d+(?:[.,]\d+)?(?:\s*/\s*\d+)?|[½⅓⅔¼¾⅛])"
+_LEADING_AMOUNT = re.compile(rf"^(?:{_QUANTITY}\s*(?:-|to\b)?\s*)+")
+_ATTACHED_UNIT = re.compile(r"^(?P<unit>[a-z]+)\b")
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_NON_WORD = re.compile(r"[^a-z\s-]")
+_SPACES = re.compile(r"\s+")
+
+
+def singularise(word: str) -> str:
+    """Return a best-effort singular form of an English ingredient word."""
+    if word in IRREGULAR:
+        return IRREGULAR[word]
+    if word in INVARIANT or len(word) <= 3:
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("oes") or word.endswith(("ches", "shes", "xes", "sses")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us")):
+        return word[:-1]
+    return word
+
+
+def _strip_amount(text: str) -> str:
+    """Remove a leading quantity and unit such as '2 cups of' or '200g'."""
+    text = _LEADING_AMOUNT.sub("", text).strip()
+    match = _ATTACHED_UNIT.match(text)
+    if match and match.group("unit") in UNITS:
+        text = text[match.end():].strip()
+        if text.startswith("of "):
+            text = text[3:]
+    return text
+
+
+@lru_cache(maxsize=4096)
+def normalise_ingredient_name(raw: str) -> str:
+    """Return the canonical dictionary term for a free-text ingredient line.
+
+    Strips quantities, units, notes in parentheses or after a comma, singularises
+    the head word and resolves known aliases. Falls back to the lowercased input
+    when nothing usable remains (e.g. '2 cups').
+    """
+    fallback = _SPACES.sub(" ", (raw or "").strip().lower())
+    text = _PARENTHESES.sub(" ", fallback).split(",", 1)[0]
+    text = _strip_amount(text)
+    text = _SPACES.sub(" ", _NON_WORD.sub(" ", text)).strip(" -")
+    if not text:
+        return fallback
+    words = text.split(" ")
+    words[-1] = singularise(words[-1])
+    name = " ".join(words)
+    return ALIASES.get(name, name)
@@ -0,0 +1,31 @@
+"""Tokenising helpers for the user search index."""
+
+import re
+
+_SPLIT_RE = re.compile(r"[^\w]+")
+
+
+def search_words(text):
+    """Return lowercased word tokens from free text, dropping @ and punctuation."""
+    return [word for word in _SPLIT_RE.split((text or "").lower()) if word]
+
+
+def trigrams(word):
+    """Return the set of three-character substrings of a word (empty for shorter words)."""
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+def user_search_terms(username, first_name, last_name):
+    """Return (words, trigrams) indexed for a user.
+
+    Words cover the username and each name part plus the joined full name, so
+    "eileenchamb" and "eileen cham" both prefix-match Eileen Chamberlain.
+    """
+    name_words = search_words(first_name) + search_words(last_name)
+    words = set(search_words(username)) | set(name_words)
+    if len(name_words) > 1:
+        words.add("".join(name_words))
+    grams = set()
+    for word in words:
+        grams |= trigrams(word)
+    return words, grams
@@ -0,0 +1,35 @@
+"""Canonicalise shop links so the same product URL maps to one catalogue key."""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that identify a campaign or referrer rather than a product.
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_"})
+
+
+def normalise_shop_url(url):
+    """Return a product key for a shop URL, or "" when it is blank.
+
+    The scheme, a leading "www.", default ports, fragments, tracking parameters
+    (utm_* and TRACKING_PARAMS), parameter order and trailing slashes are
+    ignored, and the host is lowercased.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    key = host + parts.path.rstrip("/")
+    return f"{key}?{urlencode(query)}" if query else key
@@ -1,14 +1,29 @@
+import uuid
+
 from rest_framework import generics, filters, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 
 from recipes.models import RecipePost
+from recipes.pagination import RecipeCursorPagination
+from recipes.renderers import MsgPackRenderer
 from recipes.serializers import RecipeSerializer
 from recipes.permissions import IsOwnerOrReadOnly
 from recipes.services.notifications import NotificationService
+from recipes.services.privacy import PrivacyService
+from recipes.services.recipe_sync import RecipeSyncService
+from recipes.services.user_search import UserSearchService
+from recipes.utils.http import not_modified, recipe_etag, set_validators, weak_etag
+
+USER_SEARCH_API_LIMIT = 8
+# Always loaded with ?fields= so cursor pagination can read the ordering column.
+RECIPE_API_ORDERING_FIELDS = ("created_at", "updated_at")
+RECIPE_BATCH_LIMIT = 100
+RECIPE_API_RENDERERS = [*api_settings.DEFAULT_RENDERER_CLASSES, MsgPackRenderer]
 
 
 def _notification_service():
@@ -29,6 +44,17 @@ def profile_api(request):
     })
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@renderer_classes(RECIPE_API_RENDERERS)
+def recipe_sync_api(request):
+    """
+    Return recipe ids created, updated or deleted since the `since` token,
+    with fresh engagement counters, limited to what the user may see.
+    """
+    return Response(RecipeSyncService().changes_since(request.user, request.query_params.get('since')))
+
+
 @login_required
 def mark_notifications_read(request):
     """Mark all unread notifications for the current user as read."""
@@ -36,19 +62,49 @@ def mark_notifications_read(request):
     return JsonResponse({'status': 'success'})
 
 
-class RecipeListApi(generics.ListCreateAPIView):
-    """List recipes for the user and allow creation."""
+@login_required
+def user_search_api(request):
+    """Return navbar autocomplete suggestions for the `q` query parameter."""
+    users = UserSearchService().search((request.GET.get("q") or "").strip(), limit=USER_SEARCH_API_LIMIT)
+    return JsonResponse({
+        "results": [
+            {
+                "username": user.username,
+                "name": user.full_name().strip(),
+                "avatar_url": user.mini_avatar_url,
+            }
+            for user in users
+        ]
+    })
+
+
+class MsgPackMixin:
+    """Offer msgpack next to the default renderers and give it native datetimes."""
+    renderer_classes = RECIPE_API_RENDERERS
+
+    def get_serializer_context(self):
+        """Flag msgpack requests so serializers keep datetimes as objects."""
+        context = super().get_serializer_context()
+        accepted = getattr(self.request, 'accepted_renderer', None)
+        context['native_datetimes'] = getattr(accepted, 'format', None) == MsgPackRenderer.format
+        return context
+
+
+class RecipeListApi(MsgPackMixin, generics.ListCreateAPIView):
+    """List recipes visible to the user a cursor page at a time, and allow creation."""
     serializer_class = RecipeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = RecipeCursorPagination
+    privacy_service = PrivacyService()
 
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'category']
-    ordering_fields = ['average_rating', 'created_at']
+    ordering_fields = list(RECIPE_API_ORDERING_FIELDS)
 
     def get_queryset(self):
         """
-        Optionally restricts the returned recipes by filtering
-        against a `category` or `search` query parameter in the URL.
+        Return recipes the user may see, optionally filtered by the
+        `category` or `search` query parameter and narrowed to `fields`.
         """
         queryset = RecipePost.objects.all()
         category = self.request.query_params.get('category')
@@ -59,15 +115,96 @@ class RecipeListApi(generics.ListCreateAPIView):
         if search:
             queryset = queryset.filter(title__icontains=search)
 
-        return queryset
+        queryset = self.privacy_service.filter_visible_posts(queryset, self.request.user)
+        return self._load_only(queryset, self.requested_fields())
+
+    def requested_fields(self):
+        """Return the serializer fields named in ?fields=, or None for all of them."""
+        raw = self.request.query_params.get('fields')
+        if not raw:
+            return None
+        requested = {name.strip() for name in raw.split(',')}
+        fields = [name for name in RecipeSerializer.Meta.fields if name in requested]
+        return fields or None
+
+    def get_serializer(self, *args, **kwargs):
+        """Narrow list responses to ?fields=; creates always echo the full recipe."""
+        if self.request.method == 'GET':
+            kwargs.setdefault('fields', self.requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def _load_only(self, queryset, fields):
+        """Load just the columns the response needs and prefetch images only when they are shown."""
+        if fields is None:
+            return queryset.prefetch_related('images')
+        columns = {name for name in fields if name != 'primary_image_url'}
+        columns.update(('id', *RECIPE_API_ORDERING_FIELDS))
+        if 'primary_image_url' in fields:
+            columns.add('image')
+            queryset = queryset.prefetch_related('images')
+        return queryset.only(*columns)
 
     def perform_create(self, serializer):
         """Assign current user as author on create."""
         serializer.save(author=self.request.user)
 
 
-class RecipeDetailApi(generics.RetrieveUpdateDestroyAPIView):
+class RecipeBatchApi(MsgPackMixin, generics.GenericAPIView):
+    """Hydrate many recipes by id in one round trip, each with its own ETag."""
+    serializer_class = RecipeSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    privacy_service = PrivacyService()
+
+    def get_queryset(self):
+        """Return the recipes visible to the user with images prefetched."""
+        queryset = RecipePost.objects.select_related('author').prefetch_related('images')
+        return self.privacy_service.filter_visible_posts(queryset, self.request.user)
+
+    def get(self, request):
+        """Read ids from ?ids=a,b,c."""
+        return self._batch([part for part in request.query_params.get('ids', '').split(',') if part.strip()])
+
+    def post(self, request):
+        """Read ids from a JSON body ({"ids": [...]}) for id sets too long for a URL."""
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list):
+            return Response({"error": "Expected a list of ids"}, status=400)
+        return self._batch(ids)
+
+    def _batch(self, raw_ids):
+        """Return visible recipes in request order; unknown, invalid and hidden ids are all reported as missing."""
+        raw_ids = list(dict.fromkeys(str(raw).strip() for raw in raw_ids))
+        if len(raw_ids) > RECIPE_BATCH_LIMIT:
+            return Response({"error": f"At most {RECIPE_BATCH_LIMIT} ids per request"}, status=400)
+        ids = {}
+        for raw in raw_ids:
+            try:
+                ids[raw] = uuid.UUID(raw)
+            except ValueError:
+                continue
+        posts = {post.pk: post for post in self.get_queryset().filter(pk__in=ids.values())}
+        found = [posts[ids[raw]] for raw in raw_ids if ids.get(raw) in posts]
+        results = [
+            {**item, "etag": recipe_etag(post)}
+            for item, post in zip(self.get_serializer(found, many=True).data, found)
+        ]
+        return Response({
+            "results": results,
+            "missing": [raw for raw in raw_ids if ids.get(raw) not in posts],
+        })
+
+
+class RecipeDetailApi(MsgPackMixin, generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete a recipe, respecting ownership permissions."""
     queryset = RecipePost.objects.all()
     serializer_class = RecipeSerializer
     permission_classes = [IsOwnerOrReadOnly]
+
+    def retrieve(self, request, *args, **kwargs):
+        """Answer If-None-Match/If-Modified-Since with a 304 before serializing the recipe."""
+        instance = self.get_object()
+        etag = weak_etag(recipe_etag(instance), request.accepted_renderer.format)
+        cached = not_modified(request, etag, instance.updated_at)
+        if cached:
+            return cached
+        return set_validators(Response(self.get_serializer(instance).data), etag, instance.updated_at)
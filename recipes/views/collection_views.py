@@ -18,12 +18,10 @@ def collections_overview(request):
     """Render the current user's collections list page."""
     page_size = 35
     page_number = max(1, int(request.GET.get("page") or 1))
-    collections_all = collections_for_user(request.user)
-    has_collections = bool(collections_all)
     start = (page_number - 1) * page_size
-    end = start + page_size
-    collections_page = collections_all[start:end]
-    has_more = len(collections_all) > end
+    collections_page = collections_for_user(request.user, offset=start, limit=page_size + 1)
+    has_more = len(collections_page) > page_size
+    collections_page = collections_page[:page_size]
     if is_ajax_request(request):
         return render(
             request,
@@ -36,7 +34,7 @@ def collections_overview(request):
         "collections": collections_page,
         "collections_has_more": has_more,
         "collections_next_page": page_number + 1 if has_more else None,
-        "has_collections": has_collections,
+        "has_collections": bool(collections_page) or favourite_service.has_any(request.user),
     }
     return render(request, "app/collections.html", context)
 
@@ -1,6 +1,7 @@
 import random
 import re
 
+from recipes.services.ingredient_index import HAVE_MATCH_ALL, HAVE_MATCH_MODES
 from recipes.utils.http import is_ajax
 
 
@@ -38,6 +39,12 @@ def _normalise_scope(scope):
     return scope if scope in ("recipes", "users", "shopping") else "recipes"
 
 
+def _normalise_have_match(value):
+    """Normalise have_match to one of the supported ingredient matching modes."""
+    value = (value or HAVE_MATCH_ALL).strip().lower()
+    return value if value in HAVE_MATCH_MODES else HAVE_MATCH_ALL
+
+
 def _safe_int(value, default=1):
     """Parse a positive int with default fallback."""
     try:
@@ -85,6 +92,7 @@ def parse_dashboard_params(request):
         "mode": mode, "min_prep": min_prep, "max_prep": max_prep,
         "have_ingredients_raw": have_ingredients_raw,
         "have_ingredients_list": have_ingredients_list,
+        "have_match": _normalise_have_match(request.GET.get("have_match")),
         "has_search": _has_search(mode, q, ingredient_q, have_ingredients_list, min_prep, max_prep, category),
         "page_number": _safe_int(request.GET.get("page") or 1, default=1),
         "is_ajax": _is_ajax(request),
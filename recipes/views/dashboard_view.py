@@ -2,7 +2,6 @@
 
 from dataclasses import dataclass
 
-from django.core.paginator import Paginator
 from django.db.models import Q
 from django.http import JsonResponse
 from django.shortcuts import render
@@ -15,8 +14,11 @@ from recipes.views.dashboard_params import (
     _ensure_for_you_seed,
     _safe_offset,
 )
+from recipes.pagination import PeekPaginator
 from recipes.services.feed import FeedService
 from recipes.services.shop import ShopService
+from recipes.services.suggestions import SuggestionService
+from recipes.utils.http import not_modified, set_validators, weak_etag
 FEED_PAGE_LIMIT = 24
 
 
@@ -25,6 +27,7 @@ class DashboardDeps:
     feed_service: object
     privacy_service: object
     shop_service: object
+    suggestion_service: object
 
 
 def _deps():
@@ -35,6 +38,7 @@ def _deps():
         feed_service=local_feed,
         privacy_service=local_privacy,
         shop_service=ShopService(local_privacy),
+        suggestion_service=SuggestionService(local_privacy.social_graph),
     )
 
 
@@ -50,6 +54,7 @@ def _discover_queryset(params, user, deps):
         max_prep=params["max_prep"],
         sort=params["sort"],
         privacy=deps.privacy_service,
+        have_match=params["have_match"],
     )
 
 
@@ -76,10 +81,16 @@ def _following_ajax_response(request):
     """Return the JSON payload for the 'following' infinite scroll."""
     limit = FEED_PAGE_LIMIT
     offset = _safe_offset(request.GET.get("following_offset"))
-    posts = _deps().feed_service.following_posts(request.user, limit=limit, offset=offset)
+    feed_service = _deps().feed_service
+    etag = weak_etag(request.user.pk, offset, limit, *feed_service.following_version(request.user))
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    posts = feed_service.following_posts(request.user, limit=limit, offset=offset)
     html = render_to_string("partials/feed/feed_cards.html", {"posts": posts, "request": request}, request=request)
-    return JsonResponse(
-        {"html": html, "has_more": len(posts) == limit, "count": len(posts)}
+    return set_validators(
+        JsonResponse({"html": html, "has_more": len(posts) == limit, "count": len(posts)}),
+        etag,
     )
 
 
@@ -109,8 +120,7 @@ def _shopping_search(request, params, deps):
 
 def _recipe_search(request, params, discover_qs):
     """Paginate and optionally return AJAX HTML for recipe search results."""
-    paginator = Paginator(discover_qs, 18)
-    page_obj = paginator.get_page(params["page_number"])
+    page_obj = PeekPaginator(discover_qs, 18).get_page(params["page_number"])
 
     if params["is_ajax"]:
         html = render_to_string(
@@ -133,6 +143,13 @@ def _scope_users_results(params):
     return _deps().feed_service.search_users(params["q"], limit=18)
 
 
+def _suggested_users(request, params, deps):
+    """Return people-you-may-know suggestions shown alongside the users scope."""
+    if not params["has_search"] or params["scope"] != "users":
+        return []
+    return deps.suggestion_service.suggested_users(request.user)
+
+
 def _scope_shopping_results(request, params, deps):
     """Return shopping scope results or AJAX payload."""
     return _shopping_search(request, params, deps)
@@ -215,6 +232,7 @@ def _dashboard_context(params, request, data, popular_has_next):
         "has_search": params["has_search"],
         "scope": params["scope"],
         "have_ingredients": params["have_ingredients_raw"],
+        "have_match": params["have_match"],
         **_shopping_context(shopping_items, shopping_has_next, shopping_page),
     }
 
@@ -240,6 +258,7 @@ def _build_dashboard(request, params, deps, for_you_seed):
         ),
         popular_has_next,
     )
+    context["suggested_users"] = _suggested_users(request, params, deps)
     return None, context
 
 
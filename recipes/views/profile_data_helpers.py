@@ -2,12 +2,12 @@
 
 from recipes.services.profile_data import (
     _collection_card,
-    _collection_meta,
-    _cover_candidate,
-    _first_image_post,
+    _cover_posts,
+    _cover_url,
     _post_image_url,
-    _update_last_saved,
-    _visible_posts,
+    collection_cards,
+    collection_covers,
     collections_for_user,
+    collections_queryset,
     profile_data_for_user,
 )
@@ -28,6 +28,8 @@ def _deps():
         user_repo=profile_deps_factory.user_repo,
         profile_data_for_user=_profile_data_for_user,
         collections_for_user=_collections_for_user,
+        collection_cards=profile_deps_factory.collection_cards,
+        collection_covers=profile_deps_factory.collection_covers,
         follow_read_service=profile_deps_factory.follow_read_service,
         follower_model=profile_deps_factory.follower_model,
         close_friend_model=profile_deps_factory.close_friend_model,
@@ -35,6 +37,7 @@ def _deps():
         favourite_model=Favourite,
         favourite_item_model=FavouriteItem,
         recipe_post_model=profile_deps_factory.recipe_post_model,
+        profile_cache=profile_deps_factory.profile_cache,
     )
 
 
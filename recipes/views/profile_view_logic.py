@@ -7,6 +7,7 @@ from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
 
 FOLLOW_LIST_PAGE_SIZE = 13
+FOLLOW_LIST_MAX_PAGE_SIZE = 100
 
 
 @dataclass(frozen=True)
@@ -20,6 +21,8 @@ class ProfileDeps:
     user_repo: object
     profile_data_for_user: object
     collections_for_user: object
+    collection_cards: object
+    collection_covers: object
     follow_read_service: object
     follower_model: object
     close_friend_model: object
@@ -27,16 +30,15 @@ class ProfileDeps:
     favourite_model: object
     favourite_item_model: object
     recipe_post_model: object
+    profile_cache: object
 
 
-def follow_page_data(qs, user_attr, page_number=1, page_size=FOLLOW_LIST_PAGE_SIZE):
-    total = qs.count()
-    start = max(0, (page_number - 1) * page_size)
-    end = start + page_size
-    users = [getattr(relation, user_attr) for relation in qs[start:end]]
-    has_more = total > end
-    next_page = page_number + 1 if has_more else None
-    return {"count": total, "users": users, "has_more": has_more, "next_page": next_page, "visible": True}
+def follow_page_data(follow_read_service, profile_user, list_type, cursor=None, page_size=FOLLOW_LIST_PAGE_SIZE, total=None):
+    rows = follow_read_service.follow_rows(profile_user, list_type, after=cursor, limit=page_size + 1)
+    users = rows[:page_size]
+    has_more = len(rows) > page_size
+    next_cursor = users[-1].cursor if has_more else None
+    return {"count": total, "users": users, "has_more": has_more, "next_cursor": next_cursor, "visible": True}
 
 
 def can_view_follow_lists(profile_user, viewer, is_following):
@@ -46,7 +48,7 @@ def can_view_follow_lists(profile_user, viewer, is_following):
 def apply_follow_visibility(profile_user, viewer, is_following, followers, following):
     if can_view_follow_lists(profile_user, viewer, is_following):
         return followers, following
-    hidden = {"users": [], "has_more": False, "next_page": None, "visible": False}
+    hidden = {"users": [], "has_more": False, "next_cursor": None, "visible": False}
     return {**followers, **hidden}, {**following, **hidden}
 
 
@@ -60,14 +62,14 @@ def follow_summary(followers, following, close_friend_ids, close_friends, is_fol
         "close_friend_ids": close_friend_ids,
         "close_friends": close_friends,
         "followers_has_more": followers["has_more"],
-        "followers_next_page": followers["next_page"],
+        "followers_next_cursor": followers["next_cursor"],
         "following_has_more": following["has_more"],
-        "following_next_page": following["next_page"],
+        "following_next_cursor": following["next_cursor"],
         "is_following": is_following,
         "pending_request": pending_request,
         "can_view_follow_lists": visible,
         "close_friends_has_more": followers["has_more"] if visible else False,
-        "close_friends_next_page": followers["next_page"] if visible else None,
+        "close_friends_next_cursor": followers["next_cursor"] if visible else None,
     }
 
 
@@ -83,16 +85,45 @@ def pending_follow_request(viewer, profile_user, is_following, deps):
     return deps.follow_service_factory(viewer).pending_request(profile_user)
 
 
+def follow_page_entries(follow_read_service, profile_user, list_type, page_size=FOLLOW_LIST_PAGE_SIZE, total=None):
+    entries = follow_read_service.follow_entries(profile_user, list_type, limit=page_size + 1)
+    has_more = len(entries) > page_size
+    entries = entries[:page_size]
+    next_cursor = entries[-1][1] if has_more else None
+    return {"count": total, "entries": entries, "has_more": has_more, "next_cursor": next_cursor, "visible": True}
+
+
+def follow_lists_block(profile_user, deps):
+    """Return the viewer-independent first follow pages and close-friend ids, cached per profile version.
+
+    Only user ids are cached; names and avatars are read per request so a
+    listed user's profile edits show without bumping every profile they appear on.
+    """
+    def build():
+        return {
+            "followers": follow_page_entries(
+                deps.follow_read_service, profile_user, "followers", total=profile_user.followers_count
+            ),
+            "following": follow_page_entries(
+                deps.follow_read_service, profile_user, "following", total=profile_user.following_count
+            ),
+            "close_friend_ids": deps.follow_read_service.close_friend_ids(profile_user),
+        }
+    block = deps.profile_cache.get_or_build(profile_user, "follow_lists", build)
+    rows = {row.cursor: row for row in deps.follow_read_service.rows_for_entries(
+        block["followers"]["entries"] + block["following"]["entries"]
+    )}
+    hydrated = {"close_friend_ids": block["close_friend_ids"]}
+    for list_type in ("followers", "following"):
+        page = dict(block[list_type])
+        page["users"] = [rows[cursor] for _, cursor in page.pop("entries") if cursor in rows]
+        hydrated[list_type] = page
+    return hydrated
+
+
 def follow_context(profile_user, viewer, deps):
-    followers = follow_page_data(
-        deps.follow_read_service.followers_qs(profile_user),
-        "follower",
-    )
-    following = follow_page_data(
-        deps.follow_read_service.following_qs(profile_user),
-        "author",
-    )
-    close_friend_ids = deps.follow_read_service.close_friend_ids(profile_user)
+    block = follow_lists_block(profile_user, deps)
+    followers, following, close_friend_ids = block["followers"], block["following"], block["close_friend_ids"]
     close_friends = [u for u in followers["users"] if u.id in close_friend_ids]
     is_following = is_following_profile(viewer, profile_user, deps)
     pending_request = pending_follow_request(viewer, profile_user, is_following, deps)
@@ -111,34 +142,33 @@ def profile_user_from_request(request, deps):
 
 
 def follow_list_selection(list_type, profile_user, is_own_profile, deps):
-    if list_type == "followers":
-        qs = deps.follow_read_service.followers_qs(profile_user)
-        return qs, "follower", "partials/profile/follow_list_items.html"
-    if list_type == "following":
-        qs = deps.follow_read_service.following_qs(profile_user)
-        return qs, "author", "partials/profile/follow_list_items.html"
+    if list_type in ("followers", "following"):
+        return "partials/profile/follow_list_items.html"
     if list_type == "close_friends":
         if not is_own_profile:
             return JsonResponse({"error": "Not allowed"}, status=403)
-        qs = deps.follow_read_service.followers_qs(profile_user)
-        return qs, "follower", "partials/profile/close_friend_items.html"
+        return "partials/profile/close_friend_items.html"
     return JsonResponse({"error": "Unknown list"}, status=400)
 
 
+def follow_list_total(list_type, profile_user):
+    """Return the stored counter backing a follow list."""
+    if list_type == "following":
+        return profile_user.following_count
+    return profile_user.followers_count
+
+
 def follow_list_pagination(request):
-    try:
-        page_number = int(request.GET.get("page") or 1)
-    except (TypeError, ValueError):
-        page_number = 1
+    cursor = request.GET.get("cursor") or None
     try:
         page_size = int(request.GET.get("page_size") or FOLLOW_LIST_PAGE_SIZE)
     except (TypeError, ValueError):
         page_size = FOLLOW_LIST_PAGE_SIZE
-    return max(1, page_number), max(1, min(page_size, 100000))
+    return cursor, max(1, min(page_size, FOLLOW_LIST_MAX_PAGE_SIZE))
 
 
 def profile_stats(profile_user, follow_ctx, deps):
-    data = deps.profile_data_for_user(profile_user)
+    data = dict(deps.profile_cache.get_or_build(profile_user, "header", lambda: deps.profile_data_for_user(profile_user)))
     data["followers"] = follow_ctx["followers_count"]
     data["following"] = follow_ctx["following_count"]
     data["close_friends_count"] = len(follow_ctx["close_friend_ids"])
@@ -163,10 +193,10 @@ def profile_posts(profile_user, viewer, deps):
 def profile_posts_page(profile_user, viewer, page_number, deps, page_size=12):
     posts_qs, can_view_profile = profile_posts(profile_user, viewer, deps)
     start = (page_number - 1) * page_size
-    end = start + page_size
-    posts_page = deps.post_repo.slice_queryset(posts_qs, offset=start, limit=page_size) if can_view_profile else []
-    posts_has_more = posts_qs.count() > end if can_view_profile else False
-    return list(posts_page), posts_has_more, can_view_profile
+    if not can_view_profile:
+        return [], False, can_view_profile
+    page = deps.post_repo.page(posts_qs, offset=start, limit=page_size)
+    return page.items, page.has_more, can_view_profile
 
 
 def posts_for_profile(request, profile_user, deps):
@@ -243,11 +273,11 @@ def follow_view_block(follow_ctx):
         "close_friends": follow_ctx["close_friends"],
         "can_view_follow_lists": follow_ctx["can_view_follow_lists"],
         "followers_has_more": follow_ctx["followers_has_more"],
-        "followers_next_page": follow_ctx["followers_next_page"],
+        "followers_next_cursor": follow_ctx["followers_next_cursor"],
         "following_has_more": follow_ctx["following_has_more"],
-        "following_next_page": follow_ctx["following_next_page"],
+        "following_next_cursor": follow_ctx["following_next_cursor"],
         "close_friends_has_more": follow_ctx["close_friends_has_more"],
-        "close_friends_next_page": follow_ctx["close_friends_next_page"],
+        "close_friends_next_cursor": follow_ctx["close_friends_next_cursor"],
         "pending_follow_request": follow_ctx["pending_request"],
         "close_friend_ids": follow_ctx["close_friend_ids"],
     }
@@ -303,6 +333,12 @@ def profile_render_data_from_ctx(profile_user, is_own_profile, follow_ctx, profi
     )
 
 
+def profile_collections(profile_user, deps):
+    """Return collection cards from the profile cache, resolving cover images per request."""
+    cards = deps.profile_cache.get_or_build(profile_user, "collections", lambda: deps.collection_cards(profile_user))
+    return deps.collection_covers(cards)
+
+
 def full_profile_context(request, data, deps):
     return {
         **profile_context(
@@ -315,7 +351,7 @@ def full_profile_context(request, data, deps):
             data["edit_profile_form"],
             data["password_form"],
             data["posts_page"],
-            deps.collections_for_user(data["profile_user"]),
+            profile_collections(data["profile_user"], deps),
             data["can_view_profile"],
             data["show_edit_profile_modal"],
         ),
@@ -332,24 +368,33 @@ def profile_follow_list_response(request, deps):
     profile_user = profile_user_from_request(request, deps)
     is_own_profile = profile_user == request.user
     list_type = request.GET.get("list")
-    follow_ctx = follow_context(profile_user, request.user, deps)
-    if not follow_ctx["can_view_follow_lists"]:
+    is_following = is_following_profile(request.user, profile_user, deps)
+    if not can_view_follow_lists(profile_user, request.user, is_following):
         return JsonResponse({"error": "Not allowed"}, status=403)
-    selection = follow_list_selection(list_type, profile_user, is_own_profile, deps)
-    if isinstance(selection, JsonResponse):
-        return selection
-    qs, user_attr, template = selection
-    page_number, page_size = follow_list_pagination(request)
-    page_data = follow_page_data(qs, user_attr, page_number=page_number, page_size=page_size)
+    template = follow_list_selection(list_type, profile_user, is_own_profile, deps)
+    if isinstance(template, JsonResponse):
+        return template
+    cursor, page_size = follow_list_pagination(request)
+    page_data = follow_page_data(
+        deps.follow_read_service,
+        profile_user,
+        list_type,
+        cursor=cursor,
+        page_size=page_size,
+        total=follow_list_total(list_type, profile_user),
+    )
     users = page_data["users"]
-    has_more = page_data["has_more"]
-    next_page = page_data["next_page"]
+    close_friend_ids = (
+        deps.follow_read_service.close_friend_ids_among(profile_user, [u.id for u in users]) if is_own_profile else set()
+    )
     html = render_to_string(
         template,
-        {"users": users, "list_type": list_type, "is_own_profile": is_own_profile, "close_friend_ids": follow_ctx["close_friend_ids"]},
+        {"users": users, "list_type": list_type, "is_own_profile": is_own_profile, "close_friend_ids": close_friend_ids},
         request=request,
     )
-    return JsonResponse({"html": html, "has_more": has_more, "next_page": next_page, "total": page_data["count"]})
+    return JsonResponse(
+        {"html": html, "has_more": page_data["has_more"], "next_cursor": page_data["next_cursor"], "total": page_data["count"]}
+    )
 
 
 def profile_response(request, deps):
@@ -6,7 +6,9 @@ from django.urls import reverse
 from django.utils import timezone
 
 from recipes.forms.comment_form import CommentForm
+from recipes.models.recipe_post import display_url
 from recipes.services.recipe_posts import RecipeContentService, RecipeEngagementService
+from recipes.services.similarity import SimilarityService
 
 
 def _content_service():
@@ -17,6 +19,10 @@ def _engagement_service():
     return RecipeEngagementService()
 
 
+def _similarity_service():
+    return SimilarityService()
+
+
 def is_hx(request):
     """Return True when the request was made via HTMX/XMLHttpRequest."""
     return request.headers.get("HX-Request") or request.headers.get("x-requested-with") == "XMLHttpRequest"
@@ -30,12 +36,7 @@ def set_primary_image(recipe):
 def _primary_image_url(recipe):
     """Return best primary image URL (first gallery image fallback to legacy)."""
     first = recipe.images.first()
-    if not first:
-        return recipe.image or None
-    try:
-        return first.image.url
-    except ValueError:
-        return recipe.image or None
+    return (first and display_url(first)) or recipe.image or None
 
 
 def _gallery_images(images_qs):
@@ -49,10 +50,7 @@ def _gallery_images(images_qs):
 
 
 def _safe_image_url(image_obj):
-    try:
-        return image_obj.image.url
-    except ValueError:
-        return None
+    return display_url(image_obj)
 
 
 def collection_thumb(cover_post, fallback_post):
@@ -74,21 +72,11 @@ def collections_modal_state(user, recipe):
     """Build modal-friendly collection metadata for a user and target recipe."""
     return _engagement_service().collections_modal_state(user, recipe)
 
-def _favourites_for(user):
-    """Return all Favourite collections for a user with prefetched items and cover posts."""
-    return _engagement_service()._favourites_for(user)
 
-def _collection_entry(fav, recipe):
-    """Build a dictionary entry representing a collection's state relative to a recipe."""
-    return _engagement_service()._collection_entry(fav, recipe)
+def collections_modal_page(user, recipe, query="", page=1):
+    """Return (rows, has_more) for one page of the save modal's collection search."""
+    return _engagement_service().collections_modal_page(user, recipe, query=query, page=page)
 
-def _first_item_post(items):
-    """Return the first recipe post found in a list of FavouriteItems, or None."""
-    return _engagement_service()._first_item_post(items)
-
-def _last_saved_at(items, default):
-    """Find the most recent added_at timestamp from items, or return default."""
-    return _engagement_service()._last_saved_at(items, default)
 
 def user_reactions(request_user, recipe):
     """Return flags and counts for likes/saves and following for the current user."""
@@ -136,18 +124,32 @@ def recipe_steps(recipe):
     return _content_service().recipe_steps(recipe)
 
 
+def view_similar(recipe, request_user, limit=6):
+    """Return precomputed similar recipe cards visible to the viewer."""
+    return _similarity_service().view_similar_items(recipe, request_user, limit=limit)
+
+
+def similar_version(recipe, request_user, limit=6):
+    """Return a cheap fingerprint of the cards view_similar would build."""
+    return _similarity_service().similar_version(recipe, request_user, limit=limit)
+
+
 def build_recipe_context(recipe, request_user, comments):
     """Assemble the context dict for recipe_detail."""
-    return _merge_recipe_context(
+    save_collections, save_collections_has_more = collections_modal_page(request_user, recipe)
+    context = _merge_recipe_context(
         recipe,
         comments,
-        collections_modal_state(request_user, recipe),
+        save_collections,
         user_reactions(request_user, recipe),
         recipe_media(recipe),
         recipe_metadata(recipe),
         ingredient_lists(recipe),
         recipe_steps(recipe),
     )
+    context["save_collections_has_more"] = save_collections_has_more
+    context["view_similar"] = view_similar(recipe, request_user)
+    return context
 
 def _merge_recipe_context(recipe, comments, collections_for_modal, reactions, media, meta, ingredients_data, steps):
     """Merge all recipe detail components into a single context dictionary."""
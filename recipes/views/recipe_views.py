@@ -3,11 +3,13 @@
 import json
 from dataclasses import dataclass
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponse, Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
 from recipes.forms.recipe_forms import RecipePostForm
 from recipes.forms.comment_form import CommentForm
@@ -17,6 +19,7 @@ from recipes.services.recipe_posts import (
     RecipeEngagementService,
 )
 from recipes.services.comments import CommentService
+from recipes.utils.http import not_modified, set_validators, weak_etag
 
 from recipes.views.recipe_view_helpers import (
     build_recipe_context,
@@ -25,6 +28,7 @@ from recipes.views.recipe_view_helpers import (
     primary_image_url,
     gallery_images,
     collections_modal_state,
+    similar_version,
 )
 
 # Backwards-compatible exports for tests expecting old helper names
@@ -107,9 +111,16 @@ def recipe_detail(request, post_id):
     if not deps.privacy_service.can_view_post(request.user, recipe):
         raise Http404("Post not available.")
 
+    # Pages carrying flash messages must render, and must not be revalidated later once the messages are gone.
+    etag = None if len(messages.get_messages(request)) else _recipe_detail_etag(request, recipe, deps)
+    cached = etag and not_modified(request, etag)
+    if cached:
+        return cached
+
     comments_page, has_more_comments, page_number = _comments_page(recipe, request)
     if request.headers.get("HX-Request") and request.GET.get("comments_only") == "1":
-        return render(request, "partials/post/comment_items.html", {"comments": comments_page, "request": request})
+        response = render(request, "partials/post/comment_items.html", {"comments": comments_page, "request": request})
+        return set_validators(response, etag) if etag else response
 
     context = build_recipe_context(recipe, request.user, comments_page)
     context.update(
@@ -120,7 +131,27 @@ def recipe_detail(request, post_id):
     )
     # Ensure source_link is absolute for sharing
     context["source_link"] = request.build_absolute_uri(context["source_link"])
-    return render(request, "post/post_detail.html", context)
+    response = render(request, "post/post_detail.html", context)
+    return set_validators(response, etag) if etag else response
+
+def _recipe_detail_etag(request, recipe, deps):
+    """ETag for recipe_detail from the recipe row, its counters and the viewer's state, before any rendering.
+
+    The author's and commenters' profile stamps cover names and avatars, and the
+    visible similar-recipe neighbours cover the "view similar" cards. The CSRF
+    cookie is included because the page embeds a token derived from it.
+    """
+    return weak_etag(
+        recipe.pk,
+        recipe.updated_at,
+        recipe.saved_count,
+        recipe.author.username,
+        recipe.author.updated_at,
+        request.user.pk,
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME, ""),
+        *deps.engagement_service.detail_version(recipe, request.user),
+        *similar_version(recipe, request.user),
+    )
 
 def _render_create_form(request, form):
     """Render the create recipe form with cache-busting headers."""
@@ -141,10 +172,13 @@ def _comments_page(recipe, request, page_size=50):
 
 @login_required
 def saved_recipes(request):
-    """List all unique recipes saved by the current user."""
+    """List the current user's saved recipes a page at a time; XHR requests get the next page as JSON."""
     deps = _deps()
-    posts = deps.engagement_service.saved_posts_for_user(request.user)
-    return render(request, "app/saved_recipes.html", {"posts": posts})
+    posts, next_cursor = deps.engagement_service.saved_posts_page(request.user, after=request.GET.get("cursor"))
+    if is_hx(request):
+        html = render_to_string("partials/recipes/recipe_grid_items.html", {"posts": posts}, request=request)
+        return JsonResponse({"html": html, "has_more": bool(next_cursor), "next_cursor": next_cursor})
+    return render(request, "app/saved_recipes.html", {"posts": posts, "saved_next_cursor": next_cursor})
 
 @login_required
 def delete_my_recipe(request, post_id):
@@ -184,6 +218,31 @@ def toggle_favourite(request, post_id):
 
     return redirect(request.META.get("HTTP_REFERER") or reverse("recipe_detail", args=[recipe.id]))
 
+@login_required
+def save_collections(request, post_id):
+    """Return one page of the save modal's collections for a recipe as JSON, filtered by `q`."""
+    deps = _deps()
+    recipe = deps.content_service.fetch_post(post_id)
+    try:
+        page = max(1, int(request.GET.get("page") or 1))
+    except (TypeError, ValueError):
+        page = 1
+    rows, has_more = deps.engagement_service.collections_modal_page(
+        request.user,
+        recipe,
+        query=request.GET.get("q") or "",
+        page=page,
+    )
+    return JsonResponse(
+        {
+            "collections": [
+                {key: row[key] for key in ("id", "name", "saved", "count", "thumb_url")} for row in rows
+            ],
+            "has_more": has_more,
+            "next_page": page + 1 if has_more else None,
+        }
+    )
+
 @login_required
 def toggle_like(request, post_id):
     """Toggle like/unlike for a recipe and return HX or redirect."""
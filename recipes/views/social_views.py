@@ -1,3 +1,5 @@
+import json
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
@@ -12,6 +14,9 @@ from recipes.views.view_utils import is_ajax_request
 User = get_user_model()
 user_service = UserService()
 
+# Most usernames accepted by one bulk follow-management request.
+BULK_TARGET_LIMIT = 200
+
 
 def _redirect_back(request):
     return redirect(request.META.get("HTTP_REFERER") or reverse("profile"))
@@ -82,3 +87,58 @@ def remove_close_friend(request, username):
     if is_ajax_request(request):
         return JsonResponse({"status": "removed", "friend": friend.username})
     return _redirect_back(request)
+
+
+def _bulk_usernames(request):
+    """Read usernames from a JSON body ({"usernames": [...]}) or repeated form fields."""
+    if request.content_type == "application/json":
+        try:
+            payload = json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+        usernames = payload.get("usernames") if isinstance(payload, dict) else None
+        if not isinstance(usernames, list):
+            return None
+    else:
+        usernames = request.POST.getlist("usernames")
+    return list(dict.fromkeys(str(name).strip() for name in usernames if str(name).strip()))
+
+
+def _bulk_response(request, action):
+    """Resolve usernames in one query, run a bulk FollowService action and report per-username statuses."""
+    usernames = _bulk_usernames(request)
+    if usernames is None:
+        return JsonResponse({"error": "Expected a list of usernames"}, status=400)
+    if len(usernames) > BULK_TARGET_LIMIT:
+        return JsonResponse({"error": f"At most {BULK_TARGET_LIMIT} usernames per request"}, status=400)
+    targets = {user.username: user for user in user_service.fetch_many_by_username(usernames)}
+    statuses = action(FollowService(request.user), list(targets.values()))
+    return JsonResponse(
+        {
+            "results": {
+                username: statuses.get(targets[username].pk, "noop") if username in targets else "not_found"
+                for username in usernames
+            }
+        }
+    )
+
+
+@login_required
+@require_POST
+def bulk_follow(request):
+    """Follow (or request to follow) many users in one request."""
+    return _bulk_response(request, lambda service, targets: service.follow_many(targets))
+
+
+@login_required
+@require_POST
+def bulk_add_close_friends(request):
+    """Add many existing followers to the current user's close friends."""
+    return _bulk_response(request, lambda service, targets: service.add_close_friends(targets))
+
+
+@login_required
+@require_POST
+def bulk_remove_followers(request):
+    """Remove many followers from the current user."""
+    return _bulk_response(request, lambda service, targets: service.remove_followers(targets))
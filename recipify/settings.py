@@ -86,6 +86,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'recipes.middleware.SocialGraphMiddleware',
     'allauth.account.middleware.AccountMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -155,6 +156,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'recipes.User'
 
+# Seconds to keep follow/close-friend id sets in the shared cache; unset keeps them per request only.
+SOCIAL_GRAPH_CACHE_TIMEOUT = int(os.getenv("SOCIAL_GRAPH_CACHE_TIMEOUT") or 0) or None
+
+# Seconds to keep viewer-independent profile blocks (stats, first follow pages, collections); unset disables it.
+PROFILE_CACHE_TIMEOUT = int(os.getenv("PROFILE_CACHE_TIMEOUT") or 0) or None
+
+# Seconds to keep approximate totals for count-free search pages; unset counts on every request that asks.
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.getenv("PAGINATION_COUNT_CACHE_TIMEOUT") or 0) or None
+
+# Seconds a recipe change must age before delta sync hands it out, so ids from still-open transactions are not skipped.
+RECIPE_SYNC_COMMIT_LAG = int(os.getenv("RECIPE_SYNC_COMMIT_LAG") or 5)
+
 LOGIN_URL = 'log_in'
 
 REDIRECT_URL_WHEN_LOGGED_IN = 'dashboard'
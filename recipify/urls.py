@@ -38,17 +38,29 @@ from recipes.views.recipe_views import (
     saved_recipes,
     toggle_favourite,
     toggle_like,
+    save_collections,
     delete_my_recipe,
     toggle_follow,
 )
 from recipes.views.follow_request_views import accept_follow_request, reject_follow_request
 from recipes.views.collection_views import collections_overview, collection_detail, update_collection, delete_collection
-from recipes.views.social_views import remove_follower, remove_following, add_close_friend, remove_close_friend
+from recipes.views.social_views import (
+    remove_follower,
+    remove_following,
+    add_close_friend,
+    remove_close_friend,
+    bulk_follow,
+    bulk_add_close_friends,
+    bulk_remove_followers,
+)
 from recipes.views.api_views import (
     RecipeListApi,
+    RecipeBatchApi,
     RecipeDetailApi,
     profile_api,
+    recipe_sync_api,
     mark_notifications_read,
+    user_search_api,
 )
 from recipes.views.report_view import report_content
 from recipes.views.shop_view import shop
@@ -76,6 +88,7 @@ urlpatterns = [
     path('recipes/<uuid:post_id>/', recipe_detail, name='recipe_detail'),
     path("recipes/<uuid:post_id>/edit/", recipe_edit, name="recipe_edit"),
     path('recipes/<uuid:post_id>/favourite/', toggle_favourite, name='toggle_favourite'),
+    path('recipes/<uuid:post_id>/collections/', save_collections, name='save_collections'),
     path('recipes/<uuid:post_id>/like/', toggle_like, name='toggle_like'),
     path('my-recipes/<uuid:post_id>/delete/', delete_my_recipe, name='delete_my_recipe'),
     path('saved/', saved_recipes, name='saved_recipes'),
@@ -86,14 +99,20 @@ urlpatterns = [
     path('following/<str:username>/remove/', remove_following, name='remove_following'),
     path('close-friends/<str:username>/add/', add_close_friend, name='add_close_friend'),
     path('close-friends/<str:username>/remove/', remove_close_friend, name='remove_close_friend'),
+    path('api/follows/bulk/', bulk_follow, name='bulk_follow'),
+    path('api/close-friends/bulk/', bulk_add_close_friends, name='bulk_add_close_friends'),
+    path('api/followers/bulk-remove/', bulk_remove_followers, name='bulk_remove_followers'),
     path('follow-requests/<uuid:request_id>/accept/', accept_follow_request, name='accept_follow_request'),
     path('follow-requests/<uuid:request_id>/reject/', reject_follow_request, name='reject_follow_request'),
     path('report/<str:content_type>/<uuid:object_id>/', report_content, name='report_content'),
     path('shop/', shop, name='shop'),
     path('api/notifications/read/', mark_notifications_read, name='mark_notifications_read'),
+    path('api/users/search/', user_search_api, name='user_search_api'),
     path('recipes/<uuid:post_id>/comment/', add_comment, name='add_comment'),
     path('comments/<uuid:comment_id>/delete/', delete_comment, name='delete_comment'),
     path('api/recipes/', RecipeListApi.as_view(), name='recipe_list_api'),
+    path('api/sync/', recipe_sync_api, name='recipe_sync_api'),
+    path('api/recipes/batch/', RecipeBatchApi.as_view(), name='recipe_batch_api'),
     path('api/recipes/<uuid:pk>/', RecipeDetailApi.as_view(), name='recipe_detail_api'),
 ]
 
@@ -129,15 +129,15 @@ function buildFollowListFetcher(w, endpoint) {
   const mapPayload = (payload) => ({
     html: (payload && payload.html) || "",
     hasMore: Boolean(payload && payload.has_more),
-    nextPage: payload ? payload.next_page : null,
+    nextPage: (payload && payload.next_cursor) || null,
     total: payload && payload.total,
   });
   const failPayload = { html: "", hasMore: false, nextPage: null, total: null };
 
   return ({ page, pageSize }) => {
-    if (!page && page !== 0) return Promise.resolve(failPayload);
+    if (!page) return Promise.resolve(failPayload);
     const url = new URL(endpoint, origin);
-    url.searchParams.set("page", String(page));
+    url.searchParams.set("cursor", String(page));
     if (pageSize) url.searchParams.set("page_size", String(pageSize));
     const init = { headers: { "X-Requested-With": "XMLHttpRequest" }, credentials: "same-origin" };
     return w
@@ -168,7 +168,7 @@ function buildFollowConfig(modalBody, sentinel, fetchPage, append) {
     fetchPage,
     append,
     hasMore: parseHasMore(modalBody.getAttribute("data-has-more")),
-    nextPage: parseNextPage(modalBody.getAttribute("data-next-page")),
+    nextPage: modalBody.getAttribute("data-next-cursor") || null,
   };
 }
 
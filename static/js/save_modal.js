@@ -1,5 +1,6 @@
 {
 const VIEWS = { list: "list", create: "create" };
+const SEARCH_DEBOUNCE_MS = 200;
 const hasModuleExports = typeof module !== "undefined" && module.exports;
 const globalWindow = typeof window !== "undefined" && window.document ? window : null;
 
@@ -72,6 +73,11 @@ const buildSaveState = (w, doc) => {
     toggleButtons: Array.from(modal.querySelectorAll("[data-save-toggle]")),
     csrfToken: modal.dataset.csrf || (csrfInput ? csrfInput.value : ""),
     saveEndpoint: modal.dataset.saveEndpoint || "",
+    collectionsEndpoint: modal.dataset.collectionsEndpoint || "",
+    loadMoreBtn: modal.querySelector("[data-save-load-more]"),
+    hasMore: modal.dataset.collectionsHasMore === "1",
+    nextPage: 2,
+    searchTimer: null,
     fallback: createFallbackModalDisplay(w, doc),
     noResultsRow: null
   };
@@ -121,10 +127,62 @@ const filterSaveList = (state) => {
   if (noResults) noResults.classList.toggle("d-none", visible !== 0);
 };
 
+const setHasMore = (state, hasMore) => {
+  state.hasMore = !!hasMore;
+  if (state.loadMoreBtn) state.loadMoreBtn.classList.toggle("d-none", !state.hasMore);
+};
+
+const fetchCollectionsPage = (state, query, page) => {
+  const params = new URLSearchParams({ q: query, page: String(page) }).toString();
+  return state.w
+    .fetch(`${state.collectionsEndpoint}?${params}`, {
+      headers: { "X-Requested-With": "XMLHttpRequest" }
+    })
+    .then((resp) => (resp && resp.ok ? resp.json().catch(() => null) : null));
+};
+
+const renderCollectionsPage = (state, data, replace) => {
+  if (!data || !Array.isArray(data.collections) || !state.list) return;
+  if (replace) getSaveRows(state).forEach((row) => row.remove());
+  data.collections.forEach((collection) => {
+    if (state.list.querySelector(`[data-collection-id="${collection.id}"]`)) return;
+    buildNewRow(state, collection, !!collection.saved);
+  });
+  setHasMore(state, data.has_more);
+  state.nextPage = data.next_page || state.nextPage;
+  filterSaveList(state);
+};
+
+const currentQuery = (state) => (state.searchInput ? state.searchInput.value.trim() : "");
+
+const loadCollections = (state, replace) => {
+  if (!state.collectionsEndpoint) return null;
+  const page = replace ? 1 : state.nextPage;
+  return fetchCollectionsPage(state, currentQuery(state), page)
+    .then((data) => renderCollectionsPage(state, data, replace))
+    .catch(() => null);
+};
+
+const scheduleServerSearch = (state) => {
+  if (!state.collectionsEndpoint) return;
+  if (state.searchTimer) state.w.clearTimeout(state.searchTimer);
+  state.searchTimer = state.w.setTimeout(() => {
+    state.searchTimer = null;
+    loadCollections(state, true);
+  }, SEARCH_DEBOUNCE_MS);
+};
+
+const handleSearchInput = (state) => {
+  filterSaveList(state);
+  scheduleServerSearch(state);
+};
+
 const resetSearch = (state) => {
   if (!state.searchInput) return;
+  const hadQuery = state.searchInput.value.trim() !== "";
   state.searchInput.value = "";
   filterSaveList(state);
+  if (hadQuery) loadCollections(state, true);
 };
 
 const setSaveView = (state, view) => {
@@ -220,11 +278,11 @@ const makeRowElement = (state, collection) => {
   row.setAttribute("data-collection-id", collection.id);
   row.innerHTML = `
     <div class="save-modal-avatar${collection.thumb_url ? " save-modal-avatar-has-thumb" : ""}" aria-hidden="true">
-      ${collection.thumb_url ? `<img src="${collection.thumb_url}" alt="" class="save-modal-avatar-img">` : (collection.name || "").charAt(0).toUpperCase()}
+      ${collection.thumb_url ? `<img src="${collection.thumb_url}" alt="" class="save-modal-avatar-img" loading="lazy">` : (collection.name || "").charAt(0).toUpperCase()}
     </div>
     <div>
       <p class="mb-0 fw-semibold"></p>
-      <p class="mb-0 text-muted small">Private</p>
+      <p class="mb-0 text-muted small">${typeof collection.count === "number" ? `${collection.count} recipes · ` : ""}Private</p>
     </div>
     <button
       type="button"
@@ -351,7 +409,13 @@ const initSaveModal = (win) => {
   state.modal.dataset.saveModalInitialized = "1";
   prepareSearchState(state);
   if (state.searchInput) {
-    state.searchInput.addEventListener("input", () => filterSaveList(state));
+    state.searchInput.addEventListener("input", () => handleSearchInput(state));
+  }
+  if (state.loadMoreBtn) {
+    state.loadMoreBtn.addEventListener("click", (event) => {
+      event.preventDefault();
+      loadCollections(state, false);
+    });
   }
   wireViewButtons(state);
   wireModalTriggers(state);
@@ -0,0 +1,64 @@
+{
+const hasModuleExports = typeof module !== "undefined" && module.exports;
+const globalWindow = typeof window !== "undefined" ? window : null;
+
+const resolveWindow = (win) => win || globalWindow;
+
+const appendCards = (doc, grid) => (html) => {
+  if (!html) return;
+  const temp = doc.createElement("div");
+  temp.innerHTML = html;
+  Array.from(temp.querySelectorAll(".my-recipe-card")).forEach((card) => grid.appendChild(card));
+};
+
+const mapSavedResponse = (json) => ({
+  html: (json && json.html) || "",
+  hasMore: Boolean(json && json.has_more),
+  nextPage: (json && json.next_cursor) || null
+});
+
+const initSavedInfinite = (win) => {
+  const w = resolveWindow(win);
+  if (!w || !w.document) return null;
+  const doc = w.document;
+  const grid = doc.getElementById("saved-grid");
+  const sentinel = doc.getElementById("saved-sentinel");
+  const infinite = w.InfiniteList;
+  if (!grid || !sentinel || !infinite || !infinite.create) return null;
+  if (grid.dataset.infiniteInitialized === "1") return null;
+  grid.dataset.infiniteInitialized = "1";
+  const nextCursor = grid.getAttribute("data-next-cursor") || null;
+  return infinite.create({
+    sentinel,
+    hasMore: Boolean(nextCursor),
+    nextPage: nextCursor,
+    fetchPage: infinite.buildJsonFetcher({
+      endpoint: grid.getAttribute("data-endpoint") || w.location.pathname,
+      pageParam: "cursor",
+      fetchInit: { headers: { "X-Requested-With": "XMLHttpRequest" } },
+      mapResponse: mapSavedResponse
+    }),
+    append: appendCards(doc, grid),
+    fallbackScroll: true,
+    fallbackMode: "document"
+  });
+};
+
+const autoInit = () => {
+  const w = resolveWindow();
+  if (!w || !w.document) return;
+  const runInit = () => initSavedInfinite(w);
+  if (w.document.readyState === "loading") {
+    w.document.addEventListener("DOMContentLoaded", runInit, { once: true });
+  } else {
+    runInit();
+  }
+};
+
+if (hasModuleExports) {
+  module.exports = { initSavedInfinite, mapSavedResponse };
+}
+
+/* istanbul ignore next */
+autoInit();
+}
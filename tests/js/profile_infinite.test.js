@@ -28,10 +28,10 @@ function setupPostsInfinite({ fetchHtml = "<div class='my-recipe-card'></div>",
   return window.InfiniteList.create.mock.calls[0][0];
 }
 
-function buildFollowModal({ id, listType, endpoint, nextPage = "2", hasMore = "true" }) {
+function buildFollowModal({ id, listType, endpoint, nextCursor = "c2", hasMore = "true" }) {
   document.body.innerHTML = `
       <div id="${id}" class="modal">
-        <div class="modal-body" data-list-type="${listType}" data-endpoint="${endpoint}" data-has-more="${hasMore}" data-next-page="${nextPage}">
+        <div class="modal-body" data-list-type="${listType}" data-endpoint="${endpoint}" data-has-more="${hasMore}" data-next-cursor="${nextCursor}">
           <ul class="follow-list-items"><li id="existing"></li></ul>
           <div class="follow-list-sentinel"></div>
         </div>
@@ -56,7 +56,7 @@ const followersResponse = () => ({
     Promise.resolve({
       html: `<li data-id="a"></li><li data-id="b"></li>`,
       has_more: true,
-      next_page: 3,
+      next_cursor: "c3",
       total: 3,
     }),
 });
@@ -127,8 +127,8 @@ function testCreatesFollowListInfiniteLoader() {
       response: followersResponse(),
       modalSuccessHandlers,
     });
-    const payload = await options.fetchPage({ page: 2 });
-    expect(global.fetch).toHaveBeenCalledWith("http://localhost/followers?page=2", {
+    const payload = await options.fetchPage({ page: "c2" });
+    expect(global.fetch).toHaveBeenCalledWith("http://localhost/followers?cursor=c2", {
       headers: { "X-Requested-With": "XMLHttpRequest" },
       credentials: "same-origin",
     });
@@ -152,7 +152,7 @@ function testFollowFetcherHandlesFailures() {
       response: { ok: false },
       attachAjaxModalForms,
     });
-    const payload = await options.fetchPage({ page: 5 });
+    const payload = await options.fetchPage({ page: "c5" });
     expect(payload).toEqual({ html: "", hasMore: false, nextPage: null, total: null });
     expect(attachAjaxModalForms).not.toHaveBeenCalled();
   });
@@ -165,7 +165,7 @@ function testIgnoresFollowLoadersWhenEndpointMissing() {
     global.fetch = jest.fn();
     document.body.innerHTML = `
       <div id="closeFriendsModal" class="modal">
-        <div class="modal-body" data-list-type="close_friends" data-endpoint="" data-has-more="false" data-next-page="">
+        <div class="modal-body" data-list-type="close_friends" data-endpoint="" data-has-more="false" data-next-cursor="">
           <ul class="follow-list-items"><li id="keep"></li></ul>
           <div class="follow-list-sentinel"></div>
         </div>
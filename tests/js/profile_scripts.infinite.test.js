@@ -42,7 +42,7 @@ function setupCloseFriends({ response }) {
   document.body.innerHTML = `
       <input id="closeFriendsSearch" value="bob" />
       <div id="closeFriendsModal" class="modal">
-        <div class="modal-body" data-list-type="close_friends" data-endpoint="/friends" data-has-more="true" data-next-page="3">
+        <div class="modal-body" data-list-type="close_friends" data-endpoint="/friends" data-has-more="true" data-next-cursor="c3">
           <ul id="closeFriendsList" class="follow-list-items">
             <li class="close-friend-item" data-name="bob"></li>
           </ul>
@@ -127,13 +127,13 @@ function testFollowListLoaderAppendsCloseFriends() {
         Promise.resolve({
           html: `<li class="close-friend-item" data-name="alice"><form action="/friends/add/1/"></form></li>`,
           has_more: false,
-          next_page: null,
+          next_cursor: null,
           total: 2,
         }),
     };
     const { options } = setupCloseFriends({ response });
-    const payload = await options.fetchPage({ page: 3 });
-    expect(global.fetch).toHaveBeenCalledWith("http://localhost/friends?page=3", {
+    const payload = await options.fetchPage({ page: "c3" });
+    expect(global.fetch).toHaveBeenCalledWith("http://localhost/friends?cursor=c3", {
       headers: { "X-Requested-With": "XMLHttpRequest" },
       credentials: "same-origin",
     });
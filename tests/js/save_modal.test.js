@@ -56,6 +56,8 @@ describe("save_modal", () => {
 function registerSearchAndListing() {
   describe("search and listing", () => {
     testFiltersListBySearch();
+    testServerSearchReplacesRows();
+    testLoadMoreAppendsNextPage();
     testHandleToggleReturnsEarly();
   });
 }
@@ -115,6 +117,68 @@ function testFiltersListBySearch() {
   });
 }
 
+function buildPagedModalDom() {
+  buildModalDom();
+  const modal = qs("#saveModal");
+  modal.setAttribute("data-collections-endpoint", "/collections");
+  modal.setAttribute("data-collections-has-more", "1");
+  modal.insertAdjacentHTML("beforeend", '<button data-save-load-more></button>');
+}
+
+function testServerSearchReplacesRows() {
+  test("search queries the collections endpoint and replaces rows", async () => {
+    jest.useFakeTimers();
+    setupModal({
+      domBuilder: buildPagedModalDom,
+      fetchResult: {
+        ok: true,
+        json: () => Promise.resolve({
+          collections: [{ id: "9", name: "Gamma", saved: true, count: 3, thumb_url: "" }],
+          has_more: false,
+          next_page: null,
+        }),
+      },
+    });
+    const input = qs(".save-modal-search input");
+    input.value = "gam";
+    input.dispatchEvent(new Event("input"));
+    jest.advanceTimersByTime(250);
+    jest.useRealTimers();
+    await waitTick();
+    await waitTick();
+
+    expect(global.fetch).toHaveBeenCalledWith("/collections?q=gam&page=1", expect.any(Object));
+    const rows = document.querySelectorAll(".save-modal-row");
+    expect(rows).toHaveLength(1);
+    expect(rows[0].getAttribute("data-collection-id")).toBe("9");
+    expect(rows[0].querySelector("i").classList.contains("bi-bookmark-fill")).toBe(true);
+    expect(qs("[data-save-load-more]").classList.contains("d-none")).toBe(true);
+  });
+}
+
+function testLoadMoreAppendsNextPage() {
+  test("load more appends the next page", async () => {
+    setupModal({
+      domBuilder: buildPagedModalDom,
+      fetchResult: {
+        ok: true,
+        json: () => Promise.resolve({
+          collections: [{ id: "3", name: "Delta", saved: false, count: 0, thumb_url: "" }],
+          has_more: true,
+          next_page: 3,
+        }),
+      },
+    });
+    qs("[data-save-load-more]").click();
+    await waitTick();
+    await waitTick();
+
+    expect(global.fetch).toHaveBeenCalledWith("/collections?q=&page=2", expect.any(Object));
+    expect(document.querySelectorAll(".save-modal-row")).toHaveLength(3);
+    expect(qs("[data-save-load-more]").classList.contains("d-none")).toBe(false);
+  });
+}
+
 function testHandleToggleReturnsEarly() {
   test("handleToggle returns when missing collection id or icon", () => {
     setupModal({
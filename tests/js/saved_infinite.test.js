@@ -0,0 +1,57 @@
+const { attachGlobal } = require("../../static/js/infinite_list");
+const { initSavedInfinite, mapSavedResponse } = require("../../static/js/saved_infinite");
+
+const flush = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+const buildGrid = (cursor) => {
+  document.body.innerHTML = `
+    <div id="saved-grid" data-endpoint="/saved/" data-next-cursor="${cursor}">
+      <article class="my-recipe-card" id="card1"></article>
+    </div>
+    <div id="saved-sentinel"></div>
+  `;
+};
+
+let originalFetch;
+
+beforeEach(() => {
+  attachGlobal(window);
+  originalFetch = window.fetch;
+  window.fetch = jest.fn(() =>
+    Promise.resolve({
+      ok: true,
+      json: () => Promise.resolve({ html: '<article class="my-recipe-card" id="card2"></article>', has_more: false, next_cursor: null })
+    })
+  );
+  global.fetch = window.fetch;
+});
+
+afterEach(() => {
+  window.fetch = originalFetch;
+  global.fetch = originalFetch;
+  jest.clearAllMocks();
+});
+
+test("maps next_cursor onto the infinite list's next page", () => {
+  expect(mapSavedResponse({ html: "x", has_more: true, next_cursor: "c2" })).toEqual({ html: "x", hasMore: true, nextPage: "c2" });
+  expect(mapSavedResponse(null)).toEqual({ html: "", hasMore: false, nextPage: null });
+});
+
+test("requests the next page by cursor and appends cards", async () => {
+  buildGrid("2026-01-01T00:00:00+00:00|abc");
+  const list = initSavedInfinite(window);
+
+  list.trigger();
+  await flush();
+  await flush();
+
+  const url = new URL(window.fetch.mock.calls[0][0]);
+  expect(url.pathname).toBe("/saved/");
+  expect(url.searchParams.get("cursor")).toBe("2026-01-01T00:00:00+00:00|abc");
+  expect(document.querySelectorAll("#saved-grid .my-recipe-card")).toHaveLength(2);
+});
+
+test("does nothing without a next cursor", () => {
+  buildGrid("");
+  expect(initSavedInfinite(window)).toBeNull();
+});